@@ -0,0 +1,22 @@
+"""
+Hedge pair P&L kernel shared by TradingBot and the hedge tests
+"""
+
+import numpy as np
+
+from _njit import njit
+
+
+@njit(cache=True)
+def eval_hedge(prices, long_entry, long_amt, short_entry, short_amt):
+    """Long P&L, short P&L and combined ROI of a hedge pair at each price"""
+    long_pnl = (prices - long_entry) * long_amt
+    short_pnl = (short_entry - prices) * short_amt
+    total = long_pnl + short_pnl
+    
+    invested = long_entry * long_amt + short_entry * short_amt
+    if invested > 0:
+        roi = total / invested
+    else:
+        roi = np.zeros_like(total)
+    return long_pnl, short_pnl, roi
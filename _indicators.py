@@ -0,0 +1,96 @@
+"""
+Indicator kernels used by TradingStrategy.populate_indicators
+
+Each kernel takes a float32 or float64 close array and returns an array of
+the same dtype and length, NaN-padded like the TA-Lib functions they
+replace. Running sums are kept in float64 whatever the array dtype.
+"""
+
+import numpy as np
+
+from _njit import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def sma(x, n):
+    """Simple moving average over n bars (running sum, same output as ta.SMA)"""
+    out = np.empty_like(x)
+    s = 0.0
+    for i in range(x.size):
+        s += x[i]
+        if i >= n:
+            s -= x[i - n]
+        out[i] = s / n if i >= n - 1 else np.nan
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def ema(x, n):
+    """Exponential moving average over n bars, seeded with the first SMA like ta.EMA"""
+    out = np.full_like(x, np.nan)
+    if x.size < n:
+        return out
+    
+    alpha = 2.0 / (n + 1)
+    e = 0.0
+    for i in range(n):
+        e += x[i]
+    e /= n
+    out[n - 1] = e
+    for i in range(n, x.size):
+        e += alpha * (x[i] - e)
+        out[i] = e
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def ewo(close, fast, slow):
+    """Elliott Wave Oscillator: (SMA(fast) - SMA(slow)) / close * 100 in one pass"""
+    out = np.empty_like(close)
+    sf = 0.0
+    ss = 0.0
+    for i in range(close.size):
+        c = close[i]
+        sf += c
+        ss += c
+        if i >= fast:
+            sf -= close[i - fast]
+        if i >= slow:
+            ss -= close[i - slow]
+        if i >= fast - 1 and i >= slow - 1:
+            out[i] = (sf / fast - ss / slow) / c * 100.0
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def rsi(close, period=14):
+    """Relative Strength Index with Wilder smoothing, matching ta.RSI"""
+    out = np.full_like(close, np.nan)
+    if close.size <= period:
+        return out
+    
+    # Seed the averages with the first `period` price changes
+    sg = 0.0
+    sl = 0.0
+    for i in range(1, period + 1):
+        diff = close[i] - close[i - 1]
+        if diff > 0:
+            sg += diff
+        else:
+            sl -= diff
+    ag = sg / period
+    al = sl / period
+    total = ag + al
+    out[period] = 100.0 * ag / total if total > 0 else 0.0
+    
+    for i in range(period + 1, close.size):
+        diff = close[i] - close[i - 1]
+        g = diff if diff > 0 else 0.0
+        l = -diff if diff < 0 else 0.0
+        ag = (ag * (period - 1) + g) / period
+        al = (al * (period - 1) + l) / period
+        total = ag + al
+        out[i] = 100.0 * ag / total if total > 0 else 0.0
+    return out
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the _indicators kernels
+
+Run `python _indicators_aot.py` (setup.sh does) to compile the kernels into
+an _indicators_native extension next to this file. trading_bot imports it
+when present, so fresh interpreters skip numba JIT compilation entirely;
+without it the JIT kernels from _indicators are used.
+"""
+
+import os
+import sys
+
+import _indicators
+
+# Exported kernel name -> numba signature
+SIGNATURES = {
+    'sma': 'f4[:](f4[:], i8)',
+    'ema': 'f4[:](f4[:], i8)',
+    'ewo': 'f4[:](f4[:], i8, i8)',
+    'rsi': 'f4[:](f4[:], i8)',
+}
+
+
+def build():
+    """Compile the kernels into the _indicators_native extension module"""
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        print("numba.pycc is not available; the indicators stay JIT-compiled")
+        return False
+
+    cc = CC('_indicators_native')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    for name, signature in SIGNATURES.items():
+        cc.export(name, signature)(getattr(_indicators, name).py_func)
+    cc.compile()
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if build() else 1)
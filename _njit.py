@@ -0,0 +1,21 @@
+"""
+Optional numba JIT decorator
+
+Falls back to a no-op decorator when numba is not installed, so the
+kernels still run (as plain NumPy) everywhere.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,36 @@
+"""
+ROI table kernels used by TradingBot's per-tick ROI exit check
+"""
+
+import numpy as np
+
+from _njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def roi_threshold(minutes, keys, vals):
+    """Threshold of the last ROI breakpoint at or before `minutes` (the first one for negative times)"""
+    # ROI tables are a handful of keys: counting them branch-free beats a binary search
+    idx = -1
+    for i in range(keys.size):
+        idx += keys[i] <= minutes
+    return vals[max(idx, 0)]
+
+
+@njit(cache=True, fastmath=True)
+def roi_thresholds(minutes, keys, vals):
+    """roi_threshold for an array of trade ages"""
+    out = np.empty(minutes.size, dtype=vals.dtype)
+    for i in range(minutes.size):
+        out[i] = roi_threshold(minutes[i], keys, vals)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def evaluate_exit(entry_price, current_price, minutes, is_short, keys, vals):
+    """Profit, ROI threshold and exit decision for a trade open for `minutes`"""
+    profit_pct = (current_price - entry_price) / entry_price
+    if is_short:
+        profit_pct = -profit_pct
+    threshold = roi_threshold(minutes, keys, vals)
+    return profit_pct, threshold, profit_pct >= threshold
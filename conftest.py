@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the test scripts
+
+The builders behind them live in tests_helpers, which test scripts import
+directly (conftest itself is not meant to be imported).
+"""
+
+import pytest
+
+# Imported first so its NUMBA_CACHE_DIR setup runs before any test module imports trading_bot
+from tests_helpers import build_test_bot, make_exchange, make_ohlc
+
+
+@pytest.fixture(scope="session")
+def ohlc_fixture():
+    """Mock OHLC data generated once for the whole session"""
+    return make_ohlc()
+
+
+@pytest.fixture(scope="session")
+def exchange():
+    """One exchange client (connection pool + markets) shared by the whole session"""
+    ex = make_exchange()
+    yield ex
+
+    close = getattr(ex, 'close', None)
+    if callable(close):
+        close()
+
+
+@pytest.fixture(scope="session")
+def bot(exchange):
+    """One TradingBot on the shared exchange client"""
+    return build_test_bot(exchange)
+
+
+@pytest.fixture(scope="session")
+def btc_analysis(bot):
+    """Fetch and analyze BTC/USDT once per session"""
+    return bot.analyze_symbol('BTC/USDT')
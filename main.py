@@ -8,7 +8,6 @@ import sys
 import os
 import threading
 import time
-import asyncio
 from trading_bot import TradingBot, BotConfig
 from web_interface import app
 import logging
@@ -16,11 +15,11 @@ import logging
 # Import enhanced Telegram bot
 try:
     from telegram_bot_enhanced import (
-        telegram_notifier, 
         send_startup_notification, 
         send_bot_ready_notification,
         send_bot_stopped_notification
     )
+    from telegram_bot import run_coroutine as run_telegram_coroutine, shutdown as shutdown_telegram
     TELEGRAM_ENHANCED_AVAILABLE = True
 except ImportError:
     TELEGRAM_ENHANCED_AVAILABLE = False
@@ -113,10 +112,7 @@ def main():
             }
             
             # Send startup notification synchronously
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(send_startup_notification(trading_config))
-            loop.close()
+            run_telegram_coroutine(send_startup_notification(trading_config))
             logger.info("Telegram startup notification sent")
         except Exception as e:
             logger.error(f"Error sending Telegram startup notification: {e}")
@@ -153,6 +149,8 @@ def main():
         # Cleanup
         if hasattr(bot, 'is_running') and bot.is_running:
             bot.stop()
+        if TELEGRAM_ENHANCED_AVAILABLE:
+            shutdown_telegram()
         logger.info("Application stopped")
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for CCXT market metadata
+
+Binance futures markets are a 1-2 MB download on every load_markets().
+The metadata rarely changes, so it is kept in ~/.cache/hedge and reused
+for MARKETS_CACHE_TTL seconds.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MARKETS_CACHE_DIR = Path.home() / ".cache" / "hedge"
+MARKETS_CACHE_TTL = 3600  # seconds
+
+
+def _cache_path(exchange) -> Path:
+    """Cache file for this exchange id, market type and endpoint (testnet vs live)"""
+    market_type = exchange.options.get('defaultType', 'spot')
+    sandbox = getattr(exchange, 'isSandboxModeEnabled', False) or getattr(exchange, 'sandbox', False)
+    mode = 'sandbox' if sandbox else 'live'
+    # The API URLs change with sandbox mode, so they key the cache even if the flag isn't set
+    api_urls = json.dumps(exchange.urls.get('api'), sort_keys=True, default=str)
+    digest = hashlib.sha1(api_urls.encode()).hexdigest()[:8]
+    return MARKETS_CACHE_DIR / f"{exchange.id}_{market_type}_{mode}_{digest}_markets.json"
+
+
+def load_markets_from_cache(exchange, ttl: float = MARKETS_CACHE_TTL) -> bool:
+    """Populate exchange markets from a fresh cache file; False if there is none"""
+    path = _cache_path(exchange)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return False
+        data = json.loads(path.read_text())
+        exchange.set_markets(data['markets'], data.get('currencies'))
+        return True
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.debug(f"Ignoring unreadable markets cache {path}: {e}")
+        return False
+
+
+def save_markets_to_cache(exchange):
+    """Write the exchange's loaded markets to the cache file"""
+    path = _cache_path(exchange)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'markets': exchange.markets, 'currencies': exchange.currencies}))
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write markets cache {path}: {e}")
+
+
+def load_markets_cached(exchange):
+    """load_markets() for synchronous exchanges, going through the disk cache"""
+    if not load_markets_from_cache(exchange):
+        exchange.load_markets()
+        save_markets_to_cache(exchange)
+    return exchange.markets
@@ -41,6 +41,10 @@ rm -rf ta-lib ta-lib-0.4.0-src.tar.gz
 echo "Installing Python packages..."
 pip install -r requirements.txt
 
+# Compile indicator kernels ahead of time (optional, needs numba)
+echo "Compiling indicator kernels..."
+python _indicators_aot.py || echo "AOT build skipped; indicators will be JIT-compiled"
+
 echo "Setup complete!"
 echo ""
 echo "To run the trading bot:"
@@ -1,12 +1,133 @@
 #!/usr/bin/env python3
 
 import asyncio
-import aiohttp
 import json
 import logging
-from datetime import datetime
+import threading
+import time
+import weakref
 from typing import Optional, Dict, Any
 import config
+from telegram_formatters import (
+    format_trade_entry as _format_trade_entry,
+    format_trade_exit as _format_trade_exit,
+    format_hedge_completion as _format_hedge_completion,
+    format_error_message as _format_error_message,
+    format_bot_status as _format_bot_status,
+    format_daily_summary as _format_daily_summary,
+    _fmt_now,
+)
+
+# orjson is optional; fall back to the stdlib encoder
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Connection pool to api.telegram.org shared by every notifier session
+_connector = None
+_connector_loop = None
+
+async def _get_connector():
+    """Return the shared aiohttp connector for the running event loop"""
+    global _connector, _connector_loop
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    # Connectors are bound to the loop they were created on
+    if _connector is None or _connector.closed or _connector_loop is not loop:
+        stale = _connector
+        _connector = aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=8,
+            keepalive_timeout=90,
+            ttl_dns_cache=600,
+            enable_cleanup_closed=True
+        )
+        _connector_loop = loop
+        if stale is not None and not stale.closed:
+            await _close_stale(stale.close())
+    return _connector
+
+async def _close_stale(closing) -> None:
+    """Finish closing a client left behind by an earlier event loop"""
+    try:
+        if closing is not None:
+            await closing
+    except RuntimeError as e:
+        # Its loop is already closed, so the sockets went with it
+        logging.getLogger(__name__).debug(f"Dropped stale Telegram client: {e}")
+
+# Notifications are sent from synchronous code (the strategy thread, Flask
+# handlers); they all go through one long-lived loop so the pool above is
+# actually reused instead of being rebuilt for a throwaway loop per message
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background Telegram event loop, starting it on first use"""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name='telegram-loop', daemon=True)
+            _loop_thread.start()
+        return _loop
+
+def run_coroutine(coro, timeout: Optional[float] = 60.0):
+    """
+    Run a Telegram coroutine on the background loop
+    
+    Blocks for the result when called from synchronous code; from inside a
+    running event loop the send is scheduled and its future returned instead.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return future.result(timeout)
+    return future
+
+# Every TelegramBot (including the enhanced notifier) so teardown can reach them
+_instances: "weakref.WeakSet[TelegramBot]" = weakref.WeakSet()
+
+async def close_all() -> None:
+    """Close every bot's HTTP clients and the shared aiohttp connector"""
+    global _connector
+    for bot in list(_instances):
+        await _close_stale(bot.close())
+    if _connector is not None and not _connector.closed:
+        await _close_stale(_connector.close())
+    _connector = None
+
+def shutdown(timeout: float = 10.0) -> None:
+    """Close all Telegram HTTP clients and stop the background loop"""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop, _loop_thread = None, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        loop.close()
+
+# Flood control: Telegram answers 429 with parameters.retry_after, and every
+# sender using the token has to wait it out, so the pause is module-wide
+_MAX_SEND_ATTEMPTS = 3
+_pause_until = 0.0
+
+def _retry_after(response_text: str, attempt: int) -> float:
+    """Seconds to wait after a 429, falling back to exponential backoff"""
+    try:
+        return float(json.loads(response_text)['parameters']['retry_after'])
+    except (ValueError, KeyError, TypeError):
+        return float(2 ** attempt)
 
 class TelegramBot:
     """
@@ -27,14 +148,108 @@ class TelegramBot:
         
         self.logger = logging.getLogger(__name__)
         
+        # Request target is fixed for the lifetime of the bot
+        self._url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        self._headers = {'Content-Type': 'application/json'}
+        
+        self._session = None
+        self._session_loop = None
+        self._client = None
+        self._client_loop = None
+        self._http2_unavailable = False
+        _instances.add(self)
+        
         # Validate configuration
         if self.enabled and (not self.bot_token or not self.chat_id):
             self.logger.warning("Telegram bot is enabled but token or chat_id is missing")
             self.enabled = False
+        
+        self._enabled_cached = bool(self.enabled and self.bot_token and self.chat_id)
     
     def is_enabled(self) -> bool:
         """Check if Telegram notifications are enabled and configured"""
-        return self.enabled and self.bot_token and self.chat_id
+        return self._enabled_cached
+    
+    async def _get_session(self):
+        """Return this bot's ClientSession, backed by the shared connector"""
+        import aiohttp
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            stale = self._session
+            self._session = aiohttp.ClientSession(
+                connector=await _get_connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+            self._session_loop = loop
+            if stale is not None and not stale.closed:
+                await _close_stale(stale.close())
+        return self._session
+    
+    async def _get_http2_client(self):
+        """Return an HTTP/2 httpx client, or None when httpx[http2] is not installed"""
+        if self._http2_unavailable:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            stale = self._client
+            try:
+                import httpx
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=15.0,
+                    limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+                )
+            except ImportError:
+                self._http2_unavailable = True
+                self.logger.debug("httpx[http2] not available, using aiohttp for Telegram")
+                return None
+            self._client_loop = loop
+            if stale is not None and not stale.is_closed:
+                await _close_stale(stale.aclose())
+        return self._client
+    
+    async def start(self):
+        """Open the HTTP client up front so the first notification doesn't wait on it"""
+        if await self._get_http2_client() is None:
+            await self._get_session()
+    
+    async def close(self):
+        """Close this bot's HTTP clients (close_all() also closes the shared connector)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _post(self, body: bytes):
+        """
+        POST an encoded sendMessage payload
+        
+        Concurrent sends are multiplexed over one HTTP/2 connection when httpx
+        is installed; otherwise they go through the pooled aiohttp session.
+        
+        Returns:
+            tuple: (HTTP status, response text); the text is empty on success
+        """
+        client = await self._get_http2_client()
+        if client is not None:
+            response = await client.post(self._url, content=body, headers=self._headers)
+            if response.status_code == 200:
+                return 200, ''
+            return response.status_code, response.text
+        
+        session = await self._get_session()
+        async with session.post(self._url, data=body, headers=self._headers) as response:
+            if response.status == 200:
+                # Body is not needed on success; hand the connection back to the pool now
+                await response.release()
+                return 200, ''
+            # The body is only needed for 429 retry_after and the error log
+            if response.status != 429 and not self.logger.isEnabledFor(logging.ERROR):
+                return response.status, ''
+            return response.status, await response.text()
     
     async def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
         """
@@ -47,203 +262,66 @@ class TelegramBot:
         Returns:
             bool: True if message was sent successfully
         """
-        if not self.is_enabled():
+        if not self._enabled_cached:
             return False
         
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-        
-        payload = {
+        body = _json_dumps({
             'chat_id': self.chat_id,
             'text': message,
             'parse_mode': parse_mode,
             'disable_web_page_preview': True
-        }
+        })
         
+        global _pause_until
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        self.logger.debug("Telegram message sent successfully")
-                        return True
-                    else:
-                        response_text = await response.text()
-                        self.logger.error(f"Failed to send Telegram message: {response.status} - {response_text}")
-                        return False
-                        
+            for attempt in range(_MAX_SEND_ATTEMPTS):
+                # Wait out any flood-control pause set by an earlier 429
+                delay = _pause_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                
+                status, response_text = await self._post(body)
+                if status == 200:
+                    self.logger.debug("Telegram message sent successfully")
+                    return True
+                elif status == 429:
+                    retry_after = _retry_after(response_text, attempt)
+                    _pause_until = max(_pause_until, time.monotonic() + retry_after)
+                    self.logger.warning("Telegram rate limit hit, pausing sends for %.1fs", retry_after)
+                else:
+                    self.logger.error("Failed to send Telegram message: %s - %s", status, response_text)
+                    return False
+            
+            self.logger.error("Failed to send Telegram message: still rate limited after %d attempts", _MAX_SEND_ATTEMPTS)
+            return False
+                
         except Exception as e:
-            self.logger.error(f"Error sending Telegram message: {e}")
+            self.logger.error("Error sending Telegram message: %s", e)
             return False
     
     def format_trade_entry(self, trade: Dict[str, Any]) -> str:
         """Format trade entry signal for Telegram"""
-        
-        # Determine if this is a long or hedge entry
-        is_hedge = "hedge" in trade.get('entry_reason', '').lower()
-        signal_type = "🔴 HEDGE ENTRY" if is_hedge else "🟢 LONG ENTRY"
-        
-        message = f"""
-{signal_type} SIGNAL
-
-🎯 <b>Symbol:</b> {trade['symbol']}
-💰 <b>Side:</b> {trade['side'].upper()}
-📊 <b>Amount:</b> {trade['amount']:.6f}
-💵 <b>Entry Price:</b> ${trade['price']:.4f}
-🕐 <b>Time:</b> {datetime.fromtimestamp(trade['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}
-
-📈 <b>Entry Reason:</b>
-{trade.get('entry_reason', 'N/A')}
-
-🔍 <b>Technical Indicators:</b>
-"""
-        
-        # Add technical indicators if available
-        tech_indicators = trade.get('technical_indicators', {})
-        if tech_indicators:
-            if 'rsi' in tech_indicators:
-                message += f"• RSI: {tech_indicators['rsi']:.1f}\n"
-            if 'sma_fast' in tech_indicators:
-                message += f"• SMA Fast: ${tech_indicators['sma_fast']:.4f}\n"
-            if 'sma_slow' in tech_indicators:
-                message += f"• SMA Slow: ${tech_indicators['sma_slow']:.4f}\n"
-            if 'macd_signal' in tech_indicators:
-                message += f"• MACD: {tech_indicators['macd_signal']}\n"
-        else:
-            message += "• No indicators available\n"
-        
-        # Add market conditions
-        market_conditions = trade.get('market_conditions', {})
-        if market_conditions:
-            message += f"\n🌍 <b>Market Conditions:</b>\n"
-            if 'trend' in market_conditions:
-                message += f"• Trend: {market_conditions['trend']}\n"
-            if 'volatility' in market_conditions:
-                message += f"• Volatility: {market_conditions['volatility']}\n"
-            if 'volume_profile' in market_conditions:
-                message += f"• Volume: {market_conditions['volume_profile']}\n"
-        
-        return message.strip()
+        return _format_trade_entry(trade)
     
     def format_trade_exit(self, trade: Dict[str, Any]) -> str:
         """Format trade exit signal for Telegram"""
-        
-        # Determine profit/loss status
-        pnl = trade.get('pnl', 0)
-        pnl_pct = trade.get('pnl_percentage', 0)
-        
-        if pnl > 0:
-            status_emoji = "✅ PROFIT"
-            pnl_emoji = "💰"
-        elif pnl < 0:
-            status_emoji = "❌ LOSS"
-            pnl_emoji = "📉"
-        else:
-            status_emoji = "➖ BREAKEVEN"
-            pnl_emoji = "⚖️"
-        
-        message = f"""
-🚪 TRADE EXIT - {status_emoji}
-
-🎯 <b>Symbol:</b> {trade['symbol']}
-💰 <b>Side:</b> {trade['side'].upper()}
-📊 <b>Amount:</b> {trade['amount']:.6f}
-💵 <b>Entry Price:</b> ${trade['price']:.4f}
-💸 <b>Exit Price:</b> ${trade.get('exit_price', 0):.4f}
-🕐 <b>Exit Time:</b> {datetime.fromtimestamp(trade.get('exit_timestamp', trade['timestamp'])).strftime('%Y-%m-%d %H:%M:%S')}
-
-{pnl_emoji} <b>P&L:</b> ${pnl:.2f} ({pnl_pct:.2f}%)
-
-📝 <b>Exit Reason:</b>
-{trade.get('exit_reason', 'N/A')}
-"""
-        
-        return message.strip()
+        return _format_trade_exit(trade)
     
     def format_hedge_completion(self, long_trade: Dict[str, Any], short_trade: Dict[str, Any], total_pnl: float) -> str:
         """Format hedge pair completion message"""
-        
-        if total_pnl > 0:
-            status_emoji = "✅ SUCCESSFUL HEDGE"
-            pnl_emoji = "🎉"
-        else:
-            status_emoji = "⚠️ HEDGE COMPLETED"
-            pnl_emoji = "📊"
-        
-        message = f"""
-{pnl_emoji} {status_emoji}
-
-🎯 <b>Symbol:</b> {long_trade['symbol']}
-
-📈 <b>Long Position:</b>
-• Entry: ${long_trade['price']:.4f}
-• Exit: ${long_trade.get('exit_price', 0):.4f}
-• P&L: ${long_trade.get('pnl', 0):.2f}
-
-📉 <b>Short Position:</b>
-• Entry: ${short_trade['price']:.4f}
-• Exit: ${short_trade.get('exit_price', 0):.4f}
-• P&L: ${short_trade.get('pnl', 0):.2f}
-
-💰 <b>Total P&L:</b> ${total_pnl:.2f}
-📊 <b>Coverage Ratio:</b> {abs(short_trade.get('pnl', 0) / long_trade.get('pnl', -1)) if long_trade.get('pnl', 0) != 0 else 0:.2f}x
-
-🕐 <b>Completed:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        return message.strip()
+        return _format_hedge_completion(long_trade, short_trade, total_pnl)
     
     def format_error_message(self, error: str, context: str = "") -> str:
         """Format error message for Telegram"""
-        
-        message = f"""
-🚨 <b>TRADING BOT ERROR</b>
-
-❌ <b>Error:</b> {error}
-
-🕐 <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        if context:
-            message += f"\n📍 <b>Context:</b> {context}"
-        
-        return message.strip()
+        return _format_error_message(error, context)
     
     def format_bot_status(self, status: str, balance: float, open_trades: int, total_pnl: float) -> str:
         """Format bot status update message"""
-        
-        status_emoji = "🟢" if status == "running" else "🔴"
-        
-        message = f"""
-{status_emoji} <b>BOT STATUS UPDATE</b>
-
-🤖 <b>Status:</b> {status.upper()}
-💰 <b>Balance:</b> ${balance:.2f}
-📊 <b>Open Trades:</b> {open_trades}
-📈 <b>Total P&L:</b> ${total_pnl:.2f}
-
-🕐 <b>Updated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        return message.strip()
+        return _format_bot_status(status, balance, open_trades, total_pnl)
     
     def format_daily_summary(self, trades_today: int, total_pnl: float, win_rate: float, best_trade: float, worst_trade: float) -> str:
         """Format daily trading summary"""
-        
-        message = f"""
-📊 <b>DAILY TRADING SUMMARY</b>
-
-📅 <b>Date:</b> {datetime.now().strftime('%Y-%m-%d')}
-
-📈 <b>Performance:</b>
-• Trades: {trades_today}
-• Total P&L: ${total_pnl:.2f}
-• Win Rate: {win_rate:.1f}%
-• Best Trade: ${best_trade:.2f}
-• Worst Trade: ${worst_trade:.2f}
-
-🕐 <b>Generated:</b> {datetime.now().strftime('%H:%M:%S')}
-"""
-        
-        return message.strip()
+        return _format_daily_summary(trades_today, total_pnl, win_rate, best_trade, worst_trade)
     
     async def send_trade_entry(self, trade: Dict[str, Any]) -> bool:
         """Send trade entry notification"""
@@ -298,47 +376,59 @@ class TelegramBot:
         if not self.is_enabled():
             return False
         
-        test_message = f"""
-🧪 <b>TELEGRAM BOT TEST</b>
+        test_message = f"""🧪 <b>TELEGRAM BOT TEST</b>
 
 ✅ Connection successful!
 🤖 Bot is properly configured
-🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+🕐 {_fmt_now()}
 
-Ready to send trading notifications! 🚀
-"""
+Ready to send trading notifications! 🚀"""
         
         return await self.send_message(test_message)
 
-# Global telegram bot instance
-telegram_bot = TelegramBot()
+# Global telegram bot instance, created on first use
+_telegram_bot: Optional[TelegramBot] = None
+
+def get_telegram_bot() -> TelegramBot:
+    """Return the shared TelegramBot, creating it on first call"""
+    global _telegram_bot
+    if _telegram_bot is None:
+        _telegram_bot = TelegramBot()
+    return _telegram_bot
+
+def __getattr__(name: str):
+    # Keep `from telegram_bot import telegram_bot` working without eager construction
+    if name == 'telegram_bot':
+        return get_telegram_bot()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions for easy integration
 async def send_trade_entry_notification(trade: Dict[str, Any]) -> bool:
     """Send trade entry notification"""
-    return await telegram_bot.send_trade_entry(trade)
+    return await get_telegram_bot().send_trade_entry(trade)
 
 async def send_trade_exit_notification(trade: Dict[str, Any]) -> bool:
     """Send trade exit notification"""
-    return await telegram_bot.send_trade_exit(trade)
+    return await get_telegram_bot().send_trade_exit(trade)
 
 async def send_hedge_completion_notification(long_trade: Dict[str, Any], short_trade: Dict[str, Any], total_pnl: float) -> bool:
     """Send hedge completion notification"""
-    return await telegram_bot.send_hedge_completion(long_trade, short_trade, total_pnl)
+    return await get_telegram_bot().send_hedge_completion(long_trade, short_trade, total_pnl)
 
 async def send_error_notification(error: str, context: str = "") -> bool:
     """Send error notification"""
-    return await telegram_bot.send_error(error, context)
+    return await get_telegram_bot().send_error(error, context)
 
 async def send_bot_status_notification(status: str, balance: float, open_trades: int, total_pnl: float) -> bool:
     """Send bot status notification"""
-    return await telegram_bot.send_bot_status(status, balance, open_trades, total_pnl)
+    return await get_telegram_bot().send_bot_status(status, balance, open_trades, total_pnl)
 
 if __name__ == "__main__":
     """Test the Telegram bot functionality"""
     
     async def test_telegram_bot():
         print("Testing Telegram Bot...")
+        telegram_bot = get_telegram_bot()
         
         if not telegram_bot.is_enabled():
             print("❌ Telegram bot is not enabled or not configured properly")
@@ -2,92 +2,44 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
 from typing import Optional, Dict, Any
-import config
-from telegram import Bot
-from telegram.error import TelegramError
-from telegram.constants import ParseMode
+from telegram_bot import TelegramBot
+from telegram_formatters import _fmt_ts, _fmt_ts_short
 
-class TelegramBotNotifier:
+_SEVERITY_EMOJI: Dict[str, str] = {
+    "ERROR": "🚨",
+    "WARNING": "⚠️",
+    "INFO": "ℹ️",
+    "CRITICAL": "💥"
+}
+
+class TelegramBotNotifier(TelegramBot):
     """
-    Enhanced Telegram Bot for trading notifications using python-telegram-bot library
+    Enhanced Telegram Bot for trading notifications
     Includes startup messages and bot status monitoring
     """
     
     def __init__(self):
-        self.bot_token = getattr(config, 'TELEGRAM_BOT_TOKEN', '')
-        self.chat_id = getattr(config, 'TELEGRAM_CHAT_ID', '')
-        self.enabled = getattr(config, 'TELEGRAM_ENABLED', False)
-        
-        # Notification preferences
-        self.send_entry_signals = getattr(config, 'TELEGRAM_SEND_ENTRY_SIGNALS', True)
-        self.send_exit_signals = getattr(config, 'TELEGRAM_SEND_EXIT_SIGNALS', True)
-        self.send_profits = getattr(config, 'TELEGRAM_SEND_PROFITS', True)
-        self.send_errors = getattr(config, 'TELEGRAM_SEND_ERRORS', True)
-        self.send_status_updates = getattr(config, 'TELEGRAM_SEND_STATUS_UPDATES', True)
+        super().__init__()
         
         self.logger = logging.getLogger(__name__)
-        self.bot = None
         self.is_bot_running = False
         self.last_message_time = None
-        
-        # Initialize bot if enabled
-        if self.is_enabled():
-            self._initialize_bot()
     
-    def _initialize_bot(self):
-        """Initialize the Telegram bot"""
-        try:
-            self.bot = Bot(token=self.bot_token)
-            self.logger.info("Telegram bot initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize Telegram bot: {e}")
-            self.enabled = False
-    
-    def is_enabled(self) -> bool:
-        """Check if Telegram notifications are enabled and configured"""
-        return self.enabled and self.bot_token and self.chat_id
-    
-    async def send_message(self, message: str, parse_mode: str = ParseMode.HTML) -> bool:
-        """
-        Send a message to Telegram using python-telegram-bot
-        
-        Args:
-            message: Message text to send
-            parse_mode: Telegram parse mode (HTML, Markdown, or None)
-            
-        Returns:
-            bool: True if message was sent successfully
-        """
-        if not self.is_enabled() or not self.bot:
-            return False
-        
-        try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode,
-                disable_web_page_preview=True
-            )
-            self.last_message_time = datetime.now()
-            self.logger.debug("Telegram message sent successfully")
-            return True
-            
-        except TelegramError as e:
-            self.logger.error(f"Telegram error: {e}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error sending Telegram message: {e}")
-            return False
+    async def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
+        """Send a message to Telegram and record when it was delivered"""
+        success = await super().send_message(message, parse_mode)
+        if success:
+            self.last_message_time = time.time()
+        return success
     
     async def send_startup_message(self, trading_config: Dict[str, Any]) -> bool:
         """Send a comprehensive startup message when the trading bot starts"""
         
-        startup_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        startup_time = _fmt_ts(time.time())
         
-        message = f"""
-🚀 <b>TRADING BOT STARTUP</b>
+        message = f"""🚀 <b>TRADING BOT STARTUP</b>
 
 ⏰ <b>Started:</b> {startup_time}
 🤖 <b>Status:</b> INITIALIZING
@@ -113,10 +65,9 @@ class TelegramBotNotifier:
 🌐 <b>Web Interface:</b> http://localhost:5000
 
 <i>Bot initialization in progress...</i>
-I'll notify you when trading starts! 📈
-"""
+I'll notify you when trading starts! 📈"""
         
-        success = await self.send_message(message.strip())
+        success = await self.send_message(message)
         if success:
             self.is_bot_running = True
             self.logger.info("Startup message sent to Telegram")
@@ -125,15 +76,14 @@ I'll notify you when trading starts! 📈
     async def send_bot_ready_message(self, symbols_count: int, symbols_list: list) -> bool:
         """Send message when bot is fully initialized and ready to trade"""
         
-        ready_time = datetime.now().strftime('%H:%M:%S')
+        ready_time = _fmt_ts_short(time.time())
         
         # Show first 10 symbols
         symbols_preview = ', '.join(symbols_list[:10])
         if len(symbols_list) > 10:
             symbols_preview += f' (+{len(symbols_list)-10} more)'
         
-        message = f"""
-✅ <b>TRADING BOT READY</b>
+        message = f"""✅ <b>TRADING BOT READY</b>
 
 🕐 <b>Ready at:</b> {ready_time}
 🎯 <b>Symbols loaded:</b> {symbols_count}
@@ -143,29 +93,28 @@ I'll notify you when trading starts! 📈
 🔍 <b>Strategy:</b> ElliotV5_SMA Hedging
 
 <i>Bot is now actively scanning for trading opportunities...</i>
-📈 <b>Good luck trading!</b> 🚀
-"""
+📈 <b>Good luck trading!</b> 🚀"""
         
-        return await self.send_message(message.strip())
+        return await self.send_message(message)
     
     async def send_bot_stopped_message(self, final_stats: Dict[str, Any]) -> bool:
         """Send message when bot is stopped with final statistics"""
         
-        stop_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        now = time.time()
+        stop_time = _fmt_ts(now)
         
         # Calculate session duration if we have startup time
         session_duration = "Unknown"
         if self.last_message_time:
-            duration = datetime.now() - self.last_message_time
-            hours = duration.seconds // 3600
-            minutes = (duration.seconds % 3600) // 60
+            elapsed = int(now - self.last_message_time)
+            hours = elapsed // 3600
+            minutes = (elapsed % 3600) // 60
             session_duration = f"{hours}h {minutes}m"
         
         total_pnl = final_stats.get('total_pnl', 0)
         pnl_emoji = "📈" if total_pnl > 0 else "📉" if total_pnl < 0 else "⚖️"
         
-        message = f"""
-🛑 <b>TRADING BOT STOPPED</b>
+        message = f"""🛑 <b>TRADING BOT STOPPED</b>
 
 ⏰ <b>Stopped:</b> {stop_time}
 ⏱️ <b>Session Duration:</b> {session_duration}
@@ -180,10 +129,9 @@ I'll notify you when trading starts! 📈
 🔴 <b>Status:</b> OFFLINE
 
 <i>Bot has been safely stopped. All positions logged.</i>
-Thank you for using the hedging strategy! 💼
-"""
+Thank you for using the hedging strategy! 💼"""
         
-        success = await self.send_message(message.strip())
+        success = await self.send_message(message)
         if success:
             self.is_bot_running = False
         return success
@@ -191,100 +139,33 @@ Thank you for using the hedging strategy! 💼
     async def send_health_check(self) -> bool:
         """Send a health check message to verify bot connectivity"""
         
-        message = f"""
-💓 <b>HEALTH CHECK</b>
+        message = f"""💓 <b>HEALTH CHECK</b>
 
 🤖 <b>Bot Status:</b> {'🟢 RUNNING' if self.is_bot_running else '🔴 STOPPED'}
 📡 <b>Connection:</b> ACTIVE
-🕐 <b>Check Time:</b> {datetime.now().strftime('%H:%M:%S')}
+🕐 <b>Check Time:</b> {_fmt_ts_short(time.time())}
 
-✅ <i>Telegram notifications are working correctly!</i>
-"""
+✅ <i>Telegram notifications are working correctly!</i>"""
         
-        return await self.send_message(message.strip())
+        return await self.send_message(message)
     
     async def send_error_with_context(self, error: str, context: str = "", severity: str = "ERROR") -> bool:
         """Send enhanced error message with context and severity"""
         
-        severity_emoji = {
-            "ERROR": "🚨",
-            "WARNING": "⚠️",
-            "INFO": "ℹ️",
-            "CRITICAL": "💥"
-        }.get(severity, "🚨")
+        severity_emoji = _SEVERITY_EMOJI.get(severity, "🚨")
         
-        message = f"""
-{severity_emoji} <b>{severity}</b>
+        parts = [f"""{severity_emoji} <b>{severity}</b>
 
 ❌ <b>Error:</b> {error}
-🕐 <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+🕐 <b>Time:</b> {_fmt_ts(time.time())}"""]
         
         if context:
-            message += f"📍 <b>Context:</b> {context}\n"
+            parts.append(f"\n📍 <b>Context:</b> {context}")
         
         if severity == "CRITICAL":
-            message += "\n🆘 <b>IMMEDIATE ATTENTION REQUIRED!</b>"
-        
-        return await self.send_message(message.strip())
-    
-    # Keep existing formatting methods but use new send_message
-    def format_trade_entry(self, trade: Dict[str, Any]) -> str:
-        """Format trade entry signal for Telegram"""
-        
-        # Determine if this is a long or hedge entry
-        is_hedge = "hedge" in trade.get('entry_reason', '').lower()
-        signal_type = "🔴 HEDGE ENTRY" if is_hedge else "🟢 LONG ENTRY"
-        
-        message = f"""
-{signal_type} SIGNAL
-
-🎯 <b>Symbol:</b> {trade['symbol']}
-💰 <b>Side:</b> {trade['side'].upper()}
-📊 <b>Amount:</b> {trade['amount']:.6f}
-💵 <b>Entry Price:</b> ${trade['price']:.4f}
-🕐 <b>Time:</b> {datetime.fromtimestamp(trade['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}
-
-📈 <b>Entry Reason:</b>
-{trade.get('entry_reason', 'N/A')}
-
-🔍 <b>Technical Indicators:</b>
-"""
-        
-        # Add technical indicators if available
-        tech_indicators = trade.get('technical_indicators', {})
-        if tech_indicators:
-            if 'rsi' in tech_indicators:
-                message += f"• RSI: {tech_indicators['rsi']:.1f}\n"
-            if 'sma_fast' in tech_indicators:
-                message += f"• SMA Fast: ${tech_indicators['sma_fast']:.4f}\n"
-            if 'sma_slow' in tech_indicators:
-                message += f"• SMA Slow: ${tech_indicators['sma_slow']:.4f}\n"
-            if 'macd_signal' in tech_indicators:
-                message += f"• MACD: {tech_indicators['macd_signal']}\n"
-        else:
-            message += "• No indicators available\n"
-        
-        # Add market conditions
-        market_conditions = trade.get('market_conditions', {})
-        if market_conditions:
-            message += f"\n🌍 <b>Market Conditions:</b>\n"
-            if 'trend' in market_conditions:
-                message += f"• Trend: {market_conditions['trend']}\n"
-            if 'volatility' in market_conditions:
-                message += f"• Volatility: {market_conditions['volatility']}\n"
-            if 'volume_profile' in market_conditions:
-                message += f"• Volume: {market_conditions['volume_profile']}\n"
-        
-        return message.strip()
-    
-    async def send_trade_entry(self, trade: Dict[str, Any]) -> bool:
-        """Send trade entry notification"""
-        if not self.send_entry_signals:
-            return False
+            parts.append("\n\n🆘 <b>IMMEDIATE ATTENTION REQUIRED!</b>")
         
-        message = self.format_trade_entry(trade)
-        return await self.send_message(message)
+        return await self.send_message(''.join(parts))
     
     async def test_connection_with_feedback(self) -> bool:
         """Test connection and provide detailed feedback"""
@@ -295,18 +176,16 @@ Thank you for using the hedging strategy! 💼
         
         try:
             # Test with a simple message
-            test_message = f"""
-🧪 <b>CONNECTION TEST</b>
+            test_message = f"""🧪 <b>CONNECTION TEST</b>
 
 ✅ <b>Status:</b> SUCCESS
 🤖 <b>Bot:</b> Connected
 📡 <b>API:</b> Responsive
-🕐 <b>Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+🕐 <b>Time:</b> {_fmt_ts(time.time())}
 
-<i>Telegram integration is working perfectly!</i> 🎉
-"""
+<i>Telegram integration is working perfectly!</i> 🎉"""
             
-            success = await self.send_message(test_message.strip())
+            success = await self.send_message(test_message)
             if success:
                 self.logger.info("✅ Telegram connection test successful")
             else:
@@ -315,32 +194,45 @@ Thank you for using the hedging strategy! 💼
             return success
             
         except Exception as e:
-            self.logger.error(f"Telegram connection test error: {e}")
+            self.logger.error("Telegram connection test error: %s", e)
             return False
 
-# Global instance
-telegram_notifier = TelegramBotNotifier()
+# Global instance, created on first use
+_telegram_notifier: Optional[TelegramBotNotifier] = None
+
+def get_telegram_notifier() -> TelegramBotNotifier:
+    """Return the shared TelegramBotNotifier, creating it on first call"""
+    global _telegram_notifier
+    if _telegram_notifier is None:
+        _telegram_notifier = TelegramBotNotifier()
+    return _telegram_notifier
+
+def __getattr__(name: str):
+    # Keep `from telegram_bot_enhanced import telegram_notifier` working without eager construction
+    if name == 'telegram_notifier':
+        return get_telegram_notifier()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions for easy integration
 async def send_startup_notification(trading_config: Dict[str, Any]) -> bool:
     """Send startup notification"""
-    return await telegram_notifier.send_startup_message(trading_config)
+    return await get_telegram_notifier().send_startup_message(trading_config)
 
 async def send_bot_ready_notification(symbols_count: int, symbols_list: list) -> bool:
     """Send bot ready notification"""
-    return await telegram_notifier.send_bot_ready_message(symbols_count, symbols_list)
+    return await get_telegram_notifier().send_bot_ready_message(symbols_count, symbols_list)
 
 async def send_bot_stopped_notification(final_stats: Dict[str, Any]) -> bool:
     """Send bot stopped notification"""
-    return await telegram_notifier.send_bot_stopped_message(final_stats)
+    return await get_telegram_notifier().send_bot_stopped_message(final_stats)
 
 async def send_health_check_notification() -> bool:
     """Send health check notification"""
-    return await telegram_notifier.send_health_check()
+    return await get_telegram_notifier().send_health_check()
 
 async def send_error_notification_enhanced(error: str, context: str = "", severity: str = "ERROR") -> bool:
     """Send enhanced error notification"""
-    return await telegram_notifier.send_error_with_context(error, context, severity)
+    return await get_telegram_notifier().send_error_with_context(error, context, severity)
 
 if __name__ == "__main__":
     """Test the enhanced Telegram bot functionality"""
@@ -348,6 +240,7 @@ if __name__ == "__main__":
     async def test_enhanced_telegram_bot():
         print("🧪 Testing Enhanced Telegram Bot...")
         print("=" * 50)
+        telegram_notifier = get_telegram_notifier()
         
         if not telegram_notifier.is_enabled():
             print("❌ Telegram bot is not enabled or configured")
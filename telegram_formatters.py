@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Message builders for Telegram trading notifications
+Shared by TelegramBot and TelegramBotNotifier
+"""
+
+import time
+from typing import Dict, Any
+
+# (key, line template) pairs rendered into trade entry messages
+_TECH_FIELDS = (
+    ('rsi', "\n• RSI: {:.1f}"),
+    ('sma_fast', "\n• SMA Fast: ${:.4f}"),
+    ('sma_slow', "\n• SMA Slow: ${:.4f}"),
+    ('macd_signal', "\n• MACD: {}"),
+)
+_MARKET_FIELDS = (
+    ('trend', "\n• Trend: {}"),
+    ('volatility', "\n• Volatility: {}"),
+    ('volume_profile', "\n• Volume: {}"),
+)
+
+# Exit outcome -> (status label, P&L emoji)
+_PNL_STATUS = {
+    'profit': ("✅ PROFIT", "💰"),
+    'loss': ("❌ LOSS", "📉"),
+    'breakeven': ("➖ BREAKEVEN", "⚖️"),
+}
+
+# Formatted timestamps keyed by whole epoch second
+_TS_CACHE: Dict[int, str] = {}
+_NOW_CACHE = (0, '')
+
+def _fmt_ts(ts: float) -> str:
+    """Format an epoch timestamp as 'YYYY-MM-DD HH:MM:SS' in local time"""
+    ts = int(ts)
+    s = _TS_CACHE.get(ts)
+    if s is None:
+        lt = time.localtime(ts)
+        s = f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} {lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        if len(_TS_CACHE) > 4096:
+            _TS_CACHE.clear()
+        _TS_CACHE[ts] = s
+    return s
+
+def _fmt_ts_short(ts: float) -> str:
+    """Format an epoch timestamp as 'HH:MM:SS' in local time"""
+    return _fmt_ts(ts)[11:]
+
+def _fmt_now() -> str:
+    """Format the current local time, reusing the string within the same second"""
+    global _NOW_CACHE
+    now = int(time.time())
+    if _NOW_CACHE[0] != now:
+        _NOW_CACHE = (now, _fmt_ts(now))
+    return _NOW_CACHE[1]
+
+def format_trade_entry(trade: Dict[str, Any]) -> str:
+    """Format trade entry signal for Telegram"""
+    
+    # Determine if this is a long or hedge entry
+    is_hedge = "hedge" in trade.get('entry_reason', '').lower()
+    signal_type = "🔴 HEDGE ENTRY" if is_hedge else "🟢 LONG ENTRY"
+    
+    header = f"""{signal_type} SIGNAL
+
+🎯 <b>Symbol:</b> {trade['symbol']}
+💰 <b>Side:</b> {trade['side'].upper()}
+📊 <b>Amount:</b> {trade['amount']:.6f}
+💵 <b>Entry Price:</b> ${trade['price']:.4f}
+🕐 <b>Time:</b> {_fmt_ts(trade['timestamp'])}
+
+📈 <b>Entry Reason:</b>
+{trade.get('entry_reason', 'N/A')}
+
+🔍 <b>Technical Indicators:</b>"""
+    parts = [header]
+    
+    # Add technical indicators if available
+    tech_indicators = trade.get('technical_indicators', {})
+    if tech_indicators:
+        for key, line in _TECH_FIELDS:
+            value = tech_indicators.get(key)
+            if value is not None:
+                parts.append(line.format(value))
+    else:
+        parts.append("\n• No indicators available")
+    
+    # Add market conditions
+    market_conditions = trade.get('market_conditions', {})
+    if market_conditions:
+        parts.append("\n\n🌍 <b>Market Conditions:</b>")
+        for key, line in _MARKET_FIELDS:
+            value = market_conditions.get(key)
+            if value is not None:
+                parts.append(line.format(value))
+    
+    return ''.join(parts)
+
+def format_trade_exit(trade: Dict[str, Any]) -> str:
+    """Format trade exit signal for Telegram"""
+    
+    # Determine profit/loss status
+    pnl = trade.get('pnl', 0)
+    pnl_pct = trade.get('pnl_percentage', 0)
+    
+    outcome = 'profit' if pnl > 0 else 'loss' if pnl < 0 else 'breakeven'
+    status_emoji, pnl_emoji = _PNL_STATUS[outcome]
+    
+    message = f"""🚪 TRADE EXIT - {status_emoji}
+
+🎯 <b>Symbol:</b> {trade['symbol']}
+💰 <b>Side:</b> {trade['side'].upper()}
+📊 <b>Amount:</b> {trade['amount']:.6f}
+💵 <b>Entry Price:</b> ${trade['price']:.4f}
+💸 <b>Exit Price:</b> ${trade.get('exit_price', 0):.4f}
+🕐 <b>Exit Time:</b> {_fmt_ts(trade.get('exit_timestamp', trade['timestamp']))}
+
+{pnl_emoji} <b>P&L:</b> ${pnl:.2f} ({pnl_pct:.2f}%)
+
+📝 <b>Exit Reason:</b>
+{trade.get('exit_reason', 'N/A')}"""
+    
+    return message
+
+def format_hedge_completion(long_trade: Dict[str, Any], short_trade: Dict[str, Any], total_pnl: float) -> str:
+    """Format hedge pair completion message"""
+    
+    if total_pnl > 0:
+        status_emoji = "✅ SUCCESSFUL HEDGE"
+        pnl_emoji = "🎉"
+    else:
+        status_emoji = "⚠️ HEDGE COMPLETED"
+        pnl_emoji = "📊"
+    
+    message = f"""{pnl_emoji} {status_emoji}
+
+🎯 <b>Symbol:</b> {long_trade['symbol']}
+
+📈 <b>Long Position:</b>
+• Entry: ${long_trade['price']:.4f}
+• Exit: ${long_trade.get('exit_price', 0):.4f}
+• P&L: ${long_trade.get('pnl', 0):.2f}
+
+📉 <b>Short Position:</b>
+• Entry: ${short_trade['price']:.4f}
+• Exit: ${short_trade.get('exit_price', 0):.4f}
+• P&L: ${short_trade.get('pnl', 0):.2f}
+
+💰 <b>Total P&L:</b> ${total_pnl:.2f}
+📊 <b>Coverage Ratio:</b> {abs(short_trade.get('pnl', 0) / long_trade.get('pnl', -1)) if long_trade.get('pnl', 0) != 0 else 0:.2f}x
+
+🕐 <b>Completed:</b> {_fmt_now()}"""
+    
+    return message
+
+def format_error_message(error: str, context: str = "") -> str:
+    """Format error message for Telegram"""
+    
+    parts = [f"""🚨 <b>TRADING BOT ERROR</b>
+
+❌ <b>Error:</b> {error}
+
+🕐 <b>Time:</b> {_fmt_now()}"""]
+    
+    if context:
+        parts.append(f"\n\n📍 <b>Context:</b> {context}")
+    
+    return ''.join(parts)
+
+def format_bot_status(status: str, balance: float, open_trades: int, total_pnl: float) -> str:
+    """Format bot status update message"""
+    
+    status_emoji = "🟢" if status == "running" else "🔴"
+    
+    message = f"""{status_emoji} <b>BOT STATUS UPDATE</b>
+
+🤖 <b>Status:</b> {status.upper()}
+💰 <b>Balance:</b> ${balance:.2f}
+📊 <b>Open Trades:</b> {open_trades}
+📈 <b>Total P&L:</b> ${total_pnl:.2f}
+
+🕐 <b>Updated:</b> {_fmt_now()}"""
+    
+    return message
+
+def format_daily_summary(trades_today: int, total_pnl: float, win_rate: float, best_trade: float, worst_trade: float) -> str:
+    """Format daily trading summary"""
+    
+    message = f"""📊 <b>DAILY TRADING SUMMARY</b>
+
+📅 <b>Date:</b> {_fmt_now()[:10]}
+
+📈 <b>Performance:</b>
+• Trades: {trades_today}
+• Total P&L: ${total_pnl:.2f}
+• Win Rate: {win_rate:.1f}%
+• Best Trade: ${best_trade:.2f}
+• Worst Trade: ${worst_trade:.2f}
+
+🕐 <b>Generated:</b> {_fmt_now()[11:]}"""
+    
+    return message
@@ -4,42 +4,17 @@ Test script to verify the corrected trading bot logic
 """
 
 import json
-from trading_bot import TradingBot, BotConfig
-import config
+import sys
+import numpy as np
 
-def test_trading_bot_fixes():
+def test_trading_bot_fixes(bot):
     """Test the fixed trading bot logic"""
     print("=" * 60)
     print("🔧 TESTING TRADING BOT FIXES")
     print("=" * 60)
     
     try:
-        # Create bot config from file
-        bot_config = BotConfig(
-            initial_balance=config.INITIAL_BALANCE,
-            max_trades=config.MAX_TRADES,
-            leverage=config.LEVERAGE,
-            timeframe=config.TIMEFRAME,
-            symbols=config.TRADING_SYMBOLS[:5],  # Use first 5 symbols for testing
-            
-            # Hedging parameters
-            initial_trade_size=config.INITIAL_TRADE_SIZE,
-            long_position_size=config.LONG_POSITION_SIZE,
-            short_position_size=config.SHORT_POSITION_SIZE,
-            hedge_trigger_loss=config.HEDGE_TRIGGER_LOSS,
-            one_trade_per_pair=config.ONE_TRADE_PER_PAIR,
-            exit_when_hedged=config.EXIT_WHEN_HEDGED,
-            min_hedge_profit_ratio=config.MIN_HEDGE_PROFIT_RATIO,
-            
-            # ROI and trailing stop
-            minimal_roi=config.MINIMAL_ROI,
-            trailing_stop=config.TRAILING_STOP,
-            trailing_stop_positive=config.TRAILING_STOP_POSITIVE,
-            trailing_stop_positive_offset=config.TRAILING_STOP_POSITIVE_OFFSET,
-            
-            # Telegram
-            telegram_enabled=False  # Disable for testing
-        )
+        bot_config = bot.config
         
         print("✅ Bot configuration loaded successfully")
         print(f"   • Max trades: {bot_config.max_trades}")
@@ -56,11 +31,6 @@ def test_trading_bot_fixes():
         print(f"   • 30 min: {bot_config.minimal_roi['30']:.1%}")
         print(f"   • 120 min: {bot_config.minimal_roi['120']:.1%}")
         
-        # Create bot instance (this will connect to exchange)
-        print(f"\n🔗 Connecting to exchange...")
-        bot = TradingBot(bot_config)
-        print("✅ Bot created successfully")
-        
         # Test trade limit logic
         print(f"\n🧮 Testing Trade Limit Logic:")
         active_trades = [t for t in bot.trades if t.status == 'open']
@@ -71,24 +41,35 @@ def test_trading_bot_fixes():
         print(f"   • Can create new trade: {len(active_trades) < 2}")
         print(f"   • Can create new pair: {len(active_pairs) < 1}")
         
-        # Test ROI threshold calculation
-        print(f"\n📈 Testing ROI Threshold Calculation:")
-        test_times = [0, 1, 5, 10, 30, 60, 120, 180]
-        for minutes in test_times:
-            threshold = bot._get_roi_threshold(minutes)
-            print(f"   • {minutes:3d} min: {threshold:.1%}")
-        
-        print(f"\n✅ All tests completed successfully!")
-        return True
-        
     except Exception as e:
         print(f"❌ Error during testing: {e}")
         import traceback
         traceback.print_exc()
         return False
+    
+    # Test ROI threshold calculation (outside the try so a mismatch fails the test)
+    print(f"\n📈 Testing ROI Threshold Calculation:")
+    test_times = np.array([0, 1, 5, 10, 30, 60, 120, 180])
+    thresholds = bot._get_roi_thresholds(test_times)
+    
+    # Expected: threshold of the last ROI key at or before each time
+    roi = {int(k): v for k, v in bot.config.minimal_roi.items()}
+    expected = [roi[max(k for k in roi if k <= m)] for m in test_times]
+    assert np.allclose(thresholds, expected)
+    assert [bot._get_roi_threshold(m) for m in test_times] == expected
+    
+    lines = [f"   • {m:3d} min: {t:.1%}" for m, t in zip(test_times, thresholds)]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    print(f"\n✅ All tests completed successfully!")
+    return True
 
 if __name__ == "__main__":
-    success = test_trading_bot_fixes()
+    from tests_helpers import build_test_bot
+    
+    # Create bot instance (this will connect to exchange)
+    print("🔗 Connecting to exchange...")
+    success = test_trading_bot_fixes(build_test_bot())
     print(f"\n{'=' * 60}")
     print(f"{'🎉 TEST RESULT: PASSED' if success else '💥 TEST RESULT: FAILED'}")
     print(f"{'=' * 60}")
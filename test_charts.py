@@ -4,40 +4,15 @@ Test script to debug candlestick chart display issues
 and verify data structure.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from trading_bot import TradingBot, BotConfig
-from config import STRATEGY_PARAMS, BINANCE_TESTNET_API_KEY, BINANCE_TESTNET_SECRET
-from web_interface import create_candlestick_chart
+from web_interface import build_candlestick_figure
 import pandas as pd
 import numpy as np
 
-def test_candlestick_data():
+def test_candlestick_data(btc_analysis):
     """Test candlestick chart data and creation"""
     print("🧪 Testing Candlestick Chart Data...")
     
-    # Create bot config
-    config = BotConfig(
-        base_nb_candles_buy=STRATEGY_PARAMS['base_nb_candles_buy'],
-        base_nb_candles_sell=STRATEGY_PARAMS['base_nb_candles_sell'],
-        low_offset=STRATEGY_PARAMS['low_offset'],
-        high_offset=STRATEGY_PARAMS['high_offset'],
-        ewo_low=STRATEGY_PARAMS['ewo_low'],
-        ewo_high=STRATEGY_PARAMS['ewo_high'],
-        rsi_buy=STRATEGY_PARAMS['rsi_buy'],
-        fast_ewo=STRATEGY_PARAMS['fast_ewo'],
-        slow_ewo=STRATEGY_PARAMS['slow_ewo'],
-        stoploss=STRATEGY_PARAMS['stoploss']
-    )
-    
-    # Create bot instance
-    bot = TradingBot(config)
-    
-    # Test data fetch and analysis
-    print("   Fetching and analyzing BTC/USDT...")
-    analysis = bot.analyze_symbol('BTC/USDT')
+    analysis = btc_analysis
     
     if not analysis or 'dataframe' not in analysis:
         print("   ❌ No analysis data received")
@@ -65,49 +40,38 @@ def test_candlestick_data():
     print(f"      Close: ${df['close'].iloc[-1]:.2f}")
     print(f"      Volume: {df['volume'].iloc[-1]:.0f}")
     
-    # Check for data validity
-    if (df['high'] < df['low']).any():
-        print("   ❌ Invalid data: High < Low detected")
-        return False
-    
-    if (df['high'] < df['open']).any() or (df['high'] < df['close']).any():
-        print("   ❌ Invalid data: High < Open/Close detected")
-        return False
+    # Check for data validity (one pass over the OHLC block)
+    o, h, l, c = df[['open', 'high', 'low', 'close']].to_numpy().T
+    invalid = (h < l) | (h < o) | (h < c) | (l > o) | (l > c)
     
-    if (df['low'] > df['open']).any() or (df['low'] > df['close']).any():
-        print("   ❌ Invalid data: Low > Open/Close detected")
+    if np.any(invalid):
+        row = int(np.argmax(invalid))
+        print(f"   ❌ Invalid data: High/Low outside Open/Close at {df.index[row]} "
+              f"(O={o[row]:.2f} H={h[row]:.2f} L={l[row]:.2f} C={c[row]:.2f})")
         return False
     
     print("   ✅ OHLC data validation passed")
     
     # Check signals
     if 'enter_long' in df.columns:
-        buy_signals = df['enter_long'].sum()
+        buy_signals = int(np.count_nonzero(df['enter_long'].to_numpy()))
         print(f"   Buy signals: {buy_signals}")
     
     if 'exit_long' in df.columns:
-        sell_signals = df['exit_long'].sum()
+        sell_signals = int(np.count_nonzero(df['exit_long'].to_numpy()))
         print(f"   Sell signals: {sell_signals}")
     
     # Test chart creation
     print("   Testing chart creation...")
     try:
-        # Mock the bot config for chart creation
-        class MockBot:
-            def __init__(self, config):
-                self.config = config
-        
-        mock_bot = MockBot(config)
-        
         # Create the chart
-        chart_data = create_candlestick_chart(analysis)
+        chart_data = build_candlestick_figure(analysis)
         
         if chart_data:
             print("   ✅ Chart created successfully")
             
             # Check chart data structure
-            chart_json = chart_data.to_json()
-            if 'data' in chart_json:
+            if chart_data.data:
                 traces = len(chart_data.data)
                 print(f"   Chart has {traces} traces")
                 
@@ -145,30 +109,35 @@ def test_mock_data():
     print("\n🧪 Testing with Controlled Mock Data...")
     
     # Create simple, known good data
-    dates = pd.date_range('2024-01-01', periods=50, freq='5min')
+    start = np.datetime64('2024-01-01T00:00:00', 's')
+    step = np.timedelta64(300, 's')  # 5m candles
+    dates = pd.DatetimeIndex(start + step * np.arange(50))
     
-    # Create realistic OHLC data
+    # Create realistic OHLC data (seeded so runs are reproducible)
     base_price = 50000
-    price_changes = np.random.randn(50) * 0.001
-    price_changes[0] = 0
-    cumulative_changes = np.cumsum(price_changes)
-    close_prices = base_price * (1 + cumulative_changes)
+    rng = np.random.default_rng(42)
+    noise = rng.standard_normal((50, 4))
+    noise[0, 0] = 0
     
-    df = pd.DataFrame({
-        'open': close_prices,
-        'close': close_prices * (1 + np.random.randn(50) * 0.0005),
-        'volume': np.random.uniform(100, 1000, 50),
-    }, index=dates)
+    open_prices = base_price * (1 + np.cumsum(noise[:, 0] * 0.001))
+    close_prices = open_prices * (1 + noise[:, 1] * 0.0005)
     
-    # Ensure proper high/low
-    df['high'] = df[['open', 'close']].max(axis=1) * (1 + np.abs(np.random.randn(50) * 0.0002))
-    df['low'] = df[['open', 'close']].min(axis=1) * (1 - np.abs(np.random.randn(50) * 0.0002))
+    # Add some fake signals (int8 flags, assigned as whole columns)
+    enter_long = np.zeros(50, dtype=np.int8)
+    exit_long = np.zeros(50, dtype=np.int8)
+    enter_long[10] = 1
+    exit_long[30] = 1
     
-    # Add some fake signals
-    df['enter_long'] = 0
-    df['exit_long'] = 0
-    df.iloc[10, df.columns.get_loc('enter_long')] = 1
-    df.iloc[30, df.columns.get_loc('exit_long')] = 1
+    df = pd.DataFrame({
+        'open': open_prices,
+        'close': close_prices,
+        'volume': rng.uniform(100, 1000, 50),
+        # Ensure proper high/low
+        'high': np.maximum(open_prices, close_prices) * (1 + np.abs(noise[:, 2]) * 0.0002),
+        'low': np.minimum(open_prices, close_prices) * (1 - np.abs(noise[:, 3]) * 0.0002),
+        'enter_long': enter_long,
+        'exit_long': exit_long,
+    }, index=dates)
     
     print(f"   Mock data shape: {df.shape}")
     print(f"   Mock data columns: {list(df.columns)}")
@@ -186,7 +155,7 @@ def test_mock_data():
     
     print("   Testing chart with mock data...")
     try:
-        chart = create_candlestick_chart(mock_analysis)
+        chart = build_candlestick_figure(mock_analysis)
         if chart:
             print("   ✅ Mock chart created successfully")
             return True
@@ -202,7 +171,10 @@ if __name__ == "__main__":
     print("=" * 60)
     
     # Test with real data
-    real_test = test_candlestick_data()
+    from tests_helpers import build_test_bot
+    bot = build_test_bot()
+    print("   Fetching and analyzing BTC/USDT...")
+    real_test = test_candlestick_data(bot.analyze_symbol('BTC/USDT'))
     
     # Test with mock data
     mock_test = test_mock_data()
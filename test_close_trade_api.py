@@ -2,13 +2,20 @@
 """
 Test script for the close_trade API endpoint
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from web_interface import app
 import json
 
+# orjson is optional; fall back to the stdlib decoder
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+def _payload(response):
+    """Decoded JSON body, or None for non-JSON responses (like get_json())"""
+    return _json_loads(response.data) if response.is_json else None
+
 def test_close_trade_api():
     """Test the close_trade API endpoint functionality"""
     
@@ -18,7 +25,7 @@ def test_close_trade_api():
                               json={'symbol': 'BTC/USDT'},
                               content_type='application/json')
         print(f"Without auth - Status: {response.status_code}")
-        print(f"Response: {response.get_json()}")
+        print(f"Response: {_payload(response)}")
         
         # Test with session (simulate login)
         with client.session_transaction() as sess:
@@ -30,14 +37,14 @@ def test_close_trade_api():
                               json={},
                               content_type='application/json')
         print(f"\nMissing symbol - Status: {response.status_code}")
-        print(f"Response: {response.get_json()}")
+        print(f"Response: {_payload(response)}")
         
         # Test with valid symbol (but no bot initialized)
         response = client.post('/api/close_trade', 
                               json={'symbol': 'BTC/USDT'},
                               content_type='application/json')
         print(f"\nNo bot - Status: {response.status_code}")
-        print(f"Response: {response.get_json()}")
+        print(f"Response: {_payload(response)}")
 
 if __name__ == "__main__":
     print("Testing close_trade API endpoint...")
@@ -3,16 +3,12 @@
 Test Binance Testnet Connection and Configuration
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-import ccxt
+import asyncio
+import ccxt.async_support as ccxt_async
 import logging
 from trading_bot import TradingBot, BotConfig
+from markets_cache import load_markets_from_cache, save_markets_to_cache
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def test_binance_connection():
@@ -21,25 +17,30 @@ async def test_binance_connection():
     print("🔌 BINANCE TESTNET CONNECTION TEST")
     print("=" * 60)
     
+    # Load configuration
+    import config
+    
+    # Initialize exchange
+    exchange = ccxt_async.binance({
+        'apiKey': config.BINANCE_TESTNET_API_KEY,
+        'secret': config.BINANCE_TESTNET_SECRET,
+        'sandbox': True,
+        'enableRateLimit': True,
+        'options': {
+            'defaultType': 'future'
+        }
+    })
+    
     try:
-        # Load configuration
-        import config
-        
-        # Initialize exchange
-        exchange = ccxt.binance({
-            'apiKey': config.BINANCE_TESTNET_API_KEY,
-            'secret': config.BINANCE_TESTNET_SECRET,
-            'sandbox': True,
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'future'
-            }
-        })
-        
         print("📡 Testing Connection...")
         
         # Test basic connection
         try:
+            # Market metadata from the local cache when fresh, else one download
+            if not load_markets_from_cache(exchange):
+                await exchange.load_markets()
+                save_markets_to_cache(exchange)
+            
             balance = await exchange.fetch_balance()
             print(f"   ✅ Connected to Binance testnet successfully")
             print(f"   💰 USDT Balance: {balance.get('USDT', {}).get('free', 0):.2f}")
@@ -51,9 +52,16 @@ async def test_binance_connection():
         print("\n📊 Symbol Information:")
         test_symbols = ['BTC/USDT', 'ETH/USDT']
         
+        # One request for all quotes instead of one per symbol
+        try:
+            tickers = await exchange.fetch_tickers(test_symbols)
+        except Exception as e:
+            print(f"   ❌ Failed to fetch tickers: {e}")
+            tickers = {}
+        
         for symbol in test_symbols:
             try:
-                ticker = await exchange.fetch_ticker(symbol)
+                ticker = tickers[symbol]
                 market = exchange.market(symbol)
                 
                 print(f"   {symbol}:")
@@ -86,27 +94,28 @@ async def test_binance_connection():
         # Test margin mode and leverage configuration
         print("\n⚙️  Testing Configuration Settings:")
         
-        for symbol in test_symbols:
-            try:
-                # Try to set margin mode (this might fail if already set)
-                try:
-                    await exchange.set_margin_mode('isolated', symbol)
-                    print(f"   ✅ {symbol}: Set to isolated margin")
-                except Exception as e:
-                    if 'No need to change margin type' in str(e):
-                        print(f"   ✅ {symbol}: Already in isolated margin")
-                    else:
-                        print(f"   ⚠️  {symbol}: Margin mode issue: {e}")
-                
-                # Try to set leverage
-                try:
-                    await exchange.set_leverage(config.LEVERAGE, symbol)
-                    print(f"   ✅ {symbol}: Leverage set to {config.LEVERAGE}x")
-                except Exception as e:
-                    print(f"   ⚠️  {symbol}: Leverage issue: {e}")
-                
-            except Exception as e:
-                print(f"   ❌ {symbol}: Configuration failed: {e}")
+        # Configure all symbols concurrently (these might fail if already set)
+        margin_results = await asyncio.gather(
+            *(exchange.set_margin_mode('isolated', s) for s in test_symbols),
+            return_exceptions=True
+        )
+        leverage_results = await asyncio.gather(
+            *(exchange.set_leverage(config.LEVERAGE, s) for s in test_symbols),
+            return_exceptions=True
+        )
+        
+        for symbol, margin, leverage in zip(test_symbols, margin_results, leverage_results):
+            if not isinstance(margin, Exception):
+                print(f"   ✅ {symbol}: Set to isolated margin")
+            elif 'No need to change margin type' in str(margin):
+                print(f"   ✅ {symbol}: Already in isolated margin")
+            else:
+                print(f"   ⚠️  {symbol}: Margin mode issue: {margin}")
+            
+            if isinstance(leverage, Exception):
+                print(f"   ⚠️  {symbol}: Leverage issue: {leverage}")
+            else:
+                print(f"   ✅ {symbol}: Leverage set to {config.LEVERAGE}x")
         
         print("\n✅ CONNECTION TEST COMPLETE")
         print("\n🎯 Next Steps:")
@@ -115,15 +124,15 @@ async def test_binance_connection():
         print("   3. Check that positions use isolated margin and correct sizes")
         print("   4. Verify leverage is 10x, not 20x")
         
-        await exchange.close()
-        
     except Exception as e:
         print(f"❌ Test failed: {e}")
+    finally:
+        await exchange.close()
 
 def run_test():
     """Run the async test"""
-    import asyncio
     asyncio.run(test_binance_connection())
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     run_test()
@@ -3,33 +3,64 @@
 Comprehensive test of the corrected hedge trigger and exit logic
 """
 
-from trading_bot import TradingBot, BotConfig, HedgePair, Trade
+from trading_bot import HedgePair, Trade
+from _hedge_math import eval_hedge
 from datetime import datetime
-import config
+import sys
+import numpy as np
+import pytest
 
-def test_corrected_hedge_logic():
+# Long entered at $50,000, hedge short at $47,500 (-5% from long)
+LONG_ENTRY, LONG_AMOUNT = 50000.0, 0.001
+SHORT_ENTRY, SHORT_AMOUNT = 47500.0, 0.0015
+
+# Hedge trigger price scenarios
+TRIGGER_SCENARIOS = [
+    {"price": 48000.0, "expected_trigger": False, "description": "-4% loss (no trigger)"},
+    {"price": 47500.0, "expected_trigger": True, "description": "-5% loss (should trigger)"},
+    {"price": 47000.0, "expected_trigger": True, "description": "-6% loss (should trigger)"},
+    {"price": 40000.0, "expected_trigger": True, "description": "-20% loss (should trigger)"},
+]
+
+# Hedge exit price scenarios (none reach the 1% combined profit)
+EXIT_SCENARIOS = [
+    {"price": 46000.0, "expected_exit": False, "description": "Further price drop (short profits more)"},
+    {"price": 47000.0, "expected_exit": False, "description": "Price between long and short entries"},
+    {"price": 48000.0, "expected_exit": False, "description": "Price recovery towards long entry"},
+]
+
+@pytest.mark.parametrize("scenario", TRIGGER_SCENARIOS, ids=lambda s: f"{s['price']:.0f}")
+def test_hedge_trigger(scenario):
+    """A -5% move against the long triggers the hedge"""
+    loss_pct = (scenario["price"] - LONG_ENTRY) / LONG_ENTRY
+    assert (loss_pct <= -0.05) == scenario["expected_trigger"]
+
+@pytest.mark.parametrize("scenario", EXIT_SCENARIOS, ids=lambda s: f"{s['price']:.0f}")
+def test_hedge_exit(scenario):
+    """Combined hedge ROI matches the scalar P&L and the 1% exit rule"""
+    price = scenario["price"]
+    long_pnl, short_pnl, roi = eval_hedge(
+        np.array([price]), LONG_ENTRY, LONG_AMOUNT, SHORT_ENTRY, SHORT_AMOUNT
+    )
+    
+    assert long_pnl[0] == pytest.approx((price - LONG_ENTRY) * LONG_AMOUNT)
+    assert short_pnl[0] == pytest.approx((SHORT_ENTRY - price) * SHORT_AMOUNT)
+    assert (roi[0] >= 0.01) == scenario["expected_exit"]
+
+def test_corrected_hedge_logic(bot):
     """Test the corrected hedge trigger and exit logic"""
     print("🔧 TESTING CORRECTED HEDGE LOGIC")
     print("=" * 60)
     
+    # The bot is shared with other tests; restore its pairs afterwards
+    saved_pairs = bot.hedge_pairs
+    
     try:
-        # Create bot configuration
-        bot_config = BotConfig(
-            initial_balance=config.INITIAL_BALANCE,
-            max_trades=config.MAX_TRADES,
-            leverage=config.LEVERAGE,
-            hedge_trigger_loss=config.HEDGE_TRIGGER_LOSS,
-            one_trade_per_pair=config.ONE_TRADE_PER_PAIR,
-            telegram_enabled=False
-        )
+        bot_config = bot.config
         
         print("✅ Bot configuration loaded")
         print(f"   • Hedge trigger: {bot_config.hedge_trigger_loss:.1%}")
         
-        # Create bot instance (will connect to exchange)
-        bot = TradingBot(bot_config)
-        print("✅ Bot connected to exchange")
-        
         # Test 1: Hedge trigger logic
         print("\n1. TESTING HEDGE TRIGGER LOGIC:")
         
@@ -44,8 +75,8 @@ def test_corrected_hedge_logic():
             id="long_123",
             symbol="BTC/USDT",
             side="buy",
-            amount=0.001,
-            price=50000.0,  # Entry at $50,000
+            amount=LONG_AMOUNT,
+            price=LONG_ENTRY,
             timestamp=datetime.now(),
             status="open",
             entry_signal="Test signal",
@@ -55,26 +86,19 @@ def test_corrected_hedge_logic():
         mock_pair.long_trade = mock_long_trade
         bot.hedge_pairs = [mock_pair]
         
-        # Test different price scenarios
-        test_scenarios = [
-            {"price": 48000.0, "expected_trigger": False, "description": "-4% loss (no trigger)"},
-            {"price": 47500.0, "expected_trigger": True, "description": "-5% loss (should trigger)"},
-            {"price": 47000.0, "expected_trigger": True, "description": "-6% loss (should trigger)"},
-            {"price": 40000.0, "expected_trigger": True, "description": "-20% loss (should trigger)"},
-        ]
-        
-        for scenario in test_scenarios:
-            test_price = scenario["price"]
-            expected = scenario["expected_trigger"]
-            desc = scenario["description"]
-            
-            # Calculate loss percentage
-            loss_pct = (test_price - mock_long_trade.price) / mock_long_trade.price
-            should_trigger = loss_pct <= -0.05  # -5% threshold
-            
-            status = "✅" if should_trigger == expected else "❌"
-            print(f"   • ${test_price:.0f}: {desc}")
-            print(f"     Loss: {loss_pct:.2%} | Should trigger: {should_trigger} {status}")
+        prices = np.array([s["price"] for s in TRIGGER_SCENARIOS])
+        expected = np.array([s["expected_trigger"] for s in TRIGGER_SCENARIOS])
+        
+        # Calculate loss percentage
+        loss_pct = (prices - mock_long_trade.price) / mock_long_trade.price
+        should_trigger = loss_pct <= -0.05  # -5% threshold
+        
+        lines = []
+        for scenario, test_price, loss, trigger, exp in zip(TRIGGER_SCENARIOS, prices, loss_pct, should_trigger, expected):
+            status = "✅" if trigger == exp else "❌"
+            lines.append(f"   • ${test_price:.0f}: {scenario['description']}")
+            lines.append(f"     Loss: {loss:.2%} | Should trigger: {bool(trigger)} {status}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Test 2: Hedge exit logic
         print("\n2. TESTING HEDGE EXIT LOGIC:")
@@ -85,8 +109,8 @@ def test_corrected_hedge_logic():
             id="short_123",
             symbol="BTC/USDT",
             side="sell",
-            amount=0.0015,
-            price=47500.0,  # Hedge entered at $47,500 (-5% from long)
+            amount=SHORT_AMOUNT,
+            price=SHORT_ENTRY,
             timestamp=datetime.now(),
             status="open",
             entry_signal="Hedge signal",
@@ -94,31 +118,23 @@ def test_corrected_hedge_logic():
         )
         mock_pair.short_trade = mock_short_trade
         
-        # Test exit scenarios
-        exit_scenarios = [
-            {"price": 46000.0, "description": "Further price drop (short profits more)"},
-            {"price": 47000.0, "description": "Price between long and short entries"},
-            {"price": 48000.0, "description": "Price recovery towards long entry"},
-        ]
-        
-        for scenario in exit_scenarios:
-            test_price = scenario["price"]
-            desc = scenario["description"]
-            
-            # Calculate P&L for both positions
-            long_pnl = (test_price - mock_long_trade.price) * mock_long_trade.amount
-            short_pnl = (mock_short_trade.price - test_price) * mock_short_trade.amount
-            total_pnl = long_pnl + short_pnl
-            
-            total_invested = (mock_long_trade.price * mock_long_trade.amount + 
-                             mock_short_trade.price * mock_short_trade.amount)
-            total_roi_pct = total_pnl / total_invested
-            
-            should_exit = total_roi_pct >= 0.01  # 1% profit threshold
-            
-            print(f"   • ${test_price:.0f}: {desc}")
-            print(f"     Long P&L: ${long_pnl:.2f} | Short P&L: ${short_pnl:.2f}")
-            print(f"     Total ROI: {total_roi_pct:.2%} | Should exit: {should_exit}")
+        prices = np.array([s["price"] for s in EXIT_SCENARIOS])
+        
+        # Calculate P&L for both positions (same kernel as TradingBot.check_hedge_exits)
+        long_pnl, short_pnl, total_roi_pct = eval_hedge(
+            prices,
+            mock_long_trade.price, mock_long_trade.amount,
+            mock_short_trade.price, mock_short_trade.amount
+        )
+        
+        should_exit = total_roi_pct >= 0.01  # 1% profit threshold
+        
+        lines = []
+        for scenario, test_price, lp, sp, roi, exit_ in zip(EXIT_SCENARIOS, prices, long_pnl, short_pnl, total_roi_pct, should_exit):
+            lines.append(f"   • ${test_price:.0f}: {scenario['description']}")
+            lines.append(f"     Long P&L: ${lp:.2f} | Short P&L: ${sp:.2f}")
+            lines.append(f"     Total ROI: {roi:.2%} | Should exit: {bool(exit_)}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         print("\n3. SUMMARY OF CORRECTIONS:")
         print("   ✅ Hedge trigger: Fixed to trigger at exactly -5% loss")
@@ -140,8 +156,13 @@ def test_corrected_hedge_logic():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        bot.hedge_pairs = saved_pairs
 
 if __name__ == "__main__":
-    success = test_corrected_hedge_logic()
+    from tests_helpers import build_test_bot
+    
+    # Create bot instance (will connect to exchange)
+    success = test_corrected_hedge_logic(build_test_bot())
     print(f"\n{'🎉 HEDGE LOGIC CORRECTIONS VERIFIED!' if success else '💥 TEST FAILED!'}")
     print("=" * 60)
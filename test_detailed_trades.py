@@ -1,103 +1,183 @@
 #!/usr/bin/env python3
 
 import time
+import pytest
 import requests
 import json
 from datetime import datetime, timedelta
+from collections import deque
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def test_authentication_and_trade_display():
+TIMEOUT = (2, 10)  # (connect, read) seconds
+
+# Trade fields shown by the display loops, in template order
+KEYS = ('symbol', 'side', 'entry_reason', 'exit_reason', 'technical_indicators', 'market_conditions')
+TRADE_TEMPLATE = """
+Trade %d:
+  Symbol: %s
+  Side: %s
+  Entry Reason: %s
+  Exit Reason: %s
+  Technical Indicators: %s
+  Market Conditions: %s"""
+
+RECENT_KEYS = ('symbol', 'side', 'status', 'entry_reason', 'technical_indicators')
+RECENT_TEMPLATE = """
+Recent Trade:
+  Symbol: %s
+  Side: %s
+  Status: %s
+  Entry Reason: %s
+  Technical Indicators: %s"""
+
+# orjson is optional; fall back to the stdlib decoder
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson (C backend when built) streams /api/trades; without it the body is parsed whole
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+def make_session():
+    """Keep-alive session for the web interface
+    
+    Only GETs are retried on 5xx / read errors; POSTs (login, bot start/stop)
+    are not idempotent, so they are retried only when the connection was never made.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                         max_retries=Retry(total=3, backoff_factor=0.2,
+                                                           status_forcelist=[500, 502, 503, 504],
+                                                           allowed_methods=["GET"])))
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+@pytest.fixture(scope="module")
+def http_session():
+    """One connection pool for the module, closed afterwards"""
+    session = make_session()
+    yield session
+    session.close()
+
+def iter_trades(response):
+    """Yield trades from a /api/trades response requested with stream=True"""
+    if ijson is None:
+        yield from _json_loads(response.content)
+        return
+    response.raw.decode_content = True
+    yield from ijson.items(response.raw, 'item', use_float=True)
+
+def tail_trades(response, n=3):
+    """Count the trades in a response, keeping only the last n"""
+    recent = deque(maxlen=n)
+    count = 0
+    for trade in iter_trades(response):
+        recent.append(trade)
+        count += 1
+    return count, list(recent)
+
+def test_authentication_and_trade_display(http_session):
     """Test the authentication system and detailed trade display"""
+    session = http_session
     
     base_url = "http://localhost:5000"
     
     # Test that we get redirected to login when not authenticated
     print("Testing authentication...")
-    response = requests.get(f"{base_url}/")
+    response = session.get(f"{base_url}/", timeout=TIMEOUT)
     print(f"Unauthenticated access status: {response.status_code}")
     
-    # Create a session and login
-    session = requests.Session()
-    
     # Login with credentials from config
     login_data = {
         'username': 'admin',
         'password': 'hedge123'
     }
     
-    login_response = session.post(f"{base_url}/login", data=login_data)
+    login_response = session.post(f"{base_url}/login", data=login_data, timeout=TIMEOUT)
     print(f"Login response status: {login_response.status_code}")
     
     if login_response.status_code == 200 or login_response.status_code == 302:
         print("✅ Authentication successful!")
         
+        # One after another on the keep-alive session (requests.Session is not thread-safe)
+        dashboard_response = session.get(f"{base_url}/", timeout=TIMEOUT)
+        trades_response = session.get(f"{base_url}/api/trades", timeout=TIMEOUT, stream=True)
+        status_response = session.get(f"{base_url}/api/status", timeout=TIMEOUT)
+        
         # Test accessing the dashboard
-        dashboard_response = session.get(f"{base_url}/")
         print(f"Dashboard access status: {dashboard_response.status_code}")
         
         # Test API endpoints
-        trades_response = session.get(f"{base_url}/api/trades")
         print(f"Trades API status: {trades_response.status_code}")
         
         if trades_response.status_code == 200:
-            trades = trades_response.json()
-            print(f"Current trades count: {len(trades)}")
+            trades = iter_trades(trades_response)
+            first_trades = list(islice(trades, 3))  # Show first 3 trades
+            print(f"Current trades count: {len(first_trades) + sum(1 for _ in trades)}")
             
             # Display any existing trade details
-            for i, trade in enumerate(trades[:3]):  # Show first 3 trades
-                print(f"\nTrade {i+1}:")
-                print(f"  Symbol: {trade.get('symbol')}")
-                print(f"  Side: {trade.get('side')}")
-                print(f"  Entry Reason: {trade.get('entry_reason', 'N/A')}")
-                print(f"  Exit Reason: {trade.get('exit_reason', 'N/A')}")
-                print(f"  Technical Indicators: {trade.get('technical_indicators', 'N/A')}")
-                print(f"  Market Conditions: {trade.get('market_conditions', 'N/A')}")
+            for i, trade in enumerate(first_trades, 1):
+                print(TRADE_TEMPLATE % (i, *(trade.get(k, 'N/A') for k in KEYS)))
         
         # Test bot status
-        status_response = session.get(f"{base_url}/api/status")
         if status_response.status_code == 200:
-            status = status_response.json()
+            status = _json_loads(status_response.content)
             print(f"\nBot Status: {status}")
         
     else:
         print("❌ Authentication failed!")
         print(f"Response: {login_response.text}")
 
-def create_sample_trade_data():
+def create_sample_trade_data(session):
     """Create some sample trades with detailed information to test the display"""
     
-    session = requests.Session()
-    
     # Login first
     login_data = {'username': 'admin', 'password': 'hedge123'}
-    session.post("http://localhost:5000/login", data=login_data)
+    session.post("http://localhost:5000/login", data=login_data, timeout=TIMEOUT)
+    
+    # Trade count before the bot starts
+    baseline_response = session.get("http://localhost:5000/api/trades", timeout=TIMEOUT, stream=True)
+    baseline = tail_trades(baseline_response, 0)[0] if baseline_response.ok else 0
     
     # Try to start the bot to create some activity
-    start_response = session.post("http://localhost:5000/api/bot/start")
+    start_response = session.post("http://localhost:5000/api/bot/start", timeout=TIMEOUT)
     print(f"Bot start response: {start_response.status_code}")
     
     if start_response.status_code == 200:
         print("✅ Bot started successfully!")
         
-        # Let it run for a few seconds to potentially create trades
+        # Let it run (up to 10 seconds) until a new trade shows up
         print("Waiting for potential trade creation...")
-        time.sleep(10)
+        trade_count = None
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            trades_response = session.get("http://localhost:5000/api/trades", timeout=TIMEOUT, stream=True)
+            if trades_response.ok:
+                trade_count, recent_trades = tail_trades(trades_response, 3)  # Keep last 3 trades
+                if trade_count > baseline:
+                    break
+            else:
+                trades_response.close()
+            time.sleep(0.25)
         
         # Check for new trades
-        trades_response = session.get("http://localhost:5000/api/trades")
-        if trades_response.status_code == 200:
-            trades = trades_response.json()
-            print(f"Trades after bot run: {len(trades)}")
+        if trade_count is not None:
+            print(f"Trades after bot run: {trade_count}")
             
-            for trade in trades[-3:]:  # Show last 3 trades
-                print(f"\nRecent Trade:")
-                print(f"  Symbol: {trade.get('symbol')}")
-                print(f"  Side: {trade.get('side')}")
-                print(f"  Status: {trade.get('status')}")
-                print(f"  Entry Reason: {trade.get('entry_reason', 'N/A')}")
-                print(f"  Technical Indicators: {trade.get('technical_indicators', 'N/A')}")
+            for trade in recent_trades:
+                print(RECENT_TEMPLATE % tuple(trade.get(k, 'N/A') for k in RECENT_KEYS))
         
         # Stop the bot
-        stop_response = session.post("http://localhost:5000/api/bot/stop")
+        stop_response = session.post("http://localhost:5000/api/bot/stop", timeout=TIMEOUT)
         print(f"Bot stop response: {stop_response.status_code}")
 
 if __name__ == "__main__":
@@ -105,10 +185,11 @@ if __name__ == "__main__":
     print("=" * 50)
     
     try:
-        test_authentication_and_trade_display()
-        print("\n" + "=" * 50)
-        print("Testing Trade Creation...")
-        create_sample_trade_data()
+        with make_session() as session:
+            test_authentication_and_trade_display(session)
+            print("\n" + "=" * 50)
+            print("Testing Trade Creation...")
+            create_sample_trade_data(session)
         
     except requests.exceptions.ConnectionError:
         print("❌ Could not connect to the web interface.")
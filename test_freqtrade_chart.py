@@ -3,21 +3,29 @@
 Test Freqtrade-style candlestick chart creation
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.utils
+import plotly.io as pio
 import json
 
+# Serialize the test chart with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    _JSON_ENGINE = "orjson"
+except ImportError:
+    _JSON_ENGINE = None
+
 def create_freqtrade_candlestick_chart(df, symbol="TEST/USDT"):
     """Create Freqtrade-style candlestick chart"""
     
+    # Pull the columns out as NumPy arrays once; pandas is not touched below
+    x = df.index.to_numpy()
+    open_, high, low, close, volume = (df[col].to_numpy() for col in ('open', 'high', 'low', 'close', 'volume'))
+    
     # Create figure with subplots (price + volume)
     fig = make_subplots(
         rows=2, cols=1,
@@ -30,11 +38,11 @@ def create_freqtrade_candlestick_chart(df, symbol="TEST/USDT"):
     
     # Create candlestick trace - Freqtrade style
     candlestick = go.Candlestick(
-        x=df.index,
-        open=df['open'],
-        high=df['high'],
-        low=df['low'],
-        close=df['close'],
+        x=x,
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
         name='OHLC',
         increasing_line_color='#26A69A',  # Freqtrade green
         decreasing_line_color='#EF5350',  # Freqtrade red
@@ -44,31 +52,32 @@ def create_freqtrade_candlestick_chart(df, symbol="TEST/USDT"):
         showlegend=False
     )
     
-    # Add candlestick to main plot
-    fig.add_trace(candlestick, row=1, col=1)
+    # Traces and their subplot rows, added to the figure in one batch
+    traces, rows = [candlestick], [1]
     
     # Add volume bars - Freqtrade style
-    colors = ['#26A69A' if close >= open else '#EF5350' 
-              for close, open in zip(df['close'], df['open'])]
+    colors = np.where(close >= open_, '#26A69A', '#EF5350')
     
     volume_trace = go.Bar(
-        x=df.index,
-        y=df['volume'],
+        x=x,
+        y=volume,
         name='Volume',
         marker_color=colors,
         opacity=0.6,
         showlegend=False
     )
     
-    fig.add_trace(volume_trace, row=2, col=1)
+    traces.append(volume_trace)
+    rows.append(2)
     
     # Add sample buy/sell signals
     if 'enter_long' in df.columns:
-        buy_signals = df[df['enter_long'] == 1]
-        if not buy_signals.empty:
+        buy_mask = df['enter_long'].to_numpy() == 1
+        if buy_mask.any():
+            buy_closes = close[buy_mask]
             buy_scatter = go.Scatter(
-                x=buy_signals.index,
-                y=buy_signals['low'] * 0.998,  # Place slightly below low
+                x=x[buy_mask],
+                y=low[buy_mask] * 0.998,  # Place slightly below low
                 mode='markers',
                 name='Buy Signal',
                 marker=dict(
@@ -79,16 +88,18 @@ def create_freqtrade_candlestick_chart(df, symbol="TEST/USDT"):
                 ),
                 showlegend=True,
                 hovertemplate='<b>BUY</b><br>Price: %{text}<br>%{x}<extra></extra>',
-                text=[f'${price:.2f}' for price in buy_signals['close']]
+                text=[f'${price:.2f}' for price in buy_closes.tolist()]
             )
-            fig.add_trace(buy_scatter, row=1, col=1)
+            traces.append(buy_scatter)
+            rows.append(1)
     
     if 'exit_long' in df.columns:
-        sell_signals = df[df['exit_long'] == 1]
-        if not sell_signals.empty:
+        sell_mask = df['exit_long'].to_numpy() == 1
+        if sell_mask.any():
+            sell_closes = close[sell_mask]
             sell_scatter = go.Scatter(
-                x=sell_signals.index,
-                y=sell_signals['high'] * 1.002,  # Place slightly above high
+                x=x[sell_mask],
+                y=high[sell_mask] * 1.002,  # Place slightly above high
                 mode='markers',
                 name='Sell Signal',
                 marker=dict(
@@ -99,11 +110,15 @@ def create_freqtrade_candlestick_chart(df, symbol="TEST/USDT"):
                 ),
                 showlegend=True,
                 hovertemplate='<b>SELL</b><br>Price: %{text}<br>%{x}<extra></extra>',
-                text=[f'${price:.2f}' for price in sell_signals['close']]
+                text=[f'${price:.2f}' for price in sell_closes.tolist()]
             )
-            fig.add_trace(sell_scatter, row=1, col=1)
+            traces.append(sell_scatter)
+            rows.append(1)
+    
+    fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
     
-    # Update layout - Freqtrade style
+    # Update layout and axes - Freqtrade style (one update pass)
+    grid = dict(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
     fig.update_layout(
         title=f'{symbol} Trading Chart',
         xaxis_rangeslider_visible=False,
@@ -116,32 +131,10 @@ def create_freqtrade_candlestick_chart(df, symbol="TEST/USDT"):
             y=1.02,
             xanchor="right",
             x=1
-        )
-    )
-    
-    # Update axes
-    fig.update_xaxes(
-        title_text="Time",
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(128,128,128,0.2)',
-        row=2, col=1
-    )
-    
-    fig.update_yaxes(
-        title_text="Price (USDT)",
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(128,128,128,0.2)',
-        row=1, col=1
-    )
-    
-    fig.update_yaxes(
-        title_text="Volume",
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(128,128,128,0.2)',
-        row=2, col=1
+        ),
+        xaxis2=dict(title=dict(text="Time"), **grid),
+        yaxis=dict(title=dict(text="Price (USDT)"), **grid),
+        yaxis2=dict(title=dict(text="Volume"), **grid)
     )
     
     return fig
@@ -154,30 +147,32 @@ def test_freqtrade_chart():
     # Create realistic test data
     dates = pd.date_range('2024-01-01', periods=100, freq='5min')
     
-    # Generate realistic price data
+    # Generate realistic price data (one random draw for all columns)
     base_price = 50000
-    price_changes = np.random.randn(100) * 0.001
-    price_changes[0] = 0
-    cumulative_changes = np.cumsum(price_changes)
-    close_prices = base_price * (1 + cumulative_changes)
+    rng = np.random.default_rng(42)
+    noise = rng.standard_normal((4, 100))
+    noise[0, 0] = 0
+    volume = rng.uniform(100, 1000, 100)
     
-    # Create OHLC data
+    open_prices = base_price * (1 + np.cumsum(noise[0] * 0.001))
+    close_prices = open_prices * (1 + noise[1] * 0.0005)
+    
+    # Create OHLC data (with proper high/low)
     df = pd.DataFrame({
-        'open': close_prices,
-        'close': close_prices * (1 + np.random.randn(100) * 0.0005),
-        'volume': np.random.uniform(100, 1000, 100),
+        'open': open_prices,
+        'close': close_prices,
+        'volume': volume,
+        'high': np.maximum(open_prices, close_prices) * (1 + np.abs(noise[2]) * 0.0002),
+        'low': np.minimum(open_prices, close_prices) * (1 - np.abs(noise[3]) * 0.0002),
     }, index=dates)
     
-    # Ensure proper high/low
-    df['high'] = df[['open', 'close']].max(axis=1) * (1 + np.abs(np.random.randn(100) * 0.0002))
-    df['low'] = df[['open', 'close']].min(axis=1) * (1 - np.abs(np.random.randn(100) * 0.0002))
-    
-    # Add some signals
-    df['enter_long'] = 0
-    df['exit_long'] = 0
-    df.iloc[20, df.columns.get_loc('enter_long')] = 1
-    df.iloc[60, df.columns.get_loc('exit_long')] = 1
-    df.iloc[80, df.columns.get_loc('enter_long')] = 1
+    # Add some signals (one whole-column write per signal)
+    enter_long = np.zeros(len(df), dtype=np.int8)
+    exit_long = np.zeros(len(df), dtype=np.int8)
+    enter_long[[20, 80]] = 1
+    exit_long[[60]] = 1
+    df['enter_long'] = enter_long
+    df['exit_long'] = exit_long
     
     print(f"✅ Test data created: {df.shape}")
     print(f"   Price range: ${df['close'].min():.2f} - ${df['close'].max():.2f}")
@@ -212,7 +207,16 @@ def test_freqtrade_chart():
     print(f"   - Signal traces: {signal_traces}")
     
     # Save as HTML for testing
-    fig.write_html("freqtrade_test_chart.html")
+    # Load plotly.js from the CDN instead of embedding the ~3.5 MB bundle
+    # plotly's engine is process-wide, so it is switched only for this write
+    default_engine = pio.json.config.default_engine
+    if _JSON_ENGINE:
+        pio.json.config.default_engine = _JSON_ENGINE
+    try:
+        fig.write_html("freqtrade_test_chart.html", include_plotlyjs='cdn', include_mathjax=False,
+                       auto_open=False, config={'displayModeBar': False})
+    finally:
+        pio.json.config.default_engine = default_engine
     print(f"✅ Chart saved as 'freqtrade_test_chart.html'")
     
     return True
@@ -3,6 +3,49 @@
 Test hedge trigger and exit logic with exact percentage calculations
 """
 
+import numpy as np
+import pytest
+
+TRIGGER_THRESHOLD = -0.05  # -5%
+EXIT_THRESHOLD = 0.01  # 1%
+
+# (entry_price, current_price, expected_trigger)
+TRIGGER_CASES = [
+    (100.0, 95.0, True),   # Exactly -5%
+    (100.0, 94.0, True),   # -6% (should trigger)
+    (100.0, 96.0, False),  # -4% (should NOT trigger)
+    (100.0, 80.0, True),   # -20% (should trigger)
+    (50.0, 47.5, True),    # Exactly -5%
+]
+
+EXIT_CASES = [
+    {
+        "long_entry": 100.0, "long_amount": 0.1, "current_price": 98.0,
+        "short_entry": 98.0, "short_amount": 0.15, "expected_exit": False,
+        "description": "Long loss covered by short profit"
+    },
+    {
+        "long_entry": 100.0, "long_amount": 0.1, "current_price": 102.0,
+        "short_entry": 95.0, "short_amount": 0.15, "expected_exit": False,
+        "description": "Both positions profitable"
+    },
+]
+
+@pytest.mark.parametrize("entry,current,expected", TRIGGER_CASES)
+def test_hedge_trigger(entry, current, expected):
+    """A loss of 5% or more triggers the hedge"""
+    assert ((current - entry) / entry <= TRIGGER_THRESHOLD) == expected
+
+@pytest.mark.parametrize("case", EXIT_CASES, ids=lambda c: c["description"])
+def test_hedge_exit(case):
+    """Both legs exit once the combined ROI reaches 1%"""
+    price = case["current_price"]
+    long_pnl = (price - case["long_entry"]) * case["long_amount"]
+    short_pnl = (case["short_entry"] - price) * case["short_amount"]
+    total_invested = case["long_entry"] * case["long_amount"] + case["short_entry"] * case["short_amount"]
+    
+    assert ((long_pnl + short_pnl) / total_invested >= EXIT_THRESHOLD) == case["expected_exit"]
+
 def test_hedge_logic():
     """Test the hedge trigger and exit calculations"""
     print("🧮 TESTING HEDGE LOGIC CALCULATIONS")
@@ -11,60 +54,42 @@ def test_hedge_logic():
     # Test hedge trigger calculations
     print("\n1. HEDGE TRIGGER TESTS (-5% loss threshold):")
     
-    test_cases = [
-        {"entry_price": 100.0, "current_price": 95.0, "expected_trigger": True},   # Exactly -5%
-        {"entry_price": 100.0, "current_price": 94.0, "expected_trigger": True},   # -6% (should trigger)
-        {"entry_price": 100.0, "current_price": 96.0, "expected_trigger": False},  # -4% (should NOT trigger)
-        {"entry_price": 100.0, "current_price": 80.0, "expected_trigger": True},   # -20% (should trigger)
-        {"entry_price": 50.0, "current_price": 47.5, "expected_trigger": True},    # Exactly -5%
-    ]
+    entries, currents, expected = (np.array(col) for col in zip(*TRIGGER_CASES))
+    
+    # Calculate loss percentage
+    loss_pct = (currents - entries) / entries
+    should_trigger = loss_pct <= TRIGGER_THRESHOLD
     
-    for i, case in enumerate(test_cases, 1):
-        entry_price = case["entry_price"]
-        current_price = case["current_price"]
-        expected = case["expected_trigger"]
-        
-        # Calculate loss percentage
-        loss_pct = (current_price - entry_price) / entry_price
-        trigger_threshold = -0.05  # -5%
-        should_trigger = loss_pct <= trigger_threshold
-        
-        status = "✅" if should_trigger == expected else "❌"
+    for i, (entry_price, current_price, loss, trigger, exp) in enumerate(
+            zip(entries, currents, loss_pct, should_trigger, expected), 1):
+        status = "✅" if trigger == exp else "❌"
         print(f"   Test {i}: Entry ${entry_price:.2f} → Current ${current_price:.2f}")
-        print(f"           Loss: {loss_pct:.2%} | Trigger: {should_trigger} | Expected: {expected} {status}")
+        print(f"           Loss: {loss:.2%} | Trigger: {bool(trigger)} | Expected: {bool(exp)} {status}")
     
     # Test hedge exit calculations
     print("\n2. HEDGE EXIT TESTS (1% profit threshold):")
     
-    exit_test_cases = [
-        {
-            "long_entry": 100.0, "long_amount": 0.1, "current_price": 98.0,
-            "short_entry": 98.0, "short_amount": 0.15,
-            "description": "Long loss covered by short profit"
-        },
-        {
-            "long_entry": 100.0, "long_amount": 0.1, "current_price": 102.0,
-            "short_entry": 95.0, "short_amount": 0.15,
-            "description": "Both positions profitable"
-        },
-    ]
+    def column(key):
+        return np.array([c[key] for c in EXIT_CASES])
+    
+    prices = column("current_price")
+    long_entry, long_amount = column("long_entry"), column("long_amount")
+    short_entry, short_amount = column("short_entry"), column("short_amount")
+    
+    long_pnl = (prices - long_entry) * long_amount
+    short_pnl = (short_entry - prices) * short_amount
+    total_pnl = long_pnl + short_pnl
+    
+    total_invested = long_entry * long_amount + short_entry * short_amount
+    total_roi_pct = total_pnl / total_invested
+    
+    should_exit = total_roi_pct >= EXIT_THRESHOLD
     
-    for i, case in enumerate(exit_test_cases, 1):
-        long_pnl = (case["current_price"] - case["long_entry"]) * case["long_amount"]
-        short_pnl = (case["short_entry"] - case["current_price"]) * case["short_amount"]
-        total_pnl = long_pnl + short_pnl
-        
-        total_invested = (case["long_entry"] * case["long_amount"] + 
-                         case["short_entry"] * case["short_amount"])
-        total_roi_pct = total_pnl / total_invested
-        
-        exit_threshold = 0.01  # 1%
-        should_exit = total_roi_pct >= exit_threshold
-        
-        print(f"   Test {i}: {case['description']}")
-        print(f"           Long P&L: ${long_pnl:.4f} | Short P&L: ${short_pnl:.4f}")
-        print(f"           Total P&L: ${total_pnl:.4f} | ROI: {total_roi_pct:.2%}")
-        print(f"           Should Exit: {should_exit} (threshold: {exit_threshold:.1%})")
+    for i, case in enumerate(EXIT_CASES):
+        print(f"   Test {i + 1}: {case['description']}")
+        print(f"           Long P&L: ${long_pnl[i]:.4f} | Short P&L: ${short_pnl[i]:.4f}")
+        print(f"           Total P&L: ${total_pnl[i]:.4f} | ROI: {total_roi_pct[i]:.2%}")
+        print(f"           Should Exit: {bool(should_exit[i])} (threshold: {EXIT_THRESHOLD:.1%})")
     
     print("\n3. CONFIGURATION VERIFICATION:")
     print(f"   • Hedge trigger: Loss >= -5% (loss_pct <= -0.05)")
@@ -6,14 +6,14 @@ Test the hedging strategy implementation
 import sys
 import time
 from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
 from trading_bot import TradingBot, BotConfig, HedgePair, Trade
 
-def test_hedging_strategy():
-    """Test the hedging strategy logic"""
-    print("Testing Hedging Strategy Implementation")
-    print("=" * 50)
-    
-    # Create configuration with hedging parameters
+def make_hedging_bot(exchange=None):
+    """Create a bot configured with the hedging parameters"""
     config = BotConfig(
         initial_balance=100.0,
         max_trades=3,
@@ -26,9 +26,24 @@ def test_hedging_strategy():
         exit_when_hedged=True,
         min_hedge_profit_ratio=1.0
     )
-    
-    # Initialize bot
-    bot = TradingBot(config)
+    return TradingBot(config, exchange)
+
+def patch_prices(bot, prices):
+    """Patch bot._get_current_price with fixed prices for some symbols"""
+    original = bot._get_current_price
+    return patch.object(bot, '_get_current_price',
+                        side_effect=lambda symbol: prices[symbol] if symbol in prices else original(symbol))
+
+@pytest.fixture
+def hedging_bot(exchange):
+    """A fresh hedging bot per test, so each scenario sets up its own state"""
+    return make_hedging_bot(exchange)
+
+def open_long(bot):
+    """Step 1: Create initial long position"""
+    config = bot.config
+    print("Testing Hedging Strategy Implementation")
+    print("=" * 50)
     
     print(f"Initial Balance: ${config.initial_balance}")
     print(f"Hedge Strategy Configuration:")
@@ -39,7 +54,6 @@ def test_hedging_strategy():
     print(f"  - Max Pairs: {config.max_trades}")
     print()
     
-    # Test 1: Create initial long position
     print("Test 1: Creating initial long position")
     analysis = {
         'signal': 'buy',
@@ -57,45 +71,32 @@ def test_hedging_strategy():
         print(f"  Status: {pair.status}")
         print(f"  Long trade price: ${pair.long_trade.price if pair.long_trade else 'None'}")
     print()
-    
-    # Test 2: Simulate price drop to trigger hedge
+
+def trigger_hedge(bot):
+    """Step 2: Simulate price drop to trigger hedge"""
     print("Test 2: Simulating price drop to trigger hedge")
     if bot.hedge_pairs:
         pair = bot.hedge_pairs[0]
         
-        # Mock the current price to simulate 6% loss
-        original_get_price = bot._get_current_price
-        def mock_get_price(symbol):
-            if symbol == 'ETH/USDT':
-                return 94.0  # 6% drop from 100
-            return original_get_price(symbol)
-        
-        bot._get_current_price = mock_get_price
-        
-        # Check hedge trigger
-        bot.check_hedge_triggers()
+        # Mock the current price to simulate 6% loss, then check hedge trigger
+        with patch_prices(bot, {'ETH/USDT': 94.0}):
+            bot.check_hedge_triggers()
         
         print(f"Hedge pair status: {pair.status}")
         print(f"Short trade created: {'Yes' if pair.short_trade else 'No'}")
         if pair.short_trade:
             print(f"  Short trade price: ${pair.short_trade.price}")
     print()
-    
-    # Test 3: Simulate profitable hedge exit
+
+def exit_hedge(bot):
+    """Step 3: Simulate profitable hedge exit"""
     print("Test 3: Simulating profitable hedge for exit")
     if bot.hedge_pairs and bot.hedge_pairs[0].status == 'hedged':
         pair = bot.hedge_pairs[0]
         
-        # Mock price recovery that makes hedge profitable
-        def mock_get_price_recovery(symbol):
-            if symbol == 'ETH/USDT':
-                return 89.0  # Further drop makes short more profitable
-            return original_get_price(symbol)
-        
-        bot._get_current_price = mock_get_price_recovery
-        
-        # Check hedge exit
-        bot.check_hedge_exits()
+        # Further drop makes short more profitable, then check hedge exit
+        with patch_prices(bot, {'ETH/USDT': 89.0}):
+            bot.check_hedge_exits()
         
         print(f"Hedge pair status: {pair.status}")
         print(f"Long trade status: {pair.long_trade.status if pair.long_trade else 'None'}")
@@ -111,5 +112,23 @@ def test_hedging_strategy():
     
     print("\nHedging strategy test completed!")
 
+def test_initial_long(hedging_bot):
+    """Test 1: Create initial long position"""
+    open_long(hedging_bot)
+
+def test_hedge_trigger(hedging_bot):
+    """Test 2: A 6% drop after the long entry triggers the hedge"""
+    open_long(hedging_bot)
+    trigger_hedge(hedging_bot)
+
+def test_hedge_exit(hedging_bot):
+    """Test 3: Full scenario, long entry, hedge, then profitable exit"""
+    open_long(hedging_bot)
+    trigger_hedge(hedging_bot)
+    exit_hedge(hedging_bot)
+
 if __name__ == "__main__":
-    test_hedging_strategy()
+    bot = make_hedging_bot()
+    open_long(bot)
+    trigger_hedge(bot)
+    exit_hedge(bot)
@@ -4,18 +4,30 @@ Test script to verify that moving averages are calculated correctly
 and not showing as straight lines.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from trading_bot import TradingStrategy, TradingBot, BotConfig
+from trading_bot import TradingStrategy, TradingBot, BotConfig, EWO
 from config import STRATEGY_PARAMS, BINANCE_TESTNET_API_KEY, BINANCE_TESTNET_SECRET
+from tests_helpers import make_exchange
 import pandas as pd
 import numpy as np
+import pytest
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# 5-minute index for the mock data, built once
+DATES = pd.date_range('2024-01-01', periods=200, freq='5min')
+
+def ma_stats(series):
+    """Min, max and % variation of an MA column, skipping the NaN warm-up bars"""
+    values = series.to_numpy()
+    low, high = np.nanmin(values), np.nanmax(values)
+    return low, high, (high - low) / np.nanmean(values) * 100
 
 def test_indicators():
     """Test indicator calculation with real and mock data"""
-    print("🧪 Testing Indicator Calculations...")
+    logger.debug("🧪 Testing Indicator Calculations...")
     
     # Create config
     config = BotConfig(
@@ -34,12 +46,16 @@ def test_indicators():
     strategy = TradingStrategy(config)
     
     # Test with realistic mock data (not straight line)
-    print("   Creating realistic test data...")
-    dates = pd.date_range('2024-01-01', periods=200, freq='5T')
+    logger.debug("   Creating realistic test data...")
+    
+    # One seeded draw for every random column
+    rng = np.random.default_rng(42)
+    noise = rng.standard_normal((4, 200))
+    volume = rng.uniform(100, 1000, 200)
     
     # Create realistic price movement (random walk with trend)
     base_price = 50000
-    price_changes = np.random.randn(200) * 0.001  # 0.1% random changes
+    price_changes = noise[0] * 0.001  # 0.1% random changes
     price_changes[0] = 0
     cumulative_changes = np.cumsum(price_changes)
     prices = base_price * (1 + cumulative_changes)
@@ -48,96 +64,113 @@ def test_indicators():
     trend = np.linspace(0, 0.05, 200)  # 5% upward trend over period
     prices = prices * (1 + trend)
     
-    # Create OHLC data with realistic spread
+    close_prices = prices * (1 + noise[1] * 0.0005)  # Small random close
+    
+    # Create OHLC data with realistic spread (high/low from open/close)
     df = pd.DataFrame({
-        'timestamp': dates,
         'open': prices,
-        'close': prices * (1 + np.random.randn(200) * 0.0005),  # Small random close
-        'volume': np.random.uniform(100, 1000, 200)
-    })
-    
-    # Calculate high/low from open/close
-    df['high'] = df[['open', 'close']].max(axis=1) * (1 + np.abs(np.random.randn(200) * 0.0002))
-    df['low'] = df[['open', 'close']].min(axis=1) * (1 - np.abs(np.random.randn(200) * 0.0002))
+        'high': np.maximum(prices, close_prices) * (1 + np.abs(noise[2]) * 0.0002),
+        'low': np.minimum(prices, close_prices) * (1 - np.abs(noise[3]) * 0.0002),
+        'close': close_prices,
+        'volume': volume
+    }, index=DATES.rename('timestamp'))
     
-    df.set_index('timestamp', inplace=True)
-    
-    print(f"   Test data shape: {df.shape}")
-    print(f"   Price range: ${df['close'].min():.2f} - ${df['close'].max():.2f}")
-    print(f"   Price variation: {((df['close'].max() - df['close'].min()) / df['close'].mean() * 100):.2f}%")
+    logger.debug("   Test data shape: %s", df.shape)
+    logger.debug("   Price range: $%.2f - $%.2f", df['close'].min(), df['close'].max())
+    logger.debug("   Price variation: %.2f%%", (df['close'].max() - df['close'].min()) / df['close'].mean() * 100)
     
     # Populate indicators
-    print("   Calculating indicators...")
-    df_with_indicators = strategy.populate_indicators(df.copy())
+    logger.debug("   Calculating indicators...")
+    df_with_indicators = strategy.populate_indicators(df)
     
     # Check what columns were created
     ma_buy_col = f'ma_buy_{config.base_nb_candles_buy}'
     ma_sell_col = f'ma_sell_{config.base_nb_candles_sell}'
     
-    print(f"   Expected MA Buy column: {ma_buy_col}")
-    print(f"   Expected MA Sell column: {ma_sell_col}")
-    print(f"   Available columns: {list(df_with_indicators.columns)}")
+    logger.debug("   Expected MA Buy column: %s", ma_buy_col)
+    logger.debug("   Expected MA Sell column: %s", ma_sell_col)
+    logger.debug("   Available columns: %s", list(df_with_indicators.columns))
     
     # Verify moving averages
     if ma_buy_col in df_with_indicators.columns:
-        ma_buy = df_with_indicators[ma_buy_col]
-        print(f"   ✅ MA Buy ({config.base_nb_candles_buy}) calculated")
-        print(f"      Range: ${ma_buy.min():.2f} - ${ma_buy.max():.2f}")
-        print(f"      Variation: {((ma_buy.max() - ma_buy.min()) / ma_buy.mean() * 100):.2f}%")
+        low, high, variation = ma_stats(df_with_indicators[ma_buy_col])
+        logger.debug("   ✅ MA Buy (%s) calculated", config.base_nb_candles_buy)
+        logger.debug("      Range: $%.2f - $%.2f", low, high)
+        logger.debug("      Variation: %.2f%%", variation)
         
         # Check if it's a straight line (variation < 0.1%)
-        variation = (ma_buy.max() - ma_buy.min()) / ma_buy.mean() * 100
         if variation < 0.1:
-            print(f"      ❌ WARNING: MA Buy appears to be a straight line (variation: {variation:.4f}%)")
+            logger.warning("      ❌ WARNING: MA Buy appears to be a straight line (variation: %.4f%%)", variation)
         else:
-            print(f"      ✅ MA Buy shows proper variation")
+            logger.debug("      ✅ MA Buy shows proper variation")
     else:
-        print(f"   ❌ MA Buy column missing!")
+        logger.warning("   ❌ MA Buy column missing!")
     
     if ma_sell_col in df_with_indicators.columns:
-        ma_sell = df_with_indicators[ma_sell_col]
-        print(f"   ✅ MA Sell ({config.base_nb_candles_sell}) calculated")
-        print(f"      Range: ${ma_sell.min():.2f} - ${ma_sell.max():.2f}")
-        print(f"      Variation: {((ma_sell.max() - ma_sell.min()) / ma_sell.mean() * 100):.2f}%")
+        low, high, variation = ma_stats(df_with_indicators[ma_sell_col])
+        logger.debug("   ✅ MA Sell (%s) calculated", config.base_nb_candles_sell)
+        logger.debug("      Range: $%.2f - $%.2f", low, high)
+        logger.debug("      Variation: %.2f%%", variation)
         
         # Check if it's a straight line
-        variation = (ma_sell.max() - ma_sell.min()) / ma_sell.mean() * 100
         if variation < 0.1:
-            print(f"      ❌ WARNING: MA Sell appears to be a straight line (variation: {variation:.4f}%)")
+            logger.warning("      ❌ WARNING: MA Sell appears to be a straight line (variation: %.4f%%)", variation)
         else:
-            print(f"      ✅ MA Sell shows proper variation")
+            logger.debug("      ✅ MA Sell shows proper variation")
     else:
-        print(f"   ❌ MA Sell column missing!")
+        logger.warning("   ❌ MA Sell column missing!")
     
     # Check other indicators
     if 'rsi' in df_with_indicators.columns:
         rsi = df_with_indicators['rsi']
-        print(f"   ✅ RSI calculated")
-        print(f"      Range: {rsi.min():.2f} - {rsi.max():.2f}")
+        logger.debug("   ✅ RSI calculated")
+        logger.debug("      Range: %.2f - %.2f", rsi.min(), rsi.max())
     
     if 'EWO' in df_with_indicators.columns:
         ewo = df_with_indicators['EWO']
-        print(f"   ✅ EWO calculated")
-        print(f"      Range: {ewo.min():.2f} - {ewo.max():.2f}")
+        logger.debug("   ✅ EWO calculated")
+        logger.debug("      Range: %.2f - %.2f", ewo.min(), ewo.max())
     
     # Test signals
-    print("   Testing signal generation...")
-    df_with_signals = strategy.populate_entry_signals(df_with_indicators.copy())
-    df_final = strategy.populate_exit_signals(df_with_signals.copy())
+    logger.debug("   Testing signal generation...")
+    df_with_signals = strategy.populate_entry_signals(df_with_indicators)
+    df_final = strategy.populate_exit_signals(df_with_signals)
     
     if 'enter_long' in df_final.columns:
         entry_signals = df_final['enter_long'].sum()
-        print(f"   ✅ Entry signals: {entry_signals}")
+        logger.debug("   ✅ Entry signals: %s", entry_signals)
     
     if 'exit_long' in df_final.columns:
         exit_signals = df_final['exit_long'].sum()
-        print(f"   ✅ Exit signals: {exit_signals}")
+        logger.debug("   ✅ Exit signals: %s", exit_signals)
     
     return df_final
 
-def test_with_real_data():
+def test_ewo_float64_frame():
+    """EWO() accepts float64 frames whichever kernel backend is loaded"""
+    close = np.random.default_rng(0).uniform(45000, 55000, 300)
+    result = EWO(pd.DataFrame({'close': close}), 50, 200)
+    
+    assert result.dtype == np.float64
+    assert np.isnan(result.to_numpy()[:199]).all()
+    assert np.isfinite(result.to_numpy()[199:]).all()
+
+def test_native_kernels_match_jit():
+    """AOT-built kernels, when present, give the same results as the JIT ones"""
+    native = pytest.importorskip('_indicators_native')
+    import _indicators
+    
+    close = np.random.default_rng(0).uniform(45000, 55000, 500).astype(np.float32)
+    for name, args in (('sma', (14,)), ('ema', (14,)), ('rsi', (14,)), ('ewo', (50, 200))):
+        np.testing.assert_allclose(
+            getattr(native, name)(close, *args),
+            getattr(_indicators, name)(close, *args),
+            rtol=1e-5, equal_nan=True, err_msg=name
+        )
+
+def test_with_real_data(exchange):
     """Test with real data from exchange"""
-    print("\n🌐 Testing with Real Exchange Data...")
+    logger.debug("\n🌐 Testing with Real Exchange Data...")
     
     try:
         # Create bot config
@@ -154,23 +187,31 @@ def test_with_real_data():
             stoploss=STRATEGY_PARAMS['stoploss']
         )
         
-        # Create bot instance
-        bot = TradingBot(config)
+        # Create bot instance on the shared exchange client
+        bot = TradingBot(config, exchange)
         
-        # Test data fetch
-        print("   Fetching BTC/USDT data...")
-        df = bot.get_historical_data('BTC/USDT', limit=100)
+        # Test data fetch (all symbols in one concurrent round trip)
+        logger.debug("   Fetching BTC/USDT and ETH/USDT data...")
+        async def fetch():
+            try:
+                return await bot.fetch_all(['BTC/USDT', 'ETH/USDT'], limit=100)
+            finally:
+                await bot.close_async_exchange()
+        
+        frames = asyncio.run(fetch())
+        df = frames['BTC/USDT']
         
         if df.empty:
-            print("   ❌ No data received from exchange")
+            logger.warning("   ❌ No data received from exchange")
             return None
         
-        print(f"   ✅ Received {len(df)} candles")
-        print(f"   Price range: ${df['close'].min():.2f} - ${df['close'].max():.2f}")
+        for symbol, frame in frames.items():
+            logger.debug("   ✅ Received %s %s candles", len(frame), symbol)
+        logger.debug("   Price range: $%.2f - $%.2f", df['close'].min(), df['close'].max())
         
         # Test analysis
-        print("   Running full analysis...")
-        analysis = bot.analyze_symbol('BTC/USDT')
+        logger.debug("   Running full analysis...")
+        analysis = bot.analyze_symbol('BTC/USDT', df)
         
         if analysis and 'dataframe' in analysis:
             df_analyzed = analysis['dataframe']
@@ -179,38 +220,38 @@ def test_with_real_data():
             ma_sell_col = f'ma_sell_{config.base_nb_candles_sell}'
             
             if ma_buy_col in df_analyzed.columns:
-                ma_buy = df_analyzed[ma_buy_col]
-                variation = (ma_buy.max() - ma_buy.min()) / ma_buy.mean() * 100
-                print(f"   ✅ Real MA Buy variation: {variation:.2f}%")
+                variation = ma_stats(df_analyzed[ma_buy_col])[2]
+                logger.debug("   ✅ Real MA Buy variation: %.2f%%", variation)
                 
                 if variation < 0.1:
-                    print(f"   ❌ WARNING: Real MA Buy appears to be a straight line!")
+                    logger.warning("   ❌ WARNING: Real MA Buy appears to be a straight line!")
                 else:
-                    print(f"   ✅ Real MA Buy shows proper variation")
+                    logger.debug("   ✅ Real MA Buy shows proper variation")
             
             if ma_sell_col in df_analyzed.columns:
-                ma_sell = df_analyzed[ma_sell_col]
-                variation = (ma_sell.max() - ma_sell.min()) / ma_sell.mean() * 100
-                print(f"   ✅ Real MA Sell variation: {variation:.2f}%")
+                variation = ma_stats(df_analyzed[ma_sell_col])[2]
+                logger.debug("   ✅ Real MA Sell variation: %.2f%%", variation)
                 
                 if variation < 0.1:
-                    print(f"   ❌ WARNING: Real MA Sell appears to be a straight line!")
+                    logger.warning("   ❌ WARNING: Real MA Sell appears to be a straight line!")
                 else:
-                    print(f"   ✅ Real MA Sell shows proper variation")
+                    logger.debug("   ✅ Real MA Sell shows proper variation")
             
-            print(f"   Current Analysis:")
-            print(f"      Signal: {analysis.get('signal', 'None')}")
-            print(f"      Price: ${analysis.get('price', 0):.2f}")
-            print(f"      RSI: {analysis.get('rsi', 0):.2f}")
-            print(f"      EWO: {analysis.get('ewo', 0):.2f}")
+            logger.debug("   Current Analysis:")
+            logger.debug("      Signal: %s", analysis.get('signal', 'None'))
+            logger.debug("      Price: $%.2f", analysis.get('price', 0))
+            logger.debug("      RSI: %.2f", analysis.get('rsi', 0))
+            logger.debug("      EWO: %.2f", analysis.get('ewo', 0))
             
             return df_analyzed
     
     except Exception as e:
-        print(f"   ❌ Error testing with real data: {e}")
+        logger.warning("   ❌ Error testing with real data: %s", e)
         return None
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.WARNING, format="%(message)s")
+    
     print("🚀 Trading Bot Indicator Test")
     print("=" * 60)
     
@@ -218,7 +259,7 @@ if __name__ == "__main__":
     df_mock = test_indicators()
     
     # Test with real data
-    df_real = test_with_real_data()
+    df_real = test_with_real_data(make_exchange())
     
     print("\n📊 Test Summary:")
     print("=" * 60)
@@ -3,97 +3,85 @@
 Test Leverage Configuration
 """
 
+import logging
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-import ccxt
-import time
+from tests_helpers import make_exchange
 
-def test_leverage_config():
+logger = logging.getLogger(__name__)
+
+def test_leverage_config(exchange):
     """Test leverage configuration with different parameter formats"""
-    print("🔧 Testing Leverage Configuration")
-    print("=" * 50)
+    logger.debug("🔧 Testing Leverage Configuration")
+    logger.debug("=" * 50)
     
     try:
         # Load configuration
         import config
-        print("✅ Config loaded")
+        logger.debug("✅ Config loaded")
         
-        # Initialize exchange
-        exchange = ccxt.binance({
-            'apiKey': config.BINANCE_TESTNET_API_KEY,
-            'secret': config.BINANCE_TESTNET_SECRET,
-            'sandbox': True,
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'future'
-            }
-        })
-        print("✅ Exchange initialized")
+        logger.debug("✅ Exchange initialized")
         
         test_symbol = 'BTC/USDT'
         target_leverage = int(config.LEVERAGE)  # Ensure integer
         
-        print(f"\n🎯 Testing leverage configuration for {test_symbol}")
-        print(f"   Target leverage: {target_leverage}x")
+        logger.debug("\n🎯 Testing leverage configuration for %s", test_symbol)
+        logger.debug("   Target leverage: %sx", target_leverage)
         
         # Method 1: Integer leverage
-        print(f"\n📋 Method 1: Integer leverage")
+        logger.debug("\n📋 Method 1: Integer leverage")
         try:
             result = exchange.set_leverage(target_leverage, test_symbol)
-            print(f"   ✅ Method 1 successful: {result}")
+            logger.debug("   ✅ Method 1 successful: %s", result)
         except Exception as e:
-            print(f"   ❌ Method 1 failed: {e}")
-        
-        time.sleep(1)  # Rate limit protection
+            logger.warning("   ❌ Method 1 failed: %s", e)
         
         # Method 2: String leverage  
-        print(f"\n📋 Method 2: String leverage")
+        logger.debug("\n📋 Method 2: String leverage")
         try:
             result = exchange.set_leverage(str(target_leverage), test_symbol)
-            print(f"   ✅ Method 2 successful: {result}")
+            logger.debug("   ✅ Method 2 successful: %s", result)
         except Exception as e:
-            print(f"   ❌ Method 2 failed: {e}")
-        
-        time.sleep(1)  # Rate limit protection
+            logger.warning("   ❌ Method 2 failed: %s", e)
         
         # Method 3: Using direct API call
-        print(f"\n📋 Method 3: Direct API parameters")
+        logger.debug("\n📋 Method 3: Direct API parameters")
         try:
             result = exchange.fapiPrivate_post_leverage({
                 'symbol': test_symbol.replace('/', ''),
                 'leverage': target_leverage
             })
-            print(f"   ✅ Method 3 successful: {result}")
+            logger.debug("   ✅ Method 3 successful: %s", result)
         except Exception as e:
-            print(f"   ❌ Method 3 failed: {e}")
+            logger.warning("   ❌ Method 3 failed: %s", e)
         
         # Test margin mode setting
-        print(f"\n📋 Testing margin mode configuration")
+        logger.debug("\n📋 Testing margin mode configuration")
         try:
             result = exchange.set_margin_mode('isolated', test_symbol)
-            print(f"   ✅ Margin mode set successfully: {result}")
+            logger.debug("   ✅ Margin mode set successfully: %s", result)
         except Exception as e:
-            print(f"   ⚠️  Margin mode: {e}")
+            logger.warning("   ⚠️  Margin mode: %s", e)
         
         # Verify current settings
-        print(f"\n📊 Verifying current configuration...")
+        logger.debug("\n📊 Verifying current configuration...")
         try:
             positions = exchange.fetch_positions([test_symbol])
             for pos in positions:
                 if pos['symbol'] == test_symbol:
-                    print(f"   Symbol: {pos['symbol']}")
-                    print(f"   Margin mode: {pos.get('marginMode', 'unknown')}")
-                    print(f"   Leverage: {pos.get('leverage', 'unknown')}")
+                    logger.debug("   Symbol: %s", pos['symbol'])
+                    logger.debug("   Margin mode: %s", pos.get('marginMode', 'unknown'))
+                    logger.debug("   Leverage: %s", pos.get('leverage', 'unknown'))
                     break
         except Exception as e:
-            print(f"   ⚠️  Could not verify: {e}")
+            logger.warning("   ⚠️  Could not verify: %s", e)
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        logger.warning("❌ Test failed: %s", e)
         import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_leverage_config()
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.WARNING, format="%(message)s")
+    
+    test_leverage_config(make_exchange())
@@ -4,19 +4,15 @@ Test script to verify leverage information functionality
 """
 
 import json
-from trading_bot import TradingBot, BotConfig, Trade
+from trading_bot import Trade
+from tests_helpers import build_test_bot
 from datetime import datetime
 
-def test_leverage_functionality():
+def test_leverage_functionality(bot):
     """Test the leverage functionality"""
     print("Testing leverage functionality...")
     
-    # Create a mock trading bot
     try:
-        config = BotConfig()
-        bot = TradingBot(config)
-        print("✅ Trading bot created successfully")
-        
         # Test the get_position_leverage method
         test_symbol = "BTC/USDT"
         leverage = bot.get_position_leverage(test_symbol)
@@ -60,5 +56,5 @@ def test_leverage_functionality():
         return False
 
 if __name__ == "__main__":
-    success = test_leverage_functionality()
+    success = test_leverage_functionality(build_test_bot())
     print(f"\n{'✅ All tests passed!' if success else '❌ Tests failed!'}")
@@ -4,102 +4,86 @@ Test Position Sizing and Margin Mode
 Verify that the bot correctly uses isolated margin mode and proper position sizes
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from trading_bot import TradingBot, BotConfig
+from trading_bot import TradingBot
+from tests_helpers import make_config
 import logging
+import sys
+import numpy as np
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def test_position_sizing():
     """Test position sizing calculations"""
-    print("🧮 TESTING POSITION SIZING CALCULATIONS")
-    print("=" * 60)
+    logger.debug("🧮 TESTING POSITION SIZING CALCULATIONS")
+    logger.debug("=" * 60)
     
     # Load actual config
     import config
     
     # Create bot configuration
-    bot_config = BotConfig(
-        initial_balance=config.INITIAL_BALANCE,
-        max_trades=config.MAX_TRADES,
-        leverage=config.LEVERAGE,
-        long_position_size=config.LONG_POSITION_SIZE,
-        short_position_size=config.SHORT_POSITION_SIZE,
-        symbols=['BTC/USDT', 'ETH/USDT']
-    )
+    bot_config = make_config(symbols=['BTC/USDT', 'ETH/USDT'])
     
-    print(f"📊 Configuration:")
-    print(f"   Initial Balance: ${bot_config.initial_balance}")
-    print(f"   Leverage: {bot_config.leverage}x")
-    print(f"   Long Position Size: ${bot_config.long_position_size}")
-    print(f"   Short Position Size: ${bot_config.short_position_size}")
-    print()
+    logger.debug("📊 Configuration:")
+    logger.debug("   Initial Balance: $%s", bot_config.initial_balance)
+    logger.debug("   Leverage: %sx", bot_config.leverage)
+    logger.debug("   Long Position Size: $%s", bot_config.long_position_size)
+    logger.debug("   Short Position Size: $%s", bot_config.short_position_size)
+    logger.debug("")
     
     # Test position size calculations
-    test_prices = {
-        'BTC/USDT': 67000.0,
-        'ETH/USDT': 3500.0,
-        'MATIC/USDT': 0.85,
-        'DOGE/USDT': 0.15
-    }
-    
-    print("💰 Position Size Calculations:")
-    print(f"{'Symbol':<12} {'Price':<10} {'USD Size':<10} {'Base Amount':<15} {'Notional Value':<15}")
-    print("-" * 70)
-    
-    for symbol, price in test_prices.items():
-        # Long position calculation
-        long_usd = bot_config.long_position_size
-        long_base_amount = long_usd / price
-        long_notional = long_base_amount * price * bot_config.leverage
-        
-        print(f"{symbol:<12} ${price:<9.2f} ${long_usd:<9.2f} {long_base_amount:<15.8f} ${long_notional:<14.2f}")
-        
-        # Hedge position calculation
-        hedge_usd = bot_config.short_position_size
-        hedge_base_amount = hedge_usd / price
-        hedge_notional = hedge_base_amount * price * bot_config.leverage
-        
-        print(f"{'(Hedge)':<12} ${price:<9.2f} ${hedge_usd:<9.2f} {hedge_base_amount:<15.8f} ${hedge_notional:<14.2f}")
-        print()
-    
-    print("🎯 Expected Behavior:")
-    print(f"   ✅ Long trades should use ${bot_config.long_position_size} USD")
-    print(f"   ✅ Hedge trades should use ${bot_config.short_position_size} USD")
-    print(f"   ✅ Leverage should be {bot_config.leverage}x (isolated margin)")
-    print(f"   ✅ Position amounts should be calculated as: USD_SIZE / PRICE")
-    print(f"   ✅ Exchange applies leverage automatically")
-    print()
+    symbols = ['BTC/USDT', 'ETH/USDT', 'MATIC/USDT', 'DOGE/USDT']
+    prices = np.array([67000.0, 3500.0, 0.85, 0.15])
+    
+    logger.debug("💰 Position Size Calculations:")
+    logger.debug("%-12s %-10s %-10s %-15s %-15s", 'Symbol', 'Price', 'USD Size', 'Base Amount', 'Notional Value')
+    logger.debug("-" * 70)
+    
+    # Long and hedge sizes for every symbol at once
+    long_usd = bot_config.long_position_size
+    long_base = long_usd / prices
+    long_notional = long_base * prices * bot_config.leverage
+    
+    hedge_usd = bot_config.short_position_size
+    hedge_base = hedge_usd / prices
+    hedge_notional = hedge_base * prices * bot_config.leverage
+    
+    for symbol, price, lb, ln, hb, hn in zip(symbols, prices, long_base, long_notional, hedge_base, hedge_notional):
+        logger.debug("%-12s $%-9.2f $%-9.2f %-15.8f $%-14.2f", symbol, price, long_usd, lb, ln)
+        logger.debug("%-12s $%-9.2f $%-9.2f %-15.8f $%-14.2f", '(Hedge)', price, hedge_usd, hb, hn)
+        logger.debug("")
+    
+    logger.debug("🎯 Expected Behavior:")
+    logger.debug("   ✅ Long trades should use $%s USD", bot_config.long_position_size)
+    logger.debug("   ✅ Hedge trades should use $%s USD", bot_config.short_position_size)
+    logger.debug("   ✅ Leverage should be %sx (isolated margin)", bot_config.leverage)
+    logger.debug("   ✅ Position amounts should be calculated as: USD_SIZE / PRICE")
+    logger.debug("   ✅ Exchange applies leverage automatically")
+    logger.debug("")
     
     # Test what the issues might be
-    print("⚠️  Common Issues and Fixes:")
-    print("   1. Cross Margin Mode:")
-    print("      ❌ Problem: Uses cross margin instead of isolated")
-    print("      ✅ Fixed: Added set_margin_mode('isolated') calls")
-    print()
-    print("   2. Incorrect Leverage:")
-    print("      ❌ Problem: Testnet shows 20x instead of 10x")
-    print("      ✅ Fixed: Added set_leverage() calls for each symbol")
-    print()
-    print("   3. Position Size Too Large:")
-    print("      ❌ Problem: $70-80 positions instead of $6-10")
-    print("      ✅ Fixed: Corrected calculation to USD_SIZE / PRICE")
-    print("      ✅ Note: Removed incorrect leverage multiplication")
-    print()
-    print("   4. Order Parameters:")
-    print("      ❌ Problem: Missing marginMode parameter")
-    print("      ✅ Fixed: Added marginMode: 'isolated' to all orders")
-    print()
+    logger.debug("⚠️  Common Issues and Fixes:")
+    logger.debug("   1. Cross Margin Mode:")
+    logger.debug("      ❌ Problem: Uses cross margin instead of isolated")
+    logger.debug("      ✅ Fixed: Added set_margin_mode('isolated') calls")
+    logger.debug("")
+    logger.debug("   2. Incorrect Leverage:")
+    logger.debug("      ❌ Problem: Testnet shows 20x instead of 10x")
+    logger.debug("      ✅ Fixed: Added set_leverage() calls for each symbol")
+    logger.debug("")
+    logger.debug("   3. Position Size Too Large:")
+    logger.debug("      ❌ Problem: $70-80 positions instead of $6-10")
+    logger.debug("      ✅ Fixed: Corrected calculation to USD_SIZE / PRICE")
+    logger.debug("      ✅ Note: Removed incorrect leverage multiplication")
+    logger.debug("")
+    logger.debug("   4. Order Parameters:")
+    logger.debug("      ❌ Problem: Missing marginMode parameter")
+    logger.debug("      ✅ Fixed: Added marginMode: 'isolated' to all orders")
+    logger.debug("")
 
 def test_margin_mode_calls():
     """Test the margin mode configuration"""
-    print("🔧 TESTING MARGIN MODE CONFIGURATION")
-    print("=" * 60)
+    logger.debug("🔧 TESTING MARGIN MODE CONFIGURATION")
+    logger.debug("=" * 60)
     
     # Mock exchange methods
     class MockExchange:
@@ -109,15 +93,16 @@ def test_margin_mode_calls():
             
         def set_margin_mode(self, mode, symbol):
             self.margin_modes[symbol] = mode
-            print(f"   ✅ Set {symbol} margin mode to: {mode}")
+            logger.debug("   ✅ Set %s margin mode to: %s", symbol, mode)
             
         def set_leverage(self, leverage, symbol):
             self.leverages[symbol] = leverage
-            print(f"   ✅ Set {symbol} leverage to: {leverage}x")
+            logger.debug("   ✅ Set %s leverage to: %sx", symbol, leverage)
             
-        def create_market_order(self, symbol, side, amount, params={}):
-            print(f"   📝 Order: {side} {amount:.8f} {symbol}")
-            print(f"      Params: {params}")
+        def create_market_order(self, symbol, side, amount, params=None):
+            params = params if params is not None else {}
+            logger.debug("   📝 Order: %s %.8f %s", side, amount, symbol)
+            logger.debug("      Params: %s", params)
             return {'id': 'test123'}
     
     # Test configuration
@@ -126,13 +111,13 @@ def test_margin_mode_calls():
     
     exchange = MockExchange()
     
-    print("🔧 Configuring margin modes and leverage:")
+    logger.debug("🔧 Configuring margin modes and leverage:")
     for symbol in symbols:
         exchange.set_margin_mode('isolated', symbol)
         exchange.set_leverage(leverage, symbol)
-    print()
+    logger.debug("")
     
-    print("📝 Testing order creation:")
+    logger.debug("📝 Testing order creation:")
     # Test long position
     exchange.create_market_order(
         'BTC/USDT', 'buy', 0.0001,  # Small amount for testing
@@ -141,7 +126,7 @@ def test_margin_mode_calls():
             'marginMode': 'isolated'
         }
     )
-    print()
+    logger.debug("")
     
     # Test hedge position
     exchange.create_market_order(
@@ -151,11 +136,13 @@ def test_margin_mode_calls():
             'marginMode': 'isolated'
         }
     )
-    print()
+    logger.debug("")
     
-    print("✅ Margin mode configuration test complete!")
+    logger.debug("✅ Margin mode configuration test complete!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.WARNING, format="%(message)s")
+    
     test_position_sizing()
     print()
     test_margin_mode_calls()
@@ -3,14 +3,15 @@
 Test Leverage Parameter Format
 """
 
+import logging
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+logger = logging.getLogger(__name__)
 
 def test_leverage_params():
     """Test leverage parameter formatting"""
-    print("🔧 Testing Leverage Parameter Format")
-    print("=" * 40)
+    logger.debug("🔧 Testing Leverage Parameter Format")
+    logger.debug("=" * 40)
     
     try:
         # Load configuration
@@ -19,15 +20,15 @@ def test_leverage_params():
         test_symbol = 'BTC/USDT'
         leverage = config.LEVERAGE
         
-        print(f"Original symbol: {test_symbol}")
-        print(f"Original leverage: {leverage} (type: {type(leverage)})")
+        logger.debug("Original symbol: %s", test_symbol)
+        logger.debug("Original leverage: %s (type: %s)", leverage, type(leverage))
         
         # Convert to Binance format
         symbol_raw = test_symbol.replace('/', '')
         leverage_int = int(leverage)
         
-        print(f"Binance symbol: {symbol_raw}")
-        print(f"Binance leverage: {leverage_int} (type: {type(leverage_int)})")
+        logger.debug("Binance symbol: %s", symbol_raw)
+        logger.debug("Binance leverage: %s (type: %s)", leverage_int, type(leverage_int))
         
         # Show API call format
         api_params = {
@@ -35,24 +36,26 @@ def test_leverage_params():
             'leverage': leverage_int
         }
         
-        print(f"API parameters: {api_params}")
+        logger.debug("API parameters: %s", api_params)
         
         # Test multiple symbols
-        print(f"\nTesting multiple symbols:")
+        logger.debug("\nTesting multiple symbols:")
         test_symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT']
         
         for symbol in test_symbols:
             symbol_raw = symbol.replace('/', '')
-            print(f"  {symbol} -> {symbol_raw}")
+            logger.debug("  %s -> %s", symbol, symbol_raw)
         
-        print(f"\n✅ Parameter format looks correct!")
-        print(f"📋 Fixed issues:")
-        print(f"   • Leverage converted to integer: {leverage} -> {leverage_int}")
-        print(f"   • Symbol format for Binance: BTC/USDT -> BTCUSDT")
-        print(f"   • Using direct API call: fapiPrivate_post_leverage")
+        logger.debug("\n✅ Parameter format looks correct!")
+        logger.debug("📋 Fixed issues:")
+        logger.debug("   • Leverage converted to integer: %s -> %s", leverage, leverage_int)
+        logger.debug("   • Symbol format for Binance: BTC/USDT -> BTCUSDT")
+        logger.debug("   • Using direct API call: fapiPrivate_post_leverage")
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        logger.warning("❌ Test failed: %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.WARNING, format="%(message)s")
+    
     test_leverage_params()
@@ -4,69 +4,70 @@ Test script to verify that DataFrame operations are optimized
 and no performance warnings are generated.
 """
 
+import logging
 import warnings
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 from trading_bot import TradingStrategy, TradingBot
+from tests_helpers import make_ohlc
 import pandas as pd
-import numpy as np
 
-def test_strategy_performance():
+logger = logging.getLogger(__name__)
+
+# Hourly index shared by every mock frame (sliced to length)
+DATES = pd.date_range('2024-01-01', periods=200, freq='h')
+
+def mock_frame(ohlc_data, periods):
+    """Build an OHLCV frame from pre-generated mock data (high/low span all four prices)"""
+    ohlc = ohlc_data['ohlc'][:periods]
+    return pd.DataFrame({
+        'timestamp': DATES[:periods],
+        'open': ohlc[:, 0],
+        'high': ohlc.max(axis=1),
+        'low': ohlc.min(axis=1),
+        'close': ohlc[:, 3],
+        'volume': ohlc_data['volume'][:periods]
+    })
+
+def test_strategy_performance(ohlc_fixture):
     """Test the trading strategy for performance warnings"""
-    print("🧪 Testing Trading Strategy Performance...")
+    logger.debug("🧪 Testing Trading Strategy Performance...")
     
     # Capture warnings
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
         
         # Create demo data
-        dates = pd.date_range('2024-01-01', periods=100, freq='1H')
-        df = pd.DataFrame({
-            'timestamp': dates,
-            'open': np.random.uniform(45000, 55000, 100),
-            'high': np.random.uniform(45000, 55000, 100),
-            'low': np.random.uniform(45000, 55000, 100),
-            'close': np.random.uniform(45000, 55000, 100),
-            'volume': np.random.uniform(100, 1000, 100)
-        })
-        
-        # Fix high/low values
-        df['high'] = df[['open', 'high', 'low', 'close']].max(axis=1)
-        df['low'] = df[['open', 'high', 'low', 'close']].min(axis=1)
+        df = mock_frame(ohlc_fixture, 100)
         
         # Test strategy
         from config import STRATEGY_PARAMS
         
-        class Config:
-            def __init__(self, params):
-                for key, value in params.items():
-                    setattr(self, key, value)
-        
-        config = Config(STRATEGY_PARAMS)
+        config = SimpleNamespace(**STRATEGY_PARAMS)
         strategy = TradingStrategy(config)
         
-        print("   Testing populate_indicators...")
-        df_with_indicators = strategy.populate_indicators(df.copy())
+        logger.debug("   Testing populate_indicators...")
+        df_with_indicators = strategy.populate_indicators(df)
         
-        print("   Testing populate_entry_signals...")
-        df_with_entry = strategy.populate_entry_signals(df_with_indicators.copy())
+        logger.debug("   Testing populate_entry_signals...")
+        df_with_entry = strategy.populate_entry_signals(df_with_indicators)
         
-        print("   Testing populate_exit_signals...")
-        df_final = strategy.populate_exit_signals(df_with_entry.copy())
+        logger.debug("   Testing populate_exit_signals...")
+        df_final = strategy.populate_exit_signals(df_with_entry)
         
         # Check for performance warnings
         performance_warnings = [warning for warning in w 
                               if "PerformanceWarning" in str(warning.category)]
         
         if performance_warnings:
-            print("❌ Performance warnings detected:")
+            logger.warning("❌ Performance warnings detected:")
             for warning in performance_warnings:
-                print(f"   {warning.message}")
+                logger.warning("   %s", warning.message)
             return False
         else:
-            print("✅ No performance warnings detected!")
+            logger.debug("✅ No performance warnings detected!")
             
         # Verify that all expected columns are present
         expected_columns = [
@@ -75,16 +76,16 @@ def test_strategy_performance():
         
         missing_columns = [col for col in expected_columns if col not in df_final.columns]
         if missing_columns:
-            print(f"❌ Missing columns: {missing_columns}")
+            logger.warning("❌ Missing columns: %s", missing_columns)
             return False
         else:
-            print("✅ All expected columns present!")
+            logger.debug("✅ All expected columns present!")
             
         return True
 
-def test_multi_symbol_analysis():
+def test_multi_symbol_analysis(ohlc_fixture):
     """Test multi-symbol analysis for performance"""
-    print("\n🧪 Testing Multi-Symbol Analysis Performance...")
+    logger.debug("\n🧪 Testing Multi-Symbol Analysis Performance...")
     
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
@@ -92,30 +93,14 @@ def test_multi_symbol_analysis():
         # Mock bot for testing
         from config import STRATEGY_PARAMS
         
-        class Config:
-            def __init__(self, params):
-                for key, value in params.items():
-                    setattr(self, key, value)
-        
         class MockBot:
             def __init__(self):
-                config = Config(STRATEGY_PARAMS)
+                config = SimpleNamespace(**STRATEGY_PARAMS)
                 self.strategy = TradingStrategy(config)
                 
             def get_historical_data(self, symbol):
                 """Generate mock data"""
-                dates = pd.date_range('2024-01-01', periods=50, freq='1H')
-                df = pd.DataFrame({
-                    'timestamp': dates,
-                    'open': np.random.uniform(45000, 55000, 50),
-                    'high': np.random.uniform(45000, 55000, 50),
-                    'low': np.random.uniform(45000, 55000, 50),
-                    'close': np.random.uniform(45000, 55000, 50),
-                    'volume': np.random.uniform(100, 1000, 50)
-                })
-                df['high'] = df[['open', 'high', 'low', 'close']].max(axis=1)
-                df['low'] = df[['open', 'high', 'low', 'close']].min(axis=1)
-                return df
+                return mock_frame(ohlc_fixture, 50)
                 
             def analyze_symbol(self, symbol):
                 """Analyze a symbol"""
@@ -128,17 +113,13 @@ def test_multi_symbol_analysis():
                 df = self.strategy.populate_entry_signals(df)
                 df = self.strategy.populate_exit_signals(df)
                 
-                # Create a defragmented copy for better performance if needed
-                df = df.copy()
-                
-                # Get latest signals
-                latest = df.iloc[-1]
-                current_price = latest['close']
+                # Get latest signals (last element of each column, no row Series)
+                current_price = df['close'].to_numpy()[-1]
                 
                 signal = None
-                if latest['enter_long'] == 1:
+                if df['enter_long'].to_numpy()[-1] == 1:
                     signal = 'buy'
-                elif latest['exit_long'] == 1:
+                elif df['exit_long'].to_numpy()[-1] == 1:
                     signal = 'sell'
                 
                 return {
@@ -146,36 +127,40 @@ def test_multi_symbol_analysis():
                     'signal': signal,
                     'price': current_price,
                     'dataframe': df,
-                    'rsi': latest['rsi'],
-                    'ewo': latest['EWO']
+                    'rsi': df['rsi'].to_numpy()[-1],
+                    'ewo': df['EWO'].to_numpy()[-1]
                 }
         
         bot = MockBot()
         test_symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT']
         
-        for symbol in test_symbols:
-            print(f"   Analyzing {symbol}...")
-            result = bot.analyze_symbol(symbol)
-            
+        # Indicator kernels run in compiled code, so symbols are analyzed in parallel
+        logger.debug("   Analyzing %s...", ', '.join(test_symbols))
+        with ThreadPoolExecutor(max_workers=len(test_symbols)) as pool:
+            results = list(pool.map(bot.analyze_symbol, test_symbols))
+        
         # Check for performance warnings
         performance_warnings = [warning for warning in w 
                               if "PerformanceWarning" in str(warning.category)]
         
         if performance_warnings:
-            print("❌ Performance warnings in multi-symbol analysis:")
+            logger.warning("❌ Performance warnings in multi-symbol analysis:")
             for warning in performance_warnings:
-                print(f"   {warning.message}")
+                logger.warning("   %s", warning.message)
             return False
         else:
-            print("✅ Multi-symbol analysis completed without performance warnings!")
+            logger.debug("✅ Multi-symbol analysis completed without performance warnings!")
             return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.WARNING, format="%(message)s")
+    
     print("🚀 Trading Bot Performance Test")
     print("=" * 60)
     
-    strategy_ok = test_strategy_performance()
-    multi_symbol_ok = test_multi_symbol_analysis()
+    ohlc_data = make_ohlc()
+    strategy_ok = test_strategy_performance(ohlc_data)
+    multi_symbol_ok = test_multi_symbol_analysis(ohlc_data)
     
     print("\n📊 Test Results:")
     print("=" * 60)
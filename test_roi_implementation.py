@@ -4,16 +4,12 @@ Test ROI Implementation
 Test the ROI system with different time scenarios
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from trading_bot import TradingBot, BotConfig, Trade
 from datetime import datetime, timedelta
 import logging
+import numpy as np
+import pandas as pd
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def test_roi_implementation():
@@ -43,19 +39,22 @@ def test_roi_implementation():
     # Initialize bot (without starting)
     bot = TradingBot(config)
     
-    print(f"📊 ROI Configuration:")
+    # Each section is built as a list of lines and written with one print
+    out = ["📊 ROI Configuration:"]
     for time_key, roi_value in config.minimal_roi.items():
-        print(f"   {time_key} minutes: {roi_value*100:.0f}% ROI")
-    print()
+        out.append(f"   {time_key} minutes: {roi_value*100:.0f}% ROI")
+    out.append("")
+    print("\n".join(out))
     
     # Test ROI threshold calculation
-    print("🔍 Testing ROI Threshold Calculation:")
-    test_times = [0, 0.5, 1, 2, 5, 8, 10, 15, 25, 30, 45, 60, 90, 120, 150]
+    out = ["🔍 Testing ROI Threshold Calculation:"]
+    test_times = np.array([0, 0.5, 1, 2, 5, 8, 10, 15, 25, 30, 45, 60, 90, 120, 150])
+    thresholds = bot._get_roi_thresholds(test_times)
     
-    for time_minutes in test_times:
-        threshold = bot._get_roi_threshold(time_minutes)
-        print(f"   {time_minutes:6.1f} minutes: {threshold*100:5.1f}% ROI threshold")
-    print()
+    for time_minutes, threshold in zip(test_times.tolist(), thresholds.tolist()):
+        out.append(f"   {time_minutes:6.1f} minutes: {threshold*100:5.1f}% ROI threshold")
+    out.append("")
+    print("\n".join(out))
     
     # Test scenarios with different profit levels and times
     print("💰 Testing ROI Exit Scenarios:")
@@ -72,27 +71,27 @@ def test_roi_implementation():
         {'time_minutes': 120, 'profit_pct': 0.01, 'should_exit': True, 'description': '1% profit after 120 minutes (time exit)'},
     ]
     
-    for scenario in test_scenarios:
-        time_minutes = scenario['time_minutes']
-        profit_pct = scenario['profit_pct']
-        should_exit = scenario['should_exit']
-        description = scenario['description']
-        
-        roi_threshold = bot._get_roi_threshold(time_minutes)
-        would_exit = profit_pct >= roi_threshold
-        
-        status = "✅ PASS" if (would_exit == should_exit) else "❌ FAIL"
-        exit_text = "EXIT" if would_exit else "HOLD"
-        
-        print(f"   {status} {description}")
-        print(f"        Profit: {profit_pct*100:5.1f}% | Threshold: {roi_threshold*100:5.1f}% | Action: {exit_text}")
-        print()
+    # Evaluate every scenario at once and print them as one table
+    scenarios = pd.DataFrame(test_scenarios)
+    scenarios['threshold'] = bot._get_roi_thresholds(scenarios['time_minutes'].to_numpy(dtype=np.float64))
+    scenarios['would_exit'] = scenarios['profit_pct'] >= scenarios['threshold']
+    scenarios['status'] = np.where(scenarios['would_exit'] == scenarios['should_exit'], "✅ PASS", "❌ FAIL")
+    scenarios['action'] = np.where(scenarios['would_exit'], "EXIT", "HOLD")
+    
+    pct = '{:.1%}'.format
+    print(scenarios[['status', 'description', 'profit_pct', 'threshold', 'action']].to_string(
+        index=False,
+        header=['Status', 'Scenario', 'Profit', 'Threshold', 'Action'],
+        formatters={'profit_pct': pct, 'threshold': pct}
+    ))
+    print()
     
     # Simulate a realistic trade scenario
-    print("📈 Simulating Realistic Trade Scenario:")
+    out = ["📈 Simulating Realistic Trade Scenario:"]
     
-    # Create a mock trade
-    entry_time = datetime.now() - timedelta(minutes=25)
+    # Create a mock trade (one clock read serves every scenario below)
+    now = datetime.now()
+    entry_time = now - timedelta(minutes=25)
     test_trade = Trade(
         id="test_001",
         symbol="BTC/USDT",
@@ -114,44 +113,44 @@ def test_roi_implementation():
         {'current_price': 54000, 'description': '8% profit after 25 minutes'},
     ]
     
-    for scenario in price_scenarios:
-        current_price = scenario['current_price']
+    # Evaluate the ROI exit for every price at once (no price mocking needed)
+    time_diff = (now - test_trade.timestamp).total_seconds() / 60
+    prices = np.array([s['current_price'] for s in price_scenarios], dtype=np.float64)
+    entry_prices = np.full(prices.size, test_trade.price)
+    minutes = np.full(prices.size, time_diff)
+    
+    thresholds = bot._get_roi_thresholds(minutes)
+    profits = (prices - entry_prices) / entry_prices
+    decisions = profits >= thresholds
+    
+    for scenario, current_price, profit_pct, roi_threshold, would_exit in zip(
+        price_scenarios, prices.tolist(), profits.tolist(), thresholds.tolist(), decisions.tolist()
+    ):
         description = scenario['description']
         
-        # Mock the price fetching
-        def mock_get_price(symbol):
-            return current_price
-        
-        # Temporarily replace the price fetching method
-        original_get_price = bot._get_current_price
-        bot._get_current_price = mock_get_price
-        
-        # Simulate checking ROI
-        time_diff = (datetime.now() - test_trade.timestamp).total_seconds() / 60
-        profit_pct = (current_price - test_trade.price) / test_trade.price
-        roi_threshold = bot._get_roi_threshold(time_diff)
-        
-        would_exit = profit_pct >= roi_threshold
         exit_text = "🚪 EXIT" if would_exit else "📊 HOLD"
         
-        print(f"   {description}")
-        print(f"      Time in trade: {time_diff:.1f} minutes")
-        print(f"      Current price: ${current_price:,.2f}")
-        print(f"      Profit: {profit_pct*100:.1f}%")
-        print(f"      ROI threshold: {roi_threshold*100:.1f}%")
-        print(f"      Decision: {exit_text}")
-        print()
-        
-        # Restore original method
-        bot._get_current_price = original_get_price
+        out.extend([
+            f"   {description}",
+            f"      Time in trade: {time_diff:.1f} minutes",
+            f"      Current price: ${current_price:,.2f}",
+            f"      Profit: {profit_pct*100:.1f}%",
+            f"      ROI threshold: {roi_threshold*100:.1f}%",
+            f"      Decision: {exit_text}",
+            "",
+        ])
+    print("\n".join(out))
     
-    print("🎯 ROI Implementation Test Complete!")
-    print()
-    print("📝 Summary:")
-    print("   ✅ ROI threshold calculation working correctly")
-    print("   ✅ Time-based ROI adjustments functioning")
-    print("   ✅ Exit logic properly implemented")
-    print("   ✅ Ready for live trading with ROI protection")
+    print("\n".join([
+        "🎯 ROI Implementation Test Complete!",
+        "",
+        "📝 Summary:",
+        "   ✅ ROI threshold calculation working correctly",
+        "   ✅ Time-based ROI adjustments functioning",
+        "   ✅ Exit logic properly implemented",
+        "   ✅ Ready for live trading with ROI protection",
+    ]))
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     test_roi_implementation()
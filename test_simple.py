@@ -1,32 +1,27 @@
 #!/usr/bin/env python3
 """
-Simple Binance Testnet Connection Test (non-async)
+Simple Binance Testnet Connection Test
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-import ccxt
+import asyncio
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def test_simple_connection():
-    """Test connection to Binance testnet"""
+async def _simple_connection():
+    """Connect to Binance testnet and fetch the test tickers concurrently"""
     
     print("🔌 SIMPLE BINANCE TESTNET TEST")
     print("=" * 50)
     
     try:
-        # Load configuration
+        # Load configuration (and ccxt, only when the test actually runs)
+        import ccxt.async_support as ccxt_async
         import config
         print("✅ Config loaded successfully")
         
-        # Initialize exchange (sync version)
-        exchange = ccxt.binance({
+        # Initialize exchange (async client, so the tickers can be fetched together)
+        exchange = ccxt_async.binance({
             'apiKey': config.BINANCE_TESTNET_API_KEY,
             'secret': config.BINANCE_TESTNET_SECRET,
             'sandbox': True,
@@ -38,33 +33,39 @@ def test_simple_connection():
         
         print("✅ Exchange initialized")
         
-        # Test basic connection
         try:
-            balance = exchange.fetch_balance()
-            print(f"✅ Connected to Binance testnet successfully")
-            print(f"💰 USDT Balance: {balance.get('USDT', {}).get('free', 0):.2f}")
-        except Exception as e:
-            print(f"❌ Connection failed: {e}")
-            return
-        
-        # Test symbol prices
-        print("\n📊 Current Prices:")
-        test_symbols = ['BTC/USDT', 'ETH/USDT']
-        
-        for symbol in test_symbols:
+            # Test basic connection
             try:
-                ticker = exchange.fetch_ticker(symbol)
-                print(f"   {symbol}: ${ticker['last']:,.2f}")
-                
-                # Calculate position sizes
-                long_amount = config.LONG_POSITION_SIZE / ticker['last']
-                hedge_amount = config.SHORT_POSITION_SIZE / ticker['last']
-                
-                print(f"     Long: ${config.LONG_POSITION_SIZE} = {long_amount:.8f}")
-                print(f"     Hedge: ${config.SHORT_POSITION_SIZE} = {hedge_amount:.8f}")
-                
+                balance = await exchange.fetch_balance()
+                print(f"✅ Connected to Binance testnet successfully")
+                print(f"💰 USDT Balance: {balance.get('USDT', {}).get('free', 0):.2f}")
             except Exception as e:
-                print(f"   ❌ Failed to get {symbol}: {e}")
+                print(f"❌ Connection failed: {e}")
+                return
+            
+            # Test symbol prices
+            print("\n📊 Current Prices:")
+            test_symbols = ['BTC/USDT', 'ETH/USDT']
+            tickers = await asyncio.gather(
+                *(exchange.fetch_ticker(s) for s in test_symbols),
+                return_exceptions=True
+            )
+        finally:
+            await exchange.close()
+        
+        for symbol, ticker in zip(test_symbols, tickers):
+            if isinstance(ticker, Exception):
+                print(f"   ❌ Failed to get {symbol}: {ticker}")
+                continue
+            
+            print(f"   {symbol}: ${ticker['last']:,.2f}")
+            
+            # Calculate position sizes
+            long_amount = config.LONG_POSITION_SIZE / ticker['last']
+            hedge_amount = config.SHORT_POSITION_SIZE / ticker['last']
+            
+            print(f"     Long: ${config.LONG_POSITION_SIZE} = {long_amount:.8f}")
+            print(f"     Hedge: ${config.SHORT_POSITION_SIZE} = {hedge_amount:.8f}")
         
         print("\n✅ BASIC CONNECTION TEST PASSED")
         print("\n🎯 Configuration Summary:")
@@ -79,5 +80,10 @@ def test_simple_connection():
         import traceback
         traceback.print_exc()
 
+def test_simple_connection():
+    """Test connection to Binance testnet"""
+    asyncio.run(_simple_connection())
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     test_simple_connection()
@@ -2,16 +2,20 @@
 
 import asyncio
 import sys
-import os
+from datetime import datetime
 
-# Add current directory to path to import telegram_bot
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Notifications in flight at once (well under Telegram's flood limit;
+# 429s are still handled by TelegramBot.send_message)
+MAX_CONCURRENT_SENDS = 3
 
-from telegram_bot import telegram_bot
-from datetime import datetime
+async def _bounded(sem, coro):
+    """Await coro while holding a slot of sem"""
+    async with sem:
+        return await coro
 
 async def test_telegram_bot():
     """Test Telegram bot functionality with sample data"""
+    from telegram_bot import telegram_bot, close_all
     
     print("🤖 Testing Telegram Bot Integration")
     print("=" * 50)
@@ -33,123 +37,100 @@ async def test_telegram_bot():
     print(f"Bot Token: {telegram_bot.bot_token[:10]}...")
     print(f"Chat ID: {telegram_bot.chat_id}")
     
-    # Test connection
-    print("\n📡 Testing connection...")
-    if await telegram_bot.test_connection():
-        print("✅ Connection test successful!")
-    else:
-        print("❌ Connection test failed!")
-        return
-    
-    # Test trade entry notification
-    print("\n📈 Testing trade entry notification...")
-    sample_trade_entry = {
-        'symbol': 'BTC/USDT',
-        'side': 'buy',
-        'amount': 0.001,
-        'price': 45000.0,
-        'timestamp': datetime.now().timestamp(),
-        'entry_reason': 'Strong bullish EWO signal detected with favorable RSI conditions and SMA crossover confirmation',
-        'technical_indicators': {
-            'rsi': 62.5,
-            'sma_fast': 44950.0,
-            'sma_slow': 44800.0,
-            'macd_signal': 'bullish'
-        },
-        'market_conditions': {
-            'trend': 'uptrend',
-            'volatility': 'moderate',
-            'volume_profile': 'high'
+    # One HTTP client for every send below, closed when the test ends
+    await telegram_bot.start()
+    try:
+        # Test connection
+        print("\n📡 Testing connection...")
+        if await telegram_bot.test_connection():
+            print("✅ Connection test successful!")
+        else:
+            print("❌ Connection test failed!")
+            return
+        
+        now_ts = datetime.now().timestamp()
+        
+        # Sample trade entry
+        sample_trade_entry = {
+            'symbol': 'BTC/USDT',
+            'side': 'buy',
+            'amount': 0.001,
+            'price': 45000.0,
+            'timestamp': now_ts,
+            'entry_reason': 'Strong bullish EWO signal detected with favorable RSI conditions and SMA crossover confirmation',
+            'technical_indicators': {
+                'rsi': 62.5,
+                'sma_fast': 44950.0,
+                'sma_slow': 44800.0,
+                'macd_signal': 'bullish'
+            },
+            'market_conditions': {
+                'trend': 'uptrend',
+                'volatility': 'moderate',
+                'volume_profile': 'high'
+            }
         }
-    }
-    
-    if await telegram_bot.send_trade_entry(sample_trade_entry):
-        print("✅ Trade entry notification sent!")
-    else:
-        print("❌ Failed to send trade entry notification")
-    
-    # Wait a moment between messages
-    await asyncio.sleep(2)
-    
-    # Test trade exit notification
-    print("\n📉 Testing trade exit notification...")
-    sample_trade_exit = {
-        'symbol': 'BTC/USDT',
-        'side': 'buy',
-        'amount': 0.001,
-        'price': 45000.0,
-        'exit_price': 46350.0,
-        'timestamp': datetime.now().timestamp(),
-        'exit_timestamp': datetime.now().timestamp(),
-        'pnl': 13.5,
-        'pnl_percentage': 3.0,
-        'exit_reason': 'Profit target reached: 3% gain achieved with strong momentum continuation'
-    }
-    
-    if await telegram_bot.send_trade_exit(sample_trade_exit):
-        print("✅ Trade exit notification sent!")
-    else:
-        print("❌ Failed to send trade exit notification")
-    
-    # Wait a moment between messages
-    await asyncio.sleep(2)
-    
-    # Test hedge completion notification
-    print("\n🔄 Testing hedge completion notification...")
-    sample_long_trade = {
-        'symbol': 'ETH/USDT',
-        'side': 'buy',
-        'price': 3000.0,
-        'exit_price': 2850.0,
-        'pnl': -15.0
-    }
-    
-    sample_short_trade = {
-        'symbol': 'ETH/USDT',
-        'side': 'sell',
-        'price': 2850.0,
-        'exit_price': 2800.0,
-        'pnl': 17.5
-    }
-    
-    if await telegram_bot.send_hedge_completion(sample_long_trade, sample_short_trade, 2.5):
-        print("✅ Hedge completion notification sent!")
-    else:
-        print("❌ Failed to send hedge completion notification")
-    
-    # Wait a moment between messages
-    await asyncio.sleep(2)
-    
-    # Test error notification
-    print("\n🚨 Testing error notification...")
-    if await telegram_bot.send_error("Sample error for testing", "Test context"):
-        print("✅ Error notification sent!")
-    else:
-        print("❌ Failed to send error notification")
-    
-    # Wait a moment between messages
-    await asyncio.sleep(2)
-    
-    # Test status notification
-    print("\n📊 Testing status notification...")
-    if await telegram_bot.send_bot_status("running", 30.0, 2, 15.75):
-        print("✅ Status notification sent!")
-    else:
-        print("❌ Failed to send status notification")
-    
-    # Wait a moment between messages
-    await asyncio.sleep(2)
-    
-    # Test daily summary
-    print("\n📅 Testing daily summary...")
-    if await telegram_bot.send_daily_summary(8, 45.25, 75.0, 22.50, -8.25):
-        print("✅ Daily summary sent!")
-    else:
-        print("❌ Failed to send daily summary")
-    
-    print("\n" + "=" * 50)
-    print("🎉 Telegram bot testing completed!")
-    print("\nIf all tests passed, your Telegram bot is ready for live trading notifications!")
+        
+        # Sample trade exit
+        sample_trade_exit = {
+            'symbol': 'BTC/USDT',
+            'side': 'buy',
+            'amount': 0.001,
+            'price': 45000.0,
+            'exit_price': 46350.0,
+            'timestamp': now_ts,
+            'exit_timestamp': now_ts,
+            'pnl': 13.5,
+            'pnl_percentage': 3.0,
+            'exit_reason': 'Profit target reached: 3% gain achieved with strong momentum continuation'
+        }
+        
+        # Sample hedge pair
+        sample_long_trade = {
+            'symbol': 'ETH/USDT',
+            'side': 'buy',
+            'price': 3000.0,
+            'exit_price': 2850.0,
+            'pnl': -15.0
+        }
+        
+        sample_short_trade = {
+            'symbol': 'ETH/USDT',
+            'side': 'sell',
+            'price': 2850.0,
+            'exit_price': 2800.0,
+            'pnl': 17.5
+        }
+        
+        # Send every notification concurrently, a few at a time
+        print("\n📨 Sending test notifications...")
+        sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        notifications = [
+            ("Trade entry notification", telegram_bot.send_trade_entry(sample_trade_entry)),
+            ("Trade exit notification", telegram_bot.send_trade_exit(sample_trade_exit)),
+            ("Hedge completion notification", telegram_bot.send_hedge_completion(sample_long_trade, sample_short_trade, 2.5)),
+            ("Error notification", telegram_bot.send_error("Sample error for testing", "Test context")),
+            ("Status notification", telegram_bot.send_bot_status("running", 30.0, 2, 15.75)),
+            ("Daily summary", telegram_bot.send_daily_summary(8, 45.25, 75.0, 22.50, -8.25)),
+        ]
+        results = await asyncio.gather(
+            *(_bounded(sem, coro) for _, coro in notifications),
+            return_exceptions=True
+        )
+        
+        for (name, _), result in zip(notifications, results):
+            if result is True:
+                print(f"✅ {name} sent!")
+            elif isinstance(result, Exception):
+                print(f"❌ Failed to send {name.lower()}: {result}")
+            else:
+                print(f"❌ Failed to send {name.lower()}")
+        
+        print("\n" + "=" * 50)
+        print("🎉 Telegram bot testing completed!")
+        print("\nIf all tests passed, your Telegram bot is ready for live trading notifications!")
+    finally:
+        await close_all()
 
 def print_setup_instructions():
     """Print setup instructions for Telegram bot"""
@@ -3,15 +3,9 @@
 Test Telegram Entry Signal Configuration
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 import asyncio
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def test_telegram_config():
@@ -88,4 +82,5 @@ def main():
     asyncio.run(test_telegram_config())
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
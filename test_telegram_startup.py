@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
 import asyncio
-import sys
-import os
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Notifications in flight at once (429s are still handled by the notifier)
+MAX_CONCURRENT_SENDS = 3
+
+async def _bounded(sem, coro):
+    """Await coro while holding a slot of sem"""
+    async with sem:
+        return await coro
 
 async def test_telegram_startup_messages():
     """Test Telegram startup messages functionality"""
@@ -52,25 +55,22 @@ async def test_telegram_startup_messages():
             print("❌ Failed to send startup message")
             return
         
-        # Wait before next message
-        await asyncio.sleep(3)
-        
-        # Test bot ready message
-        print("\n✅ Sending bot ready message...")
+        # Bot ready message and health check are independent, send them together
+        print("\n✅ Sending bot ready message and health check...")
         test_symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'ADA/USDT', 'SOL/USDT']
-        success = await send_bot_ready_notification(len(test_symbols), test_symbols)
-        if success:
+        sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        ready_ok, health_ok = await asyncio.gather(
+            _bounded(sem, send_bot_ready_notification(len(test_symbols), test_symbols)),
+            _bounded(sem, send_health_check_notification()),
+            return_exceptions=True
+        )
+        
+        if ready_ok is True:
             print("✅ Bot ready message sent successfully!")
         else:
             print("❌ Failed to send bot ready message")
         
-        # Wait before next message
-        await asyncio.sleep(3)
-        
-        # Test health check
-        print("\n💓 Sending health check...")
-        success = await send_health_check_notification()
-        if success:
+        if health_ok is True:
             print("✅ Health check sent successfully!")
         else:
             print("❌ Failed to send health check")
@@ -4,62 +4,39 @@ Simple test to verify web interface starts with Freqtrade-style charts
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def test_web_interface():
+def test_web_interface(btc_analysis):
     """Test web interface startup"""
     print("🧪 Testing Web Interface with Freqtrade Charts")
     print("=" * 50)
     
     try:
         # Import main components
-        from web_interface import app, create_candlestick_chart
-        from trading_bot import TradingBot, BotConfig
+        from web_interface import app, build_candlestick_figure
         from config import STRATEGY_PARAMS
         
         print("✅ All imports successful")
         
-        # Create bot instance
-        config = BotConfig()
-        bot = TradingBot(config)
-        print("✅ Trading bot created")
-        
         # Test data analysis
-        analysis = bot.analyze_symbol('BTC/USDT')
+        analysis = btc_analysis
         if analysis and 'dataframe' in analysis:
             print(f"✅ Symbol analysis successful: {len(analysis['dataframe'])} data points")
             
-            # Test chart creation
-            chart_json = create_candlestick_chart(analysis)
-            if chart_json:
+            # Test chart creation (the Figure itself, no JSON round-trip)
+            fig = build_candlestick_figure(analysis)
+            if fig is not None:
                 print("✅ Freqtrade-style chart created successfully")
                 
                 # Basic validation
-                import json
-                chart_data = json.loads(chart_json)
+                print(f"✅ Chart has {len(fig.data)} traces")
                 
-                if 'error' in chart_data:
-                    print(f"❌ Chart error: {chart_data['error']}")
+                # Check for candlestick trace
+                if any(trace.type == 'candlestick' for trace in fig.data):
+                    print("✅ Candlestick trace found in chart")
+                else:
+                    print("❌ No candlestick trace found")
                     return False
                 
-                if 'data' in chart_data:
-                    traces = len(chart_data['data'])
-                    print(f"✅ Chart has {traces} traces")
-                    
-                    # Check for candlestick trace
-                    candlestick_found = False
-                    for trace in chart_data['data']:
-                        if trace.get('type') == 'candlestick':
-                            candlestick_found = True
-                            break
-                    
-                    if candlestick_found:
-                        print("✅ Candlestick trace found in chart")
-                    else:
-                        print("❌ No candlestick trace found")
-                        return False
-                
                 print("✅ Chart validation passed")
             else:
                 print("❌ Chart creation failed")
@@ -86,7 +63,10 @@ def test_web_interface():
         return False
 
 if __name__ == "__main__":
-    success = test_web_interface()
+    from tests_helpers import build_test_bot
+    bot = build_test_bot()
+    print("✅ Trading bot created")
+    success = test_web_interface(bot.analyze_symbol('BTC/USDT'))
     if success:
         print("\n✅ All tests passed!")
     else:
@@ -30,7 +30,8 @@ def test_api_trades():
             if response.status_code == 200:
                 data = response.get_json()
                 print("✅ API response structure:")
-                print(json.dumps(data, indent=2)[:500] + "..." if len(json.dumps(data)) > 500 else json.dumps(data, indent=2))
+                blob = json.dumps(data, indent=2)
+                print(blob[:500] + "..." if len(blob) > 500 else blob)
             else:
                 print(f"❌ API call failed: {response.status_code}")
         
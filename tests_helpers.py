@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Builders shared by the test scripts and the conftest fixtures
+"""
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Keep numba's on-disk kernel cache in the project so CI can persist it
+# (must be set before trading_bot imports numba)
+NUMBA_CACHE_DIR = Path(__file__).parent / '.numba_cache'
+NUMBA_CACHE_DIR.mkdir(exist_ok=True)
+os.environ.setdefault('NUMBA_CACHE_DIR', str(NUMBA_CACHE_DIR))
+
+import numpy as np
+
+# ccxt, trading_bot and config are imported inside the builders, so collecting
+# tests that never build a bot or exchange doesn't pay for them
+if TYPE_CHECKING:
+    import ccxt
+    from trading_bot import BotConfig, TradingBot
+
+
+def common_bot_kwargs() -> dict:
+    """BotConfig fields taken from config.py, shared by the test scripts"""
+    import config
+    return dict(
+        initial_balance=config.INITIAL_BALANCE,
+        max_trades=config.MAX_TRADES,
+        leverage=config.LEVERAGE,
+        timeframe=config.TIMEFRAME,
+
+        # Hedging parameters
+        initial_trade_size=config.INITIAL_TRADE_SIZE,
+        long_position_size=config.LONG_POSITION_SIZE,
+        short_position_size=config.SHORT_POSITION_SIZE,
+        hedge_trigger_loss=config.HEDGE_TRIGGER_LOSS,
+        one_trade_per_pair=config.ONE_TRADE_PER_PAIR,
+        exit_when_hedged=config.EXIT_WHEN_HEDGED,
+        min_hedge_profit_ratio=config.MIN_HEDGE_PROFIT_RATIO,
+
+        # ROI and trailing stop
+        minimal_roi=config.MINIMAL_ROI,
+        trailing_stop=config.TRAILING_STOP,
+        trailing_stop_positive=config.TRAILING_STOP_POSITIVE,
+        trailing_stop_positive_offset=config.TRAILING_STOP_POSITIVE_OFFSET,
+
+        # Telegram
+        telegram_enabled=False  # Disable for testing
+    )
+
+
+def make_config(**overrides) -> "BotConfig":
+    """BotConfig from config.py with per-test overrides"""
+    from trading_bot import BotConfig
+    return BotConfig(**{**common_bot_kwargs(), **overrides})
+
+
+def make_exchange() -> "ccxt.binance":
+    """Binance testnet futures client with markets loaded (through the disk cache)"""
+    import ccxt
+    import config
+    from markets_cache import load_markets_cached
+
+    exchange = ccxt.binance({
+        'apiKey': config.BINANCE_TESTNET_API_KEY,
+        'secret': config.BINANCE_TESTNET_SECRET,
+        'sandbox': True,
+        'enableRateLimit': True,
+        'options': {
+            'defaultType': 'future'
+        }
+    })
+    load_markets_cached(exchange)
+    return exchange
+
+
+def build_test_bot(exchange=None) -> "TradingBot":
+    """Create a TradingBot from config.py with Telegram disabled"""
+    import config
+    from trading_bot import TradingBot
+    return TradingBot(make_config(symbols=config.TRADING_SYMBOLS[:5]), exchange)  # Use first 5 symbols for testing
+
+
+def make_ohlc(n: int = 200, seed: int = 0) -> dict:
+    """Mock OHLC prices as one contiguous (n, 4) array, plus volume"""
+    rng = np.random.default_rng(seed)
+    return {
+        'ohlc': np.ascontiguousarray(rng.uniform(45000, 55000, size=(n, 4))),
+        'volume': rng.uniform(100, 1000, n)
+    }
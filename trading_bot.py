@@ -5,19 +5,29 @@ Converts the strategy to work with CCXT and Binance Testnet
 """
 
 import ccxt
+import ccxt.async_support as ccxt_async
 import pandas as pd
 import numpy as np
-import talib.abstract as ta
 import time
 import logging
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict, field
-from functools import reduce
 import asyncio
+import copy
 import threading
 
+from _hedge_math import eval_hedge
+from _roi import evaluate_exit, roi_threshold, roi_thresholds
+from markets_cache import load_markets_cached, load_markets_from_cache, save_markets_to_cache
+
+# Indicator kernels: AOT-built extension when available (see _indicators_aot.py), else JIT
+try:
+    from _indicators_native import ema, ewo, rsi
+except ImportError:
+    from _indicators import ema, ewo, rsi
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,7 +41,8 @@ logger = logging.getLogger(__name__)
 
 # Import telegram bot for notifications
 try:
-    from telegram_bot import telegram_bot, send_trade_entry_notification, send_trade_exit_notification, send_hedge_completion_notification, send_error_notification, send_bot_status_notification
+    from telegram_bot import send_trade_entry_notification, send_trade_exit_notification, send_hedge_completion_notification, send_error_notification, send_bot_status_notification
+    from telegram_bot import run_coroutine as run_telegram_coroutine, shutdown as shutdown_telegram
     TELEGRAM_AVAILABLE = True
 except ImportError:
     TELEGRAM_AVAILABLE = False
@@ -44,6 +55,9 @@ try:
 except ImportError:
     TELEGRAM_ENHANCED_AVAILABLE = False
 
+# Seconds before a cached position leverage is read from the exchange again
+LEVERAGE_CACHE_TTL = 300
+
 @dataclass
 class Trade:
     """Trade data structure with detailed entry/exit reasons"""
@@ -165,14 +179,17 @@ class BotConfig:
                 "90": 0.01,   # 1% ROI after 90 minutes
                 "120": 0      # Exit after 120 minutes (2 hours)
             }
+        
+        # ROI table as sorted breakpoints (minutes) and thresholds, built once for the roi_threshold kernel
+        items = sorted((int(k), float(v)) for k, v in self.minimal_roi.items())
+        self._roi_keys = np.fromiter((k for k, _ in items), dtype=np.int64, count=len(items))
+        self._roi_vals = np.fromiter((v for _, v in items), dtype=np.float64, count=len(items))
 
 def EWO(dataframe: pd.DataFrame, ema_length: int = 5, ema2_length: int = 35) -> pd.Series:
     """Elliott Wave Oscillator"""
-    df = dataframe.copy()
-    ema1 = ta.SMA(df, timeperiod=ema_length)
-    ema2 = ta.SMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
+    # float32 is the only dtype the AOT-built _indicators_native kernels accept
+    close = dataframe['close'].to_numpy(dtype=np.float32)
+    return pd.Series(ewo(close, ema_length, ema2_length), index=dataframe.index, dtype=np.float64)
 
 class TradingStrategy:
     """Trading strategy based on Freqtrade ElliotV5_SMA"""
@@ -184,68 +201,48 @@ class TradingStrategy:
         """Populate technical indicators"""
         # Create only the specific moving averages needed by the strategy
         ma_columns = {}
+        close = dataframe['close'].to_numpy(dtype=np.float32)  # Indicators are stored as float32
         
         # Calculate only the specific buy and sell moving averages from config
-        ma_columns[f'ma_buy_{self.config.base_nb_candles_buy}'] = ta.EMA(dataframe, timeperiod=self.config.base_nb_candles_buy)
-        ma_columns[f'ma_sell_{self.config.base_nb_candles_sell}'] = ta.EMA(dataframe, timeperiod=self.config.base_nb_candles_sell)
+        ma_columns[f'ma_buy_{self.config.base_nb_candles_buy}'] = ema(close, self.config.base_nb_candles_buy)
+        ma_columns[f'ma_sell_{self.config.base_nb_candles_sell}'] = ema(close, self.config.base_nb_candles_sell)
         
         # Calculate other indicators
-        ma_columns['EWO'] = EWO(dataframe, self.config.fast_ewo, self.config.slow_ewo)
-        ma_columns['rsi'] = ta.RSI(dataframe, timeperiod=14)
+        ma_columns['EWO'] = ewo(close, self.config.fast_ewo, self.config.slow_ewo)
+        ma_columns['rsi'] = rsi(close, 14)
         
         # Combine all columns at once using pd.concat to avoid fragmentation
-        ma_df = pd.DataFrame(ma_columns, index=dataframe.index)
-        dataframe = pd.concat([dataframe, ma_df], axis=1)
-        
-        return dataframe
+        return pd.concat([dataframe, pd.DataFrame(ma_columns, index=dataframe.index)], axis=1)
     
     def populate_entry_signals(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         """Generate entry signals"""
-        conditions = []
-        price_above_threshold = dataframe['close'] > 0.5
+        close = dataframe['close'].to_numpy(dtype=np.float32)
+        ewo_v = dataframe['EWO'].to_numpy()
+        rsi_v = dataframe['rsi'].to_numpy()
+        volume_ok = dataframe['volume'].to_numpy() > 0
+        below_ma_buy = close < dataframe[f'ma_buy_{self.config.base_nb_candles_buy}'].to_numpy() * np.float32(self.config.low_offset)
+        base = np.logical_and.reduce((close > 0.5, below_ma_buy, volume_ok))
         
         # Condition 1: EWO high
-        conditions.append(
-            (price_above_threshold) &
-            (dataframe['close'] < (dataframe[f'ma_buy_{self.config.base_nb_candles_buy}'] * self.config.low_offset)) &
-            (dataframe['EWO'] > self.config.ewo_high) &
-            (dataframe['rsi'] < self.config.rsi_buy) &
-            (dataframe['volume'] > 0)
-        )
+        ewo_high = np.logical_and.reduce((base, ewo_v > self.config.ewo_high, rsi_v < self.config.rsi_buy))
         
         # Condition 2: EWO low
-        conditions.append(
-            (price_above_threshold) &
-            (dataframe['close'] < (dataframe[f'ma_buy_{self.config.base_nb_candles_buy}'] * self.config.low_offset)) &
-            (dataframe['EWO'] < self.config.ewo_low) &
-            (dataframe['volume'] > 0)
-        )
-        
-        # Create signal column efficiently
-        enter_long = pd.Series(0, index=dataframe.index, name='enter_long')
-        if conditions:
-            enter_long.loc[reduce(lambda x, y: x | y, conditions)] = 1
+        ewo_low = base & (ewo_v < self.config.ewo_low)
         
         # Add signal column using concat to avoid fragmentation
+        enter_long = pd.Series((ewo_high | ewo_low).astype(np.int8), index=dataframe.index, name='enter_long')
         dataframe = pd.concat([dataframe, enter_long], axis=1)
         
         return dataframe
     
     def populate_exit_signals(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         """Generate exit signals"""
-        conditions = []
-        
-        conditions.append(
-            (dataframe['close'] > (dataframe[f'ma_sell_{self.config.base_nb_candles_sell}'] * self.config.high_offset)) &
-            (dataframe['volume'] > 0)
-        )
-        
-        # Create signal column efficiently
-        exit_long = pd.Series(0, index=dataframe.index, name='exit_long')
-        if conditions:
-            exit_long.loc[reduce(lambda x, y: x | y, conditions)] = 1
+        above_ma_sell = (dataframe['close'].to_numpy(dtype=np.float32) >
+                         dataframe[f'ma_sell_{self.config.base_nb_candles_sell}'].to_numpy() * np.float32(self.config.high_offset))
+        mask = above_ma_sell & (dataframe['volume'].to_numpy() > 0)
         
         # Add signal column using concat to avoid fragmentation
+        exit_long = pd.Series(mask.astype(np.int8), index=dataframe.index, name='exit_long')
         dataframe = pd.concat([dataframe, exit_long], axis=1)
         
         return dataframe
@@ -253,7 +250,7 @@ class TradingStrategy:
 class TradingBot:
     """Main trading bot class with hedging strategy"""
     
-    def __init__(self, config: BotConfig):
+    def __init__(self, config: BotConfig, exchange=None):
         self.config = config
         self.strategy = TradingStrategy(config)
         self.exchange = None
@@ -262,30 +259,30 @@ class TradingBot:
         self.balance = config.initial_balance
         self.is_running = False
         self.data_cache = {}
+        self._leverage_cache: Dict[str, Tuple[float, float]] = {}  # symbol -> (leverage, expiry), refreshed whenever we set it
         self.telegram_enabled = TELEGRAM_AVAILABLE and getattr(config, 'TELEGRAM_ENABLED', False)
         
-        # Initialize exchange
-        self._init_exchange()
+        # Async twin of self.exchange for batch OHLCV fetches, bound to the loop it was created on
+        self._async_exchange = None
+        self._async_exchange_loop = None
+        
+        # ROI table precompiled by BotConfig
+        self._roi_keys = config._roi_keys
+        self._roi_vals = config._roi_vals
+        
+        # Initialize exchange (or reuse an already connected one)
+        if exchange is not None:
+            self.exchange = exchange
+        else:
+            self._init_exchange()
     
     def _run_async_telegram_task(self, coro):
         """Helper function to run async Telegram tasks safely"""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is running, schedule the task
-                asyncio.create_task(coro)
-            else:
-                # If no loop is running, create new one
-                loop.run_until_complete(coro)
-        except RuntimeError:
-            # If no event loop, create a new one
-            try:
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                new_loop.run_until_complete(coro)
-                new_loop.close()
-            except Exception as e:
-                logger.error(f"Error running async Telegram task: {e}")
+            # Sends share telegram_bot's long-lived loop and its connection pool
+            run_telegram_coroutine(coro)
+        except Exception as e:
+            logger.error(f"Error running async Telegram task: {e}")
     
     def _init_exchange(self):
         """Initialize CCXT exchange connection"""
@@ -316,6 +313,9 @@ class TradingBot:
                 }
             })
             
+            # Market metadata from disk when fresh (every private call needs it)
+            load_markets_cached(self.exchange)
+            
             # Test connection
             balance = self.exchange.fetch_balance()
             logger.info("Successfully connected to Binance Testnet")
@@ -354,8 +354,10 @@ class TradingBot:
                         except Exception as ccxt_error:
                             logger.error(f"Both leverage methods failed for {symbol}: {ccxt_error}")
                             raise ccxt_error
+                    self._cache_leverage(symbol, float(self.config.leverage))
                     
                 except Exception as e:
+                    self._leverage_cache.pop(symbol, None)  # Leverage on the exchange is unknown now
                     logger.warning(f"Could not configure {symbol}: {e}")
                     
         except Exception as e:
@@ -398,6 +400,7 @@ class TradingBot:
                 logger.warning(f"Direct API failed for {symbol}, trying CCXT method: {leverage_error}")
                 self.exchange.set_leverage(int(self.config.leverage), symbol)
                 logger.info(f"Configured {symbol}: {self.config.leverage}x isolated margin via CCXT")
+            self._cache_leverage(symbol, float(self.config.leverage))
             return True
             
         except Exception as e:
@@ -529,7 +532,7 @@ class TradingBot:
                     data.append([timestamp, open_price, high_price, low_price, close_price, volume])
                 return list(reversed(data))
             
-            def create_market_order(self, symbol, side, amount, params={}):
+            def create_market_order(self, symbol, side, amount, params=None):
                 return {
                     'id': f'mock_{int(time.time())}',
                     'symbol': symbol,
@@ -549,17 +552,79 @@ class TradingBot:
         """Fetch historical OHLCV data"""
         try:
             ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            return df
+            return self._ohlcv_to_dataframe(ohlcv)
         except Exception as e:
             logger.error(f"Error fetching data for {symbol}: {e}")
             return pd.DataFrame()
     
-    def analyze_symbol(self, symbol: str) -> Dict:
-        """Analyze a symbol and return signals"""
-        df = self.get_historical_data(symbol)
+    @staticmethod
+    def _ohlcv_to_dataframe(ohlcv) -> pd.DataFrame:
+        """Convert a CCXT OHLCV list to a timestamp-indexed DataFrame"""
+        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        df.set_index('timestamp', inplace=True)
+        return df
+    
+    async def fetch_all(self, symbols: List[str], timeframe: str = '5m', limit: int = 200) -> Dict[str, pd.DataFrame]:
+        """Fetch historical OHLCV data for several symbols concurrently"""
+        if not isinstance(self.exchange, ccxt.Exchange):
+            # Mock exchange has no async client
+            return {symbol: self.get_historical_data(symbol, timeframe, limit) for symbol in symbols}
+        
+        exchange = await self._get_async_exchange()
+        results = await asyncio.gather(
+            *(exchange.fetch_ohlcv(symbol, timeframe, limit=limit) for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        frames = {}
+        for symbol, ohlcv in zip(symbols, results):
+            if isinstance(ohlcv, Exception):
+                logger.error(f"Error fetching data for {symbol}: {ohlcv}")
+                frames[symbol] = pd.DataFrame()
+            else:
+                frames[symbol] = self._ohlcv_to_dataframe(ohlcv)
+        return frames
+    
+    async def _get_async_exchange(self):
+        """Return the async client mirroring self.exchange, created once per event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_exchange is not None and self._async_exchange_loop is loop:
+            return self._async_exchange
+        
+        sync = self.exchange
+        exchange = getattr(ccxt_async, sync.id)({
+            'apiKey': sync.apiKey,
+            'secret': sync.secret,
+            'enableRateLimit': sync.enableRateLimit,
+            'options': copy.deepcopy(sync.options),
+        })
+        # Same endpoints as the sync client (testnet only when it is in sandbox mode)
+        exchange.urls = copy.deepcopy(sync.urls)
+        if getattr(sync, 'isSandboxModeEnabled', False):
+            exchange.isSandboxModeEnabled = True
+        
+        if sync.markets:
+            exchange.set_markets(sync.markets, sync.currencies)
+        elif not load_markets_from_cache(exchange):
+            await exchange.load_markets()
+            save_markets_to_cache(exchange)
+        
+        self._async_exchange = exchange
+        self._async_exchange_loop = loop
+        return exchange
+    
+    async def close_async_exchange(self):
+        """Close the async client used by fetch_all"""
+        if self._async_exchange is not None:
+            await self._async_exchange.close()
+        self._async_exchange = None
+        self._async_exchange_loop = None
+    
+    def analyze_symbol(self, symbol: str, df: Optional[pd.DataFrame] = None) -> Dict:
+        """Analyze a symbol and return signals, using prefetched OHLCV data when given"""
+        if df is None:
+            df = self.get_historical_data(symbol)
         if df.empty:
             return {'symbol': symbol, 'signal': None, 'price': None}
         
@@ -568,18 +633,13 @@ class TradingBot:
         df = self.strategy.populate_entry_signals(df)
         df = self.strategy.populate_exit_signals(df)
         
-        # Create a defragmented copy for better performance if needed
-        # This is only done once per analysis, not during indicator calculation
-        df = df.copy()
-        
-        # Get latest signals
-        latest = df.iloc[-1]
-        current_price = latest['close']
+        # Get latest signals (last element of each column, no row Series)
+        current_price = df['close'].to_numpy()[-1]
         
         signal = None
-        if latest['enter_long'] == 1:
+        if df['enter_long'].to_numpy()[-1] == 1:
             signal = 'buy'
-        elif latest['exit_long'] == 1:
+        elif df['exit_long'].to_numpy()[-1] == 1:
             signal = 'sell'
         
         return {
@@ -587,8 +647,8 @@ class TradingBot:
             'signal': signal,
             'price': current_price,
             'dataframe': df,
-            'rsi': latest['rsi'],
-            'ewo': latest['EWO']
+            'rsi': float(df['rsi'].to_numpy()[-1]),
+            'ewo': float(df['EWO'].to_numpy()[-1])
         }
     
     def execute_trade(self, symbol: str, side: str, analysis: Dict):
@@ -755,16 +815,16 @@ class TradingBot:
         reasons = []
         
         # EWO analysis
-        ewo = analysis.get('ewo', 0)
-        if ewo > self.config.ewo_high:
-            reasons.append(f"EWO bullish signal ({ewo:.2f} > {self.config.ewo_high})")
-        elif ewo < self.config.ewo_low:
-            reasons.append(f"EWO oversold signal ({ewo:.2f} < {self.config.ewo_low})")
+        ewo_v = analysis.get('ewo', 0)
+        if ewo_v > self.config.ewo_high:
+            reasons.append(f"EWO bullish signal ({ewo_v:.2f} > {self.config.ewo_high})")
+        elif ewo_v < self.config.ewo_low:
+            reasons.append(f"EWO oversold signal ({ewo_v:.2f} < {self.config.ewo_low})")
         
         # RSI analysis
-        rsi = analysis.get('rsi', 50)
-        if rsi < self.config.rsi_buy:
-            reasons.append(f"RSI favorable ({rsi:.1f} < {self.config.rsi_buy})")
+        rsi_v = analysis.get('rsi', 50)
+        if rsi_v < self.config.rsi_buy:
+            reasons.append(f"RSI favorable ({rsi_v:.1f} < {self.config.rsi_buy})")
         
         # Price action
         reasons.append("Price below moving average threshold (pullback opportunity)")
@@ -783,19 +843,19 @@ class TradingBot:
         """Assess current market conditions"""
         conditions = []
         
-        ewo = analysis.get('ewo', 0)
-        rsi = analysis.get('rsi', 50)
+        ewo_v = analysis.get('ewo', 0)
+        rsi_v = analysis.get('rsi', 50)
         
         # Trend assessment
-        if ewo > 0:
+        if ewo_v > 0:
             conditions.append("Bullish momentum")
         else:
             conditions.append("Bearish momentum")
         
         # Oversold/overbought
-        if rsi < 30:
+        if rsi_v < 30:
             conditions.append("Oversold conditions")
-        elif rsi > 70:
+        elif rsi_v > 70:
             conditions.append("Overbought conditions")
         else:
             conditions.append("Neutral RSI")
@@ -880,17 +940,16 @@ class TradingBot:
             if hedge_pair.status == 'hedged' and hedge_pair.long_trade and hedge_pair.short_trade:
                 current_price = self._get_current_price(hedge_pair.symbol)
                 if current_price:
-                    # Calculate P&L for both positions
-                    long_pnl = (current_price - hedge_pair.long_trade.price) * hedge_pair.long_trade.amount
-                    short_pnl = (hedge_pair.short_trade.price - current_price) * hedge_pair.short_trade.amount
+                    # Calculate P&L for both positions and ROI on total capital used
+                    long_pnl, short_pnl, roi = eval_hedge(
+                        np.array([current_price], dtype=np.float64),
+                        float(hedge_pair.long_trade.price), float(hedge_pair.long_trade.amount),
+                        float(hedge_pair.short_trade.price), float(hedge_pair.short_trade.amount)
+                    )
+                    long_pnl = float(long_pnl[0])
+                    short_pnl = float(short_pnl[0])
                     total_pnl = long_pnl + short_pnl
-                    
-                    # Calculate total investment (total capital used)
-                    total_invested = (hedge_pair.long_trade.price * hedge_pair.long_trade.amount + 
-                                    hedge_pair.short_trade.price * hedge_pair.short_trade.amount)
-                    
-                    # Calculate ROI percentage
-                    total_roi_pct = total_pnl / total_invested if total_invested > 0 else 0
+                    total_roi_pct = float(roi[0])
                     
                     # Exit condition: 1% profit (ROI >= 1%)
                     exit_threshold = 0.01  # 1% profit
@@ -1182,20 +1241,17 @@ class TradingBot:
                 current_data = self.analyze_symbol(trade.symbol)
                 current_price = current_data['price']
                 
-                # Calculate current profit percentage
-                if trade.side == 'buy':
-                    profit_pct = (current_price - trade.price) / trade.price
-                else:  # sell/short
-                    profit_pct = (trade.price - current_price) / trade.price
-                
                 # Calculate time since entry (in minutes)
                 time_diff = (datetime.now() - trade.timestamp).total_seconds() / 60
                 
-                # Check ROI table
-                roi_threshold = self._get_roi_threshold(time_diff)
+                # Profit against the ROI table
+                profit_pct, threshold, should_exit = evaluate_exit(
+                    trade.price, current_price, time_diff, trade.side != 'buy',
+                    self._roi_keys, self._roi_vals
+                )
                 
-                if profit_pct >= roi_threshold:
-                    logger.info(f"ROI exit triggered for {trade.symbol}: {profit_pct:.1%} >= {roi_threshold:.1%}")
+                if should_exit:
+                    logger.info(f"ROI exit triggered for {trade.symbol}: {profit_pct:.1%} >= {threshold:.1%}")
                     
                     # Execute actual closing order on exchange
                     try:
@@ -1218,7 +1274,7 @@ class TradingBot:
                         trade.status = 'closed'
                         trade.exit_price = current_price
                         trade.exit_timestamp = datetime.now()
-                        trade.exit_signal = f"ROI ({profit_pct:.1%} >= {roi_threshold:.1%})"
+                        trade.exit_signal = f"ROI ({profit_pct:.1%} >= {threshold:.1%})"
                         
                         price_diff = trade.exit_price - trade.price if trade.side == 'buy' else trade.price - trade.exit_price
                         trade.pnl = price_diff * trade.amount
@@ -1247,20 +1303,11 @@ class TradingBot:
     
     def _get_roi_threshold(self, time_minutes: float) -> float:
         """Get ROI threshold for given time"""
-        # Convert ROI table keys to integers and sort
-        roi_times = sorted([int(k) for k in self.config.minimal_roi.keys()])
-        
-        # Find the appropriate ROI threshold
-        for roi_time in roi_times:
-            if time_minutes >= roi_time:
-                roi_threshold = self.config.minimal_roi[str(roi_time)]
-            else:
-                break
-        else:
-            # If we've exceeded all time thresholds, use the last one
-            roi_threshold = self.config.minimal_roi[str(roi_times[-1])]
-        
-        return roi_threshold
+        return float(roi_threshold(time_minutes, self._roi_keys, self._roi_vals))
+    
+    def _get_roi_thresholds(self, time_minutes: np.ndarray) -> np.ndarray:
+        """ROI thresholds for an array of trade ages"""
+        return roi_thresholds(np.asarray(time_minutes, dtype=np.float64), self._roi_keys, self._roi_vals)
     
     def check_trailing_stop(self):
         """Check and execute trailing stop for open positions"""
@@ -1342,6 +1389,16 @@ class TradingBot:
         symbol_batch_size = 10  # Process symbols in batches to avoid overwhelming
         symbol_rotation = 0
         
+        # One event loop for the whole run, so the async exchange client is reused across batches
+        loop = asyncio.new_event_loop()
+        try:
+            self._strategy_loop(loop, symbol_batch_size, symbol_rotation)
+        finally:
+            loop.run_until_complete(self.close_async_exchange())
+            loop.close()
+    
+    def _strategy_loop(self, loop: asyncio.AbstractEventLoop, symbol_batch_size: int, symbol_rotation: int):
+        """Body of run_strategy, fetching OHLCV batches on the given event loop"""
         while self.is_running:
             try:
                 logger.info("Running strategy analysis...")
@@ -1371,10 +1428,17 @@ class TradingBot:
                 current_batch = self.config.symbols[start_idx:end_idx]
                 logger.info(f"Analyzing batch {symbol_rotation + 1}: {len(current_batch)} symbols ({start_idx}-{end_idx})")
                 
+                # Fetch the whole batch concurrently
+                try:
+                    frames = loop.run_until_complete(self.fetch_all(current_batch))
+                except Exception as e:
+                    logger.error(f"Error fetching batch data: {e}")
+                    frames = {}
+                
                 signals_found = 0
                 for symbol in current_batch:
                     try:
-                        analysis = self.analyze_symbol(symbol)
+                        analysis = self.analyze_symbol(symbol, frames.get(symbol))
                         
                         # Always cache analysis for web interface
                         self.data_cache[symbol] = analysis
@@ -1478,6 +1542,13 @@ class TradingBot:
                 self._run_async_telegram_task(send_bot_status_notification("stopped", self.balance, open_trades, total_pnl))
             except Exception as e:
                 logger.error(f"Error sending Telegram stop notification: {e}")
+        
+        # Release the Telegram HTTP clients and connection pool once the stop message is out
+        if self.telegram_enabled:
+            try:
+                shutdown_telegram()
+            except Exception as e:
+                logger.error(f"Error closing Telegram clients: {e}")
     
     def get_portfolio_summary(self) -> Dict:
         """Get portfolio summary"""
@@ -1497,8 +1568,24 @@ class TradingBot:
             'total_trades': len(self.trades)
         }
     
+    def _cache_leverage(self, symbol: str, leverage: float):
+        """Remember a symbol's leverage for LEVERAGE_CACHE_TTL seconds"""
+        self._leverage_cache[symbol] = (leverage, time.monotonic() + LEVERAGE_CACHE_TTL)
+    
     def get_position_leverage(self, symbol: str) -> Optional[float]:
-        """Get the actual leverage setting for a symbol from the exchange"""
+        """Get the actual leverage setting for a symbol, re-querying the exchange once the cached value expires"""
+        cached = self._leverage_cache.get(symbol)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        leverage = self._fetch_position_leverage(symbol)
+        if leverage is None:
+            return float(self.config.leverage)  # Fallback to config value, retry next time
+        self._cache_leverage(symbol, leverage)
+        return leverage
+    
+    def _fetch_position_leverage(self, symbol: str) -> Optional[float]:
+        """Get the actual leverage setting for a symbol from the exchange (None on error)"""
         try:
             positions = self.exchange.fetch_positions([symbol])
             for position in positions:
@@ -1533,7 +1620,7 @@ class TradingBot:
             
         except Exception as e:
             logger.error(f"Error getting leverage for {symbol}: {e}")
-            return float(self.config.leverage)  # Fallback to config value
+            return None
 
     def get_trade_leverage(self, trade: Trade) -> float:
         """Get the actual leverage used for a specific trade"""
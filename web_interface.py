@@ -5,6 +5,7 @@ Flask-based web dashboard to monitor trades, view charts, and control the bot
 """
 
 from flask import Flask, render_template, jsonify, request, session, redirect, url_for, flash
+from flask.json.provider import DefaultJSONProvider
 import plotly.graph_objs as go
 import plotly.utils
 import json
@@ -20,6 +21,12 @@ from functools import wraps
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# orjson is optional; Flask's stdlib JSON provider is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load configuration for authentication
 try:
     import config
@@ -37,6 +44,28 @@ app = Flask(__name__)
 app.secret_key = SECRET_KEY
 app.permanent_session_lifetime = timedelta(seconds=SESSION_TIMEOUT)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Pretty-printing (indent/separators) is left to the stdlib encoder
+        if kwargs.keys() - {'default'}:
+            return super().dumps(obj, **kwargs)
+        
+        # Dates go through Flask's default so they keep the HTTP date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Authentication decorator
 def login_required(f):
     @wraps(f)
@@ -64,6 +93,13 @@ bot_thread = None
 
 def create_candlestick_chart(symbol_data, signals_df=None):
     """Create candlestick chart using Freqtrade-style plotting mechanism"""
+    fig = build_candlestick_figure(symbol_data)
+    if fig is None:
+        return json.dumps({'error': 'Missing OHLCV data'}, cls=plotly.utils.PlotlyJSONEncoder)
+    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+
+def build_candlestick_figure(symbol_data):
+    """Freqtrade-style candlestick Figure (None when OHLCV columns are missing)"""
     df = symbol_data['dataframe']
     
     # Freqtrade-style chart creation
@@ -83,7 +119,7 @@ def create_candlestick_chart(symbol_data, signals_df=None):
     # Ensure we have the required OHLCV columns
     required_cols = ['open', 'high', 'low', 'close', 'volume']
     if not all(col in df.columns for col in required_cols):
-        return json.dumps({'error': 'Missing OHLCV data'}, cls=plotly.utils.PlotlyJSONEncoder)
+        return None
     
     # Create candlestick trace - Freqtrade style
     candlestick = go.Candlestick(
@@ -202,60 +238,7 @@ def create_candlestick_chart(symbol_data, signals_df=None):
         row=2, col=1
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
-    
-    # Update layout with enhanced styling
-    fig.update_layout(
-        title=dict(
-            text=f'{symbol_data["symbol"]} - Candlestick Chart with Trading Signals',
-            x=0.5,
-            font=dict(size=16, color='#333333')
-        ),
-        template='plotly_white',
-        height=700,
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        margin=dict(l=50, r=50, t=80, b=50),
-        hovermode='x unified'
-    )
-    
-    # Update x-axis
-    fig.update_xaxes(
-        title_text="Time",
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='#f0f0f0',
-        row=2, col=1
-    )
-    
-    # Update y-axis for price
-    fig.update_yaxes(
-        title_text="Price (USDT)",
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='#f0f0f0',
-        row=1, col=1
-    )
-    
-    # Update y-axis for volume
-    fig.update_yaxes(
-        title_text="Volume",
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='#f0f0f0',
-        row=2, col=1
-    )
-    
-    # Remove range slider for cleaner look
-    fig.update_layout(xaxis_rangeslider_visible=False)
-    
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return fig
 
 def create_indicator_chart(symbol_data):
     """Create enhanced indicator charts (RSI, EWO) with better styling"""
@@ -508,6 +491,11 @@ def create_pnl_chart():
     fig = go.Figure(data=[baseline, trace, trade_markers], layout=layout)
     return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
 
+@app.route('/healthz')
+def healthz():
+    """Liveness probe (no auth, no body)"""
+    return '', 204
+
 # Authentication routes
 @app.route('/login', methods=['GET', 'POST'])
 def login():